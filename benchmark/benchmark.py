@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+Benchmark comparativo: strings vs JSON vs Protocol Buffers
+
+Roda a mesma mistura de operações pelos três clientes e mede, por operação
+e tamanho de carga:
+- bytes na rede (requisição e resposta, com enquadramento)
+- tempo de CPU para montar/codificar a requisição e decodificar/interpretar a resposta
+  (strings e JSON também sem os modelos pré-codificados, em codificar_sem_modelos_us)
+- RTT p50/p90/p99 e os tempos por fase (serializar, enviar, esperar, receber, desserializar)
+
+Com --perfis, compara também perfis de socket (comum/perfil_socket.py): tempo
+de conexão, RTT de echo pequeno e grande e uma rajada em pipeline, que é onde
+Nagle e ACK atrasado aparecem.
+
+Sem --host sobe o servidor local de referência numa thread. A saída é JSON,
+para comparar execuções e acompanhar regressões.
+
+    python benchmark.py --iteracoes 500 --saida resultado.json
+    python benchmark.py --protocolos json --perfis sistema,sem_nodelay,padrao,buffers_4k
+"""
+
+import argparse
+import contextlib
+import functools
+import json
+import os
+import platform
+import random
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from comum import RAIZ, registrar_clientes
+from comum.codec_json import obter_codec
+from comum.metricas import FASES, resumo
+from comum.perfil_socket import PERFIS, opcoes_efetivas
+
+registrar_clientes()
+sys.path.insert(0, os.path.join(RAIZ, 'servidor-local'))
+from cliente_json import ClienteJSON
+from cliente_protobuf import ClienteProtobuf
+from cliente_strings import ClienteStrings
+from servidor_local import PORTAS, ServidorLocal
+
+CLIENTES = {
+    'strings': ClienteStrings,
+    'json': ClienteJSON,
+    'json_stdlib': functools.partial(ClienteJSON, codec_json='json'),
+    'protobuf': ClienteProtobuf,
+    'protobuf_tipado': functools.partial(ClienteProtobuf, tipado=True),
+}
+
+# Variantes de cliente que falam com o servidor de outro protocolo
+SERVIDOR_DE = {'protobuf_tipado': 'protobuf', 'json_stdlib': 'json'}
+
+# (operação, tamanho da carga): caracteres no echo, números na soma, limite no histórico
+CENARIOS = [
+    ('echo', 16),
+    ('echo', 1024),
+    ('echo', 16384),
+    ('soma', 10),
+    ('soma', 1000),
+    ('timestamp', 0),
+    ('status', 0),
+    ('status_detalhado', 0),
+    ('historico', 10),
+]
+
+
+def chamada(cliente, operacao, tamanho, aleatorio):
+    """Função sem argumentos que executa o cenário no cliente"""
+    if operacao == 'echo':
+        mensagem = ''.join(aleatorio.choice('abcdefghijklmnopqrstuvwxyz ') for _ in range(tamanho))
+        return lambda: cliente.echo(mensagem)
+    if operacao == 'soma':
+        numeros = [round(aleatorio.uniform(-1000, 1000), 3) for _ in range(tamanho)]
+        return lambda: cliente.soma(numeros)
+    if operacao == 'timestamp':
+        return cliente.timestamp
+    if operacao == 'status':
+        return cliente.status
+    if operacao == 'status_detalhado':
+        return lambda: cliente.status(detalhado=True)
+    if operacao == 'historico':
+        return lambda: cliente.historico(limite=tamanho)
+    raise ValueError(f"Cenário desconhecido: {operacao}")
+
+
+class SocketContador:
+    """Envolve o socket do cliente contando os bytes trocados"""
+
+    def __init__(self, sock):
+        self.sock = sock
+        self.enviados = 0
+        self.recebidos = bytearray()
+
+    def sendall(self, dados):
+        self.enviados += len(dados)
+        return self.sock.sendall(dados)
+
+    def recv_into(self, janela):
+        n = self.sock.recv_into(janela)
+        self.recebidos += janela[:n]
+        return n
+
+    def zerar(self):
+        self.enviados = 0
+        self.recebidos = bytearray()
+
+    def __getattr__(self, nome):
+        return getattr(self.sock, nome)
+
+
+class Captura:
+    """Faz o papel de pipeline só para capturar a mensagem montada, sem enviar"""
+
+    def submeter(self, mensagem, medicao=None):
+        return mensagem
+
+
+def mensagem_de(cliente, executar):
+    """Mensagem que o cliente enviaria para o cenário"""
+    cliente.pipeline_ativo = Captura()
+    try:
+        return executar()
+    finally:
+        cliente.pipeline_ativo = None
+
+
+def cronometrar(funcao, repeticoes):
+    """Tempo médio de CPU de uma chamada, em microssegundos"""
+    inicio = time.process_time()
+    for _ in range(repeticoes):
+        funcao()
+    return (time.process_time() - inicio) / repeticoes * 1e6
+
+
+def medir(protocolo, host, porta, aluno_id, iteracoes, aquecimento, repeticoes_cpu, semente):
+    cliente = CLIENTES[protocolo](host, porta)
+    cliente.conectar()
+    contador = SocketContador(cliente.socket)
+    cliente.socket = cliente.leitor.socket = contador
+    resultados = []
+    try:
+        if not cliente.autenticar(aluno_id):
+            raise RuntimeError(f"Falha na autenticação ({protocolo})")
+        for operacao, tamanho in CENARIOS:
+            executar = chamada(cliente, operacao, tamanho, random.Random(semente))
+
+            for _ in range(aquecimento):
+                executar()
+
+            cliente.metricas.zerar()
+            rtts = []
+            for _ in range(iteracoes):
+                contador.zerar()
+                inicio = time.perf_counter()
+                resultado = executar()
+                rtts.append(time.perf_counter() - inicio)
+            if resultado is None:
+                raise RuntimeError(f"{protocolo}/{operacao} falhou")
+            bytes_requisicao = contador.enviados
+            bytes_resposta = len(contador.recebidos)
+
+            # Custo de CPU isolado da rede: monta + codifica / decodifica + interpreta
+            decodificador = cliente.leitor.decodificador.__class__()
+            decodificador.buffer.alimentar(contador.recebidos)
+            quadro = bytes(decodificador.extrair())
+            codificar = lambda: cliente.codificar(mensagem_de(cliente, executar))
+            sem_modelos = None
+            if hasattr(cliente.codec, 'usar_modelos'):
+                # Mesmo custo montando a requisição inteira a cada chamada
+                cliente.codec.usar_modelos = False
+                sem_modelos = cronometrar(codificar, repeticoes_cpu)
+                cliente.codec.usar_modelos = True
+            decodificar = lambda: cliente.interpretar_operacao(cliente.decodificar(quadro))
+
+            resultados.append({
+                'protocolo': protocolo,
+                'operacao': operacao,
+                'tamanho': tamanho,
+                'bytes_requisicao': bytes_requisicao,
+                'bytes_resposta': bytes_resposta,
+                'codificar_us': cronometrar(codificar, repeticoes_cpu),
+                'codificar_sem_modelos_us': sem_modelos,
+                'decodificar_us': cronometrar(decodificar, repeticoes_cpu),
+                'rtt_ms': resumo(rtts, 1000),
+                'fases_us': {fase: cliente.metricas.histograma(fase).resumo() for fase in FASES},
+                'amostras': iteracoes,
+            })
+        cliente.logout()
+    finally:
+        cliente.desconectar()
+    return resultados
+
+
+# Cenários da comparação de perfis: (nome, caracteres do echo, echos por chamada)
+CENARIOS_PERFIL = [
+    ('echo_16', 16, 1),
+    ('echo_16384', 16384, 1),
+    ('rajada_32x16', 16, 32),
+]
+
+
+def medir_perfis(protocolo, host, porta, aluno_id, perfis, iteracoes, aquecimento):
+    """Tempo de conexão e RTTs do mesmo cliente com cada perfil de socket"""
+    resultados = []
+    for perfil in perfis:
+        conexoes = []
+        for _ in range(max(1, iteracoes // 10)):
+            cliente = CLIENTES[protocolo](host, porta, perfil=perfil)
+            inicio = time.perf_counter()
+            cliente.conectar()
+            conexoes.append(time.perf_counter() - inicio)
+            cliente.desconectar()
+
+        cliente = CLIENTES[protocolo](host, porta, perfil=perfil)
+        cliente.conectar()
+        try:
+            if not cliente.autenticar(aluno_id):
+                raise RuntimeError(f"Falha na autenticação ({protocolo}/{perfil})")
+            cenarios = {}
+            for nome, tamanho, rajada in CENARIOS_PERFIL:
+                mensagem = 'x' * tamanho
+
+                def executar():
+                    if rajada == 1:
+                        return cliente.echo(mensagem)
+                    # Escritas pequenas seguidas, sem esperar resposta
+                    with cliente.pipeline(rajada):
+                        pendentes = [cliente.echo(mensagem) for _ in range(rajada)]
+                    return [p.resultado() for p in pendentes]
+
+                for _ in range(aquecimento):
+                    executar()
+                rtts = []
+                for _ in range(iteracoes):
+                    inicio = time.perf_counter()
+                    executar()
+                    rtts.append(time.perf_counter() - inicio)
+                cenarios[nome] = resumo(rtts, 1000)
+            resultados.append({
+                'protocolo': protocolo,
+                'perfil': perfil,
+                'opcoes': opcoes_efetivas(cliente.socket),
+                'conectar_ms': resumo(conexoes, 1000),
+                'rtt_ms': cenarios,
+            })
+            cliente.logout()
+        finally:
+            cliente.desconectar()
+    return resultados
+
+
+def main():
+    """Função principal"""
+    parser = argparse.ArgumentParser(description="Benchmark strings vs JSON vs Protocol Buffers")
+    parser.add_argument('--host', help="servidor externo (padrão: sobe o servidor local)")
+    parser.add_argument('--aluno-id', default='554576')
+    parser.add_argument('--protocolos', default='strings,json,protobuf,protobuf_tipado')
+    parser.add_argument('--iteracoes', type=int, default=200)
+    parser.add_argument('--aquecimento', type=int, default=20)
+    parser.add_argument('--repeticoes-cpu', type=int, default=2000)
+    parser.add_argument('--atraso', type=float, default=0.0, help="latência do servidor local, em ms")
+    parser.add_argument('--semente', type=int, default=42)
+    parser.add_argument('--saida', help="arquivo JSON de saída (padrão: stdout)")
+    parser.add_argument('--perfis', default='',
+                        help=f"compara perfis de socket ({', '.join(PERFIS)}), separados por vírgula")
+    args = parser.parse_args()
+
+    protocolos = [p.strip() for p in args.protocolos.split(',') if p.strip()]
+    perfis = [p.strip() for p in args.perfis.split(',') if p.strip()]
+    for perfil in perfis:
+        if perfil not in PERFIS:
+            parser.error(f"perfil desconhecido: {perfil} (disponíveis: {', '.join(PERFIS)})")
+    servidor = None
+    if args.host:
+        host, portas = args.host, PORTAS
+    else:
+        servidor = ServidorLocal(portas={SERVIDOR_DE.get(p, p): 0 for p in protocolos}, atraso=args.atraso / 1000)
+        servidor.iniciar_em_thread()
+        host, portas = servidor.host, servidor.portas
+
+    relatorio = {
+        'ambiente': {
+            'data': datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'plataforma': platform.platform(),
+            'host': host,
+            'servidor_local': servidor is not None,
+            'atraso_ms': args.atraso if servidor else None,
+            'iteracoes': args.iteracoes,
+            'codec_json': obter_codec().nome,
+        },
+        'resultados': [],
+        'perfis': [],
+    }
+    try:
+        # Os clientes imprimem mensagens de conexão; o JSON fica sozinho no stdout
+        with contextlib.redirect_stdout(sys.stderr):
+            for protocolo in protocolos:
+                relatorio['resultados'] += medir(
+                    protocolo, host, portas[SERVIDOR_DE.get(protocolo, protocolo)], args.aluno_id, args.iteracoes,
+                    args.aquecimento, args.repeticoes_cpu, args.semente)
+                if perfis:
+                    relatorio['perfis'] += medir_perfis(
+                        protocolo, host, portas[SERVIDOR_DE.get(protocolo, protocolo)], args.aluno_id,
+                        perfis, args.iteracoes, args.aquecimento)
+    finally:
+        if servidor:
+            servidor.parar_thread()
+
+    saida = json.dumps(relatorio, indent=2, ensure_ascii=False)
+    if args.saida:
+        with open(args.saida, 'w', encoding='utf-8') as arquivo:
+            arquivo.write(saida + '\n')
+    else:
+        print(saida)
+
+
+if __name__ == "__main__":
+    main()
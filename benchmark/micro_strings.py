@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark do protocolo de strings: parser e literais aninhados
+
+Compara o parsear original (strip + split + split('=', 1)) com
+comum.texto.analisar, e ast.literal_eval com comum.texto.literal, sobre
+respostas típicas do servidor local. Só CPU, sem rede. O parser continua
+no split do CPython (sem escape, o ganho é nenhum); a amostra escapada mede o
+custo dos escapes combinados no AUTH.
+
+    python micro_strings.py --repeticoes 20000
+"""
+
+import argparse
+import ast
+import json
+import os
+import sys
+import timeit
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from comum.texto import analisar, literal, montar
+
+
+def parsear_original(resposta):
+    """parsear original do ClienteStrings"""
+    if resposta.endswith('|FIM'):
+        resposta = resposta[:-4]
+    resultado = {}
+    partes = resposta.split('|')
+    if partes:
+        resultado['tipo'] = partes[0]
+    for parte in partes[1:]:
+        if '=' in parte:
+            chave, valor = parte.split('=', 1)
+            resultado[chave] = valor
+    return resultado
+
+
+def operacoes(n):
+    return [{'operacao': 'echo', 'parametros': {'mensagem': f'mensagem {i}'},
+             'timestamp': datetime(2025, 11, 12, 14, 22, i % 60).isoformat(), 'sucesso': i % 7 != 0}
+            for i in range(n)]
+
+
+def amostras():
+    """(nome, linha do protocolo, escapes) e (nome, literal aninhado)"""
+    estatisticas = {'total_operacoes': 120, 'operacoes_sucesso': 118, 'operacoes_erro': 2, 'taxa_sucesso': 98.33}
+    sessoes = {str(554000 + i): {'nome': f'ALUNO {i}', 'ip_cliente': f'10.0.0.{i}'} for i in range(50)}
+    linhas = [
+        ('echo', montar('OK', {'mensagem_original': 'ola mundo', 'mensagem_eco': 'ola mundo',
+                               'hash_md5': 'c0e8cdd5b7d5fb0fd1e8b5b2c7a6e0d1', 'tamanho_mensagem': 9,
+                               'timestamp_servidor': '2025-11-12T14:22:00.123456'}), False),
+        ('echo_barra', montar('OK', {'mensagem_original': 'C:\\temp\\new', 'mensagem_eco': 'C:\\temp\\new',
+                                     'hash_md5': '0f6f5ad8d4c0b8b1f7a2e0d1c3b4a5f6'}), False),
+        ('echo_escapado', montar('OK', {'mensagem_original': 'a|b|c=d', 'mensagem_eco': 'a|b|c=d',
+                                        'hash_md5': '0f6f5ad8d4c0b8b1f7a2e0d1c3b4a5f6'}, escapes=True), True),
+        ('historico_10', montar('OK', {'aluno_id': '554576', 'operacoes': operacoes(10),
+                                       'estatisticas': estatisticas}), False),
+    ]
+    literais = [
+        ('estatisticas', repr(estatisticas)),
+        ('sessoes_detalhes_50', repr(sessoes)),
+        ('operacoes_10', repr(operacoes(10))),
+        ('operacoes_100', repr(operacoes(100))),
+    ]
+    return linhas, literais
+
+
+def medir(funcao, argumento, repeticoes):
+    """Melhor de 5 rodadas, em microssegundos por chamada"""
+    tempos = timeit.repeat(lambda: funcao(argumento), number=repeticoes, repeat=5)
+    return min(tempos) / repeticoes * 1e6
+
+
+def main():
+    """Função principal"""
+    parser = argparse.ArgumentParser(description="Micro-benchmark do parser do protocolo de strings")
+    parser.add_argument('--repeticoes', type=int, default=5000)
+    parser.add_argument('--saida', help="grava os resultados em JSON")
+    args = parser.parse_args()
+
+    linhas, literais = amostras()
+    resultados = []
+    for nome, linha, escapes in linhas:
+        if escapes:
+            assert analisar(linha, escapes=True)['mensagem_eco'] == 'a|b|c=d'
+        else:
+            assert analisar(linha) == parsear_original(linha)
+        resultados.append(('parser', nome, medir(parsear_original, linha, args.repeticoes),
+                           medir(lambda texto: analisar(texto, escapes), linha, args.repeticoes)))
+    for nome, texto in literais:
+        assert literal(texto) == ast.literal_eval(texto)
+        repeticoes = max(1, args.repeticoes // 10)
+        resultados.append(('literal', nome, medir(ast.literal_eval, texto, repeticoes),
+                           medir(literal, texto, repeticoes)))
+
+    print(f"{'':<8} {'amostra':<22} {'antes (µs)':>11} {'agora (µs)':>11} {'ganho':>7}")
+    for tipo, nome, antes, agora in resultados:
+        print(f"{tipo:<8} {nome:<22} {antes:>11.2f} {agora:>11.2f} {antes / agora:>6.1f}x")
+
+    if args.saida:
+        with open(args.saida, 'w', encoding='utf-8') as arquivo:
+            json.dump([{'tipo': t, 'amostra': n, 'antes_us': a, 'agora_us': b}
+                       for t, n, a, b in resultados], arquivo, indent=2, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+Capturas de tráfego: resumo, decodificação offline e reprodução
+
+- resumo: protocolo, conexões, mensagens e bytes de uma captura;
+- decodificar: passa as respostas capturadas pelo enquadramento e pelo
+  codec do protocolo (e pelo parser, no de strings), sem rede, para comparar
+  mudanças no parser/codec contra tráfego real;
+- reproduzir: reenvia as requisições de cada conexão ao servidor (por
+  padrão o local), no ritmo original ou acelerado (--velocidade 10; 0 para
+  o mais rápido possível). Os tokens capturados são trocados pelos que o
+  servidor emitir na reprodução.
+
+    python lote/executar_lote.py ops.jsonl --captura ops.cap.gz
+    python reproducao.py resumo ops.cap.gz
+    python reproducao.py decodificar ops.cap.gz --repeticoes 20
+    python reproducao.py reproduzir ops.cap.gz --velocidade 0
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import statistics
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from comum import RAIZ, registrar_clientes
+from comum.captura import ENVIO, RECEBIMENTO, LeitorCaptura
+from comum.metricas import Histograma
+
+registrar_clientes()
+sys.path.insert(0, os.path.join(RAIZ, 'servidor-local'))
+from cliente_json import CodecJSON
+from cliente_protobuf import CodecProtobuf
+from cliente_strings import CodecStrings
+from servidor_local import PORTAS, ServidorLocal
+
+CODECS = {
+    'strings': CodecStrings,
+    'json': CodecJSON,
+    'protobuf': CodecProtobuf,
+}
+
+
+def criar_codec(protocolo, args):
+    if protocolo == 'json':
+        return CodecJSON(args.codec_json)
+    return CODECS[protocolo]()
+
+
+def corpos(codec, blocos):
+    """Corpos (sem enquadramento) das mensagens contidas numa sequência de blocos"""
+    decodificador = codec.Decodificador()
+    for bloco in blocos:
+        decodificador.buffer.alimentar(bloco)
+        while (corpo := decodificador.extrair()) is not None:
+            yield bytes(corpo)
+
+
+def interpretar_auth(codec, corpo):
+    """Token de uma resposta de autenticação, ou None (sem as mensagens do cliente)"""
+    with open(os.devnull, 'w') as nulo, contextlib.redirect_stdout(nulo):
+        try:
+            return codec.interpretar_auth(codec.decodificar(corpo)) or None
+        except Exception:  # resposta de outra operação
+            return None
+
+
+def contar_erros(codec, corpos):
+    """Respostas de erro do servidor (as que preenchem codec.ultimo_erro)"""
+    erros = 0
+    with open(os.devnull, 'w') as nulo, contextlib.redirect_stdout(nulo):
+        for corpo in corpos:
+            codec.ultimo_erro = None
+            codec.interpretar_operacao(codec.decodificar(corpo))
+            erros += codec.ultimo_erro is not None
+    codec.ultimo_erro = None
+    return erros
+
+
+# Resumo
+
+def resumo(captura):
+    conexoes = set()
+    contagem = {ENVIO: 0, RECEBIMENTO: 0}
+    volume = {ENVIO: 0, RECEBIMENTO: 0}
+    ultimo = 0.0
+    for registro in captura:
+        conexoes.add(registro.conexao)
+        contagem[registro.direcao] += 1
+        volume[registro.direcao] += len(registro.dados)
+        ultimo = registro.instante
+    return {
+        'protocolo': captura.protocolo,
+        'inicio': datetime.fromtimestamp(captura.inicio).isoformat(),
+        'duracao_s': ultimo,
+        'conexoes': len(conexoes),
+        'envios': contagem[ENVIO],
+        'recebimentos': contagem[RECEBIMENTO],
+        'bytes_enviados': volume[ENVIO],
+        'bytes_recebidos': volume[RECEBIMENTO],
+        'tamanho_arquivo': os.path.getsize(captura.caminho),
+    }
+
+
+# Decodificação offline
+
+def decodificar(captura, codec, repeticoes):
+    """Melhor e mediana das rodadas: só enquadramento e enquadramento + codec"""
+    blocos = [r.dados for r in captura if r.direcao == RECEBIMENTO]
+    analisar = getattr(codec, 'parsear', None)  # strings: o parser faz parte da decodificação
+
+    def so_enquadramento():
+        decodificador = codec.Decodificador()
+        n = 0
+        for bloco in blocos:
+            decodificador.buffer.alimentar(bloco)
+            while decodificador.extrair() is not None:
+                n += 1
+        return n
+
+    def completo():
+        decodificador = codec.Decodificador()
+        n = 0
+        for bloco in blocos:
+            decodificador.buffer.alimentar(bloco)
+            while (corpo := decodificador.extrair()) is not None:
+                resposta = codec.decodificar(corpo)
+                if analisar:
+                    analisar(resposta)
+                n += 1
+        return n
+
+    resultado = {'mensagens': so_enquadramento(), 'bytes': sum(len(b) for b in blocos)}
+    for nome, funcao in (('enquadramento', so_enquadramento), ('completo', completo)):
+        tempos = []
+        for _ in range(repeticoes):
+            inicio = time.perf_counter()
+            funcao()
+            tempos.append(time.perf_counter() - inicio)
+        melhor = min(tempos)
+        resultado[nome] = {
+            'melhor_ms': melhor * 1000,
+            'mediana_ms': statistics.median(tempos) * 1000,
+            'us_por_mensagem': melhor / resultado['mensagens'] * 1e6 if resultado['mensagens'] else 0.0,
+            'mb_s': resultado['bytes'] / melhor / 1e6 if melhor else 0.0,
+        }
+    return resultado
+
+
+# Reprodução
+
+class Reproducao:
+    """Reenvia as requisições de uma conexão capturada e mede cada resposta"""
+
+    def __init__(self, codec, registros, velocidade, latencias):
+        self.codec = codec
+        self.velocidade = velocidade
+        self.latencias = latencias
+        self.inicio_captura = registros[0].instante
+        # Mensagens enviadas com o instante (um envio pode levar várias)
+        self.enviadas = [(registro.instante, codec.Decodificador.enquadrar(corpo))
+                         for registro in registros if registro.direcao == ENVIO
+                         for corpo in corpos(codec, [registro.dados])]
+        capturadas = list(corpos(codec, [r.dados for r in registros if r.direcao == RECEBIMENTO]))
+        self.respostas_capturadas = len(capturadas)
+        self.erros_capturados = contar_erros(codec, capturadas)
+        # Índice da resposta de autenticação -> token capturado
+        self.tokens = {}
+        for i, corpo in enumerate(capturadas):
+            token = interpretar_auth(codec, corpo)
+            if token:
+                self.tokens[i] = token
+        self.indice_auth = {token: i for i, token in self.tokens.items()}
+        self.autenticadas = {i: asyncio.Event() for i in self.tokens}
+        self.trocas = {}  # token capturado -> token da reprodução
+        self.envios = []
+        self.respostas = 0
+        self.recebidas = []  # corpos, conferidos só depois da medição
+
+    async def rodar(self, host, porta, inicio):
+        await self._esperar(inicio, self.inicio_captura)
+        leitor, escritor = await asyncio.open_connection(host, porta)
+        recepcao = asyncio.ensure_future(self._receber(leitor))
+        try:
+            for instante, quadro in self.enviadas:
+                await self._esperar(inicio, instante)
+                quadro = await self._com_token_novo(quadro)
+                self.envios.append(time.perf_counter())
+                escritor.write(quadro)
+            await recepcao
+        finally:
+            recepcao.cancel()
+            escritor.close()
+
+    async def _esperar(self, inicio, instante):
+        if self.velocidade:
+            espera = inicio + instante / self.velocidade - time.monotonic()
+            if espera > 0:
+                await asyncio.sleep(espera)
+
+    async def _com_token_novo(self, quadro):
+        for antigo, indice in self.indice_auth.items():
+            if antigo.encode('utf-8') in quadro:
+                await self.autenticadas[indice].wait()
+                if antigo in self.trocas:
+                    quadro = self.codec.trocar_token(quadro, antigo, self.trocas[antigo])
+        return quadro
+
+    async def _receber(self, leitor):
+        decodificador = self.codec.Decodificador()
+        while self.respostas < len(self.enviadas):
+            dados = await leitor.read(65536)
+            if not dados:
+                break
+            decodificador.buffer.alimentar(dados)
+            while (corpo := decodificador.extrair()) is not None:
+                self.latencias.registrar((time.perf_counter() - self.envios[self.respostas]) * 1e6)
+                self.recebidas.append(bytes(corpo))
+                if self.respostas in self.tokens:
+                    novo = interpretar_auth(self.codec, corpo)
+                    if novo:
+                        self.trocas[self.tokens[self.respostas]] = novo
+                    self.autenticadas[self.respostas].set()
+                self.respostas += 1
+        # Sem mais respostas: ninguém fica esperando autenticação
+        for evento in self.autenticadas.values():
+            evento.set()
+
+
+async def reproduzir(captura, codec, host, porta, velocidade):
+    latencias = Histograma()
+    reproducoes = [Reproducao(codec, registros, velocidade, latencias)
+                   for registros in captura.por_conexao().values()]
+    inicio = time.monotonic()
+    erros = await asyncio.gather(*(r.rodar(host, porta, inicio) for r in reproducoes),
+                                 return_exceptions=True)
+    duracao = time.monotonic() - inicio
+    enviadas = sum(len(r.enviadas) for r in reproducoes)
+    return {
+        'velocidade': velocidade,
+        'duracao_s': duracao,
+        'conexoes': len(reproducoes),
+        'conexoes_com_erro': sum(1 for e in erros if e is not None),
+        'enviadas': enviadas,
+        'respostas': sum(r.respostas for r in reproducoes),
+        'respostas_capturadas': sum(r.respostas_capturadas for r in reproducoes),
+        'erros': sum(contar_erros(codec, r.recebidas) for r in reproducoes),
+        'erros_capturados': sum(r.erros_capturados for r in reproducoes),
+        'tokens_trocados': sum(len(r.trocas) for r in reproducoes),
+        'vazao_ops': enviadas / duracao if duracao else 0.0,
+        'latencia_us': latencias.resumo(),
+    }
+
+
+def imprimir(comando, resultado):
+    print(f"\n{'='*60}")
+    if comando == 'resumo':
+        for chave, valor in resultado.items():
+            print(f"  {chave:<16} {valor:.3f}" if isinstance(valor, float) else f"  {chave:<16} {valor}")
+    elif comando == 'decodificar':
+        print(f"  {resultado['mensagens']} mensagens, {resultado['bytes']} bytes")
+        for etapa in ('enquadramento', 'completo'):
+            r = resultado[etapa]
+            print(f"  {etapa:<14} melhor={r['melhor_ms']:.2f} ms  mediana={r['mediana_ms']:.2f} ms  "
+                  f"{r['us_por_mensagem']:.2f} µs/msg  {r['mb_s']:.1f} MB/s")
+    else:
+        lat = resultado['latencia_us']
+        print(f"  {resultado['conexoes']} conexões ({resultado['conexoes_com_erro']} com erro), "
+              f"velocidade {resultado['velocidade'] or 'máxima'}")
+        print(f"  enviadas={resultado['enviadas']}  respostas={resultado['respostas']} "
+              f"(capturadas {resultado['respostas_capturadas']})  tokens trocados={resultado['tokens_trocados']}")
+        print(f"  respostas com erro={resultado['erros']} (capturadas {resultado['erros_capturados']})")
+        print(f"  duração {resultado['duracao_s']:.2f} s  vazão {resultado['vazao_ops']:.0f} ops/s")
+        if lat.get('contagem'):
+            print(f"  latência (ms): p50={lat['p50']/1000:.2f}  p99={lat['p99']/1000:.2f}  máx={lat['max']/1000:.2f}")
+    print('='*60)
+
+
+def main():
+    """Função principal"""
+    parser = argparse.ArgumentParser(description="Resumo, decodificação offline e reprodução de capturas")
+    parser.add_argument('comando', choices=('resumo', 'decodificar', 'reproduzir'))
+    parser.add_argument('captura', help="arquivo gravado por comum.captura.Gravador")
+    parser.add_argument('--repeticoes', type=int, default=10, help="rodadas da decodificação offline")
+    parser.add_argument('--codec-json', help="json ou orjson (padrão: o mais rápido instalado)")
+    parser.add_argument('--velocidade', type=float, default=1.0,
+                        help="1 = ritmo original, 10 = dez vezes mais rápido, 0 = sem esperas")
+    parser.add_argument('--host', help="servidor (padrão: sobe o servidor local)")
+    parser.add_argument('--porta', type=int, help="porta do servidor (padrão: a do protocolo)")
+    parser.add_argument('--saida', help="grava os resultados em JSON")
+    args = parser.parse_args()
+
+    captura = LeitorCaptura(args.captura)
+    if captura.protocolo not in CODECS:
+        parser.error(f"Protocolo desconhecido na captura: {captura.protocolo}")
+    codec = criar_codec(captura.protocolo, args)
+
+    if args.comando == 'resumo':
+        resultado = resumo(captura)
+    elif args.comando == 'decodificar':
+        resultado = decodificar(captura, codec, args.repeticoes)
+    else:
+        servidor = None
+        if not args.host:
+            servidor = ServidorLocal(portas={captura.protocolo: 0}).iniciar_em_thread()
+        host = args.host or servidor.host
+        porta = args.porta or (servidor.portas if servidor else PORTAS)[captura.protocolo]
+        try:
+            resultado = asyncio.run(reproduzir(captura, codec, host, porta, args.velocidade))
+        finally:
+            if servidor:
+                servidor.parar_thread()
+    resultado = {'captura': args.captura, **resultado}
+    imprimir(args.comando, resultado)
+
+    if args.saida:
+        with open(args.saida, 'w', encoding='utf-8') as arquivo:
+            json.dump(resultado, arquivo, indent=2, ensure_ascii=False)
+        print(f"\nResultados gravados em {args.saida}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Failover e balanceamento entre réplicas locais
+
+Sobe várias réplicas do servidor local (cada uma com seu próprio estado,
+como servidores independentes) e mede, com um cliente síncrono:
+
+- failover: operações seguidas enquanto a réplica em uso é derrubada; o
+  tempo conta do instante da queda até a primeira resposta certa de outra
+  réplica (inclui detectar a queda, reconectar e autenticar de novo);
+- réplica travada: a primeira da lista aceita o SYN e nunca completa o
+  handshake (fila de accept cheia); o happy eyeballs segue para a próxima;
+- balanceamento: sessões abertas com um Balanceador compartilhado entre
+  réplicas com latências diferentes (--atrasos).
+
+    python failover.py --protocolo json --replicas 3 --atrasos 1,2,4
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import socket
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from comum import RAIZ, registrar_clientes
+from comum.endpoints import Balanceador, rotulo
+from comum.reconexao import ClienteReconectavel
+
+registrar_clientes()
+sys.path.insert(0, os.path.join(RAIZ, 'servidor-local'))
+from cliente_json import ClienteJSON
+from cliente_protobuf import ClienteProtobuf
+from cliente_strings import ClienteStrings
+from servidor_local import ServidorLocal
+
+CLIENTES = {
+    'strings': ClienteStrings,
+    'json': ClienteJSON,
+    'protobuf': ClienteProtobuf,
+}
+
+
+def subir_replicas(protocolo, quantidade, atrasos=()):
+    """Réplicas em threads próprias, cada uma numa porta livre"""
+    replicas = []
+    for i in range(quantidade):
+        atraso = atrasos[i] if i < len(atrasos) else 0.0
+        replicas.append(ServidorLocal(portas={protocolo: 0}, atraso=atraso).iniciar_em_thread())
+    return replicas
+
+
+def endpoint(replica, protocolo):
+    return replica.host, replica.portas[protocolo]
+
+
+@contextlib.contextmanager
+def replica_travada():
+    """Porta que aceita o SYN mas nunca completa o handshake (fila de accept cheia)"""
+    servidor = socket.socket()
+    servidor.bind(('127.0.0.1', 0))
+    servidor.listen(0)
+    ocupantes = []
+    with contextlib.ExitStack() as pilha:
+        pilha.callback(servidor.close)
+        # Enche a fila: daqui em diante o kernel descarta os SYNs novos
+        for _ in range(4):
+            ocupante = socket.socket()
+            ocupante.setblocking(False)
+            ocupante.connect_ex(servidor.getsockname())
+            ocupantes.append(ocupante)
+            pilha.callback(ocupante.close)
+        time.sleep(0.05)
+        yield servidor.getsockname()
+
+
+def medir_failover(protocolo, replicas, args):
+    """Derruba, uma por vez, a réplica em uso até sobrar uma"""
+    classe = CLIENTES[protocolo]
+    endpoints = [endpoint(r, protocolo) for r in replicas]
+    cliente = ClienteReconectavel(classe(endpoints), args.aluno_id,
+                                  espera_inicial=args.espera_inicial)
+    vivas = {endpoint(r, protocolo): r for r in replicas}
+    quedas = []
+    cliente.conectar()
+    try:
+        while len(vivas) > 1:
+            fim = time.monotonic() + args.antes_da_queda
+            while time.monotonic() < fim:
+                if cliente.echo("antes") is None:
+                    raise RuntimeError("Operação falhou antes da queda")
+                time.sleep(args.intervalo)
+            derrubada = cliente.endpoint
+            vivas.pop(derrubada).parar_thread()
+            queda = time.monotonic()
+            falhas = 0
+            while cliente.echo("depois") is None:
+                falhas += 1
+            quedas.append({
+                'derrubada': rotulo(derrubada),
+                'nova': rotulo(cliente.endpoint),
+                'failover_ms': (time.monotonic() - queda) * 1000,
+                'falhas_visiveis': falhas,
+            })
+    finally:
+        with contextlib.suppress(OSError):
+            cliente.desconectar()
+    return {'quedas': quedas, 'reconexao': cliente.metricas_reconexao()}
+
+
+def medir_travada(protocolo, replica, args):
+    """Tempo de conexão com uma réplica travada no início da lista"""
+    classe = CLIENTES[protocolo]
+    with replica_travada() as travada:
+        tempos = []
+        for _ in range(args.repeticoes):
+            balanceador = Balanceador([travada, endpoint(replica, protocolo)])
+            cliente = classe(balanceador)
+            inicio = time.monotonic()
+            cliente.conectar()
+            tempos.append((time.monotonic() - inicio) * 1000)
+            escolhido = cliente.endpoint
+            cliente.desconectar()
+    return {'conexao_ms': statistics.median(tempos), 'atraso_tentativa_ms': balanceador.atraso * 1000,
+            'escolhida': rotulo(escolhido)}
+
+
+def medir_balanceamento(protocolo, replicas, args):
+    """Sessões abertas uma a uma num Balanceador compartilhado, cada uma aquecida com operações"""
+    classe = CLIENTES[protocolo]
+    balanceador = Balanceador([endpoint(r, protocolo) for r in replicas])
+    sessoes = []
+    try:
+        for _ in range(args.sessoes):
+            cliente = classe(balanceador)
+            cliente.conectar()
+            cliente.autenticar(args.aluno_id)
+            for _ in range(args.aquecimento):
+                cliente.echo("oi")
+            sessoes.append(cliente)
+        return balanceador.resumo()
+    finally:
+        for cliente in sessoes:
+            with contextlib.suppress(OSError):
+                cliente.desconectar()
+
+
+def imprimir(protocolo, resultado, atrasos):
+    print(f"\n{'='*60}")
+    print(f"Protocolo: {protocolo}")
+    for queda in resultado['failover']['quedas']:
+        print(f"  queda de {queda['derrubada']} -> {queda['nova']}: "
+              f"{queda['failover_ms']:.1f} ms ({queda['falhas_visiveis']} falhas visíveis)")
+    print(f"  reconexão: {resultado['failover']['reconexao']}")
+    travada = resultado['travada']
+    print(f"  réplica travada na frente: conectou em {travada['conexao_ms']:.1f} ms "
+          f"(atraso entre tentativas {travada['atraso_tentativa_ms']:.0f} ms)")
+    print(f"  sessões por réplica (atrasos {', '.join(f'{a*1000:g}' for a in atrasos)} ms):")
+    for nome, info in resultado['balanceamento'].items():
+        latencia = f"{info['latencia_ms']:.2f} ms" if info['latencia_ms'] is not None else "-"
+        print(f"    {nome:<22} sessões={info['sessoes']:<4} latência={latencia}")
+    print('='*60)
+
+
+def main():
+    """Função principal"""
+    parser = argparse.ArgumentParser(description="Failover e balanceamento entre réplicas locais")
+    parser.add_argument('--protocolo', default='json', help="strings, json, protobuf (vírgula para vários)")
+    parser.add_argument('--aluno-id', default='554576')
+    parser.add_argument('--replicas', type=int, default=3)
+    parser.add_argument('--atrasos', default='1,2,4', help="latência de cada réplica no balanceamento, em ms")
+    parser.add_argument('--sessoes', type=int, default=21)
+    parser.add_argument('--aquecimento', type=int, default=20, help="operações por sessão no balanceamento")
+    parser.add_argument('--intervalo', type=float, default=0.005, help="segundos entre operações")
+    parser.add_argument('--antes-da-queda', type=float, default=0.5, help="segundos de operação antes de cada queda")
+    parser.add_argument('--espera-inicial', type=float, default=0.02, help="primeira espera da reconexão")
+    parser.add_argument('--repeticoes', type=int, default=5)
+    parser.add_argument('--saida', help="grava os resultados em JSON")
+    args = parser.parse_args()
+    if args.replicas < 2:
+        parser.error("--replicas precisa ser pelo menos 2")
+    atrasos = [float(a) / 1000 for a in args.atrasos.split(',') if a.strip()]
+
+    resultados = {}
+    for protocolo in [p.strip() for p in args.protocolo.split(',') if p.strip()]:
+        resultado = {}
+        # Os clientes imprimem cada conexão; aqui só o relatório interessa
+        with open(os.devnull, 'w') as nulo, contextlib.redirect_stdout(nulo):
+            replicas = subir_replicas(protocolo, args.replicas)
+            try:
+                resultado['failover'] = medir_failover(protocolo, replicas, args)
+                resultado['travada'] = medir_travada(protocolo, replicas[-1], args)
+            finally:
+                for replica in replicas:
+                    replica.parar_thread()
+            replicas = subir_replicas(protocolo, args.replicas, atrasos)
+            try:
+                resultado['balanceamento'] = medir_balanceamento(protocolo, replicas, args)
+            finally:
+                for replica in replicas:
+                    replica.parar_thread()
+        imprimir(protocolo, resultado, atrasos[:args.replicas])
+        resultados[protocolo] = resultado
+
+    if args.saida:
+        with open(args.saida, 'w') as arquivo:
+            json.dump(resultados, arquivo, indent=2, ensure_ascii=False)
+        print(f"\nResultados gravados em {args.saida}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Gerador de carga para os três protocolos
+
+Abre N sessões simultâneas (clientes asyncio), divididas entre processos
+para usar todos os núcleos, e dispara uma mistura ponderada de operações
+durante um tempo fixo.
+
+- Malha fechada (padrão): cada sessão envia a próxima operação assim que
+  recebe a resposta da anterior.
+- Taxa alvo (--taxa): as operações são agendadas em intervalos fixos e a
+  latência conta a partir do instante agendado, para não esconder filas
+  (omissão coordenada).
+
+    python gerador_carga.py --protocolo json --sessoes 200 --duracao 30 \\
+        --mix echo=50,soma=20,timestamp=10,status=10,historico=10
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from comum import RAIZ, registrar_clientes
+from comum.metricas import Histograma
+
+registrar_clientes()
+sys.path.insert(0, os.path.join(RAIZ, 'servidor-local'))
+from cliente_json_async import ClienteJSONAsync
+from cliente_protobuf_async import ClienteProtobufAsync
+from cliente_strings_async import ClienteStringsAsync
+from servidor_local import PORTAS, ServidorLocal
+
+CLIENTES = {
+    'strings': ClienteStringsAsync,
+    'json': ClienteJSONAsync,
+    'protobuf': ClienteProtobufAsync,
+}
+
+MIX_PADRAO = 'echo=40,soma=20,timestamp=15,status=15,historico=10'
+
+
+def analisar_mix(texto):
+    """'echo=50,soma=20' -> ([operações], [pesos])"""
+    operacoes, pesos = [], []
+    for item in texto.split(','):
+        nome, _, peso = item.strip().partition('=')
+        if nome not in ('echo', 'soma', 'timestamp', 'status', 'historico'):
+            raise ValueError(f"Operação desconhecida no mix: {nome}")
+        operacoes.append(nome)
+        pesos.append(float(peso or 1))
+    return operacoes, pesos
+
+
+def executar(cliente, operacao, config, aleatorio):
+    """Corrotina da operação sorteada"""
+    if operacao == 'echo':
+        return cliente.echo('x' * config['tamanho_echo'])
+    if operacao == 'soma':
+        return cliente.soma([round(aleatorio.uniform(-100, 100), 2) for _ in range(config['tamanho_soma'])])
+    if operacao == 'timestamp':
+        return cliente.timestamp()
+    if operacao == 'status':
+        return cliente.status()
+    return cliente.historico(limite=10)
+
+
+class Estatisticas:
+    """Contadores e histogramas (µs) de um processo"""
+
+    def __init__(self):
+        self.sucesso = 0
+        self.erros = 0
+        self.duracao = 0.0
+        self.latencia = Histograma()
+        self.por_operacao = {}
+
+    def registrar(self, operacao, segundos, ok):
+        if not ok:
+            self.erros += 1
+            return
+        self.sucesso += 1
+        self.latencia.registrar(segundos * 1e6)
+        histograma = self.por_operacao.get(operacao)
+        if histograma is None:
+            histograma = self.por_operacao[operacao] = Histograma()
+        histograma.registrar(segundos * 1e6)
+
+    def mesclar(self, outras):
+        self.sucesso += outras.sucesso
+        self.erros += outras.erros
+        self.duracao = max(self.duracao, outras.duracao)
+        self.latencia.mesclar(outras.latencia)
+        for operacao, histograma in outras.por_operacao.items():
+            self.por_operacao.setdefault(operacao, Histograma()).mesclar(histograma)
+
+
+async def sessao(config, indice, inicio, fim, estatisticas):
+    """Uma sessão: conecta, autentica e repete operações até o fim do teste"""
+    aleatorio = random.Random(config['semente'] * 100003 + indice)
+    operacoes, pesos = analisar_mix(config['mix'])
+    cliente = CLIENTES[config['protocolo']](config['host'], config['porta'])
+    try:
+        await cliente.conectar()
+        if not await cliente.autenticar(config['aluno_id']):
+            estatisticas.erros += 1
+            return
+    except (OSError, asyncio.TimeoutError):
+        estatisticas.erros += 1
+        return
+
+    intervalo = config['intervalo']
+    # Desencontra as sessões dentro do primeiro intervalo
+    agendado = inicio + (aleatorio.random() * intervalo if intervalo else 0)
+    try:
+        while True:
+            if intervalo:
+                espera = agendado - time.monotonic()
+                if espera > 0:
+                    await asyncio.sleep(espera)
+                partida = agendado
+                agendado += intervalo
+            else:
+                partida = time.monotonic()
+            if partida >= fim:
+                break
+            operacao = aleatorio.choices(operacoes, pesos)[0]
+            try:
+                resultado = await executar(cliente, operacao, config, aleatorio)
+                ok = resultado is not None
+            except (OSError, asyncio.TimeoutError):
+                estatisticas.registrar(operacao, 0, False)
+                break
+            estatisticas.registrar(operacao, time.monotonic() - partida, ok)
+        with contextlib.suppress(OSError, asyncio.TimeoutError):
+            await cliente.logout()
+    finally:
+        await cliente.desconectar()
+
+
+async def rodar_processo(config):
+    estatisticas = Estatisticas()
+    inicio = time.monotonic()
+    fim = inicio + config['duracao']
+    await asyncio.gather(*(sessao(config, config['primeira_sessao'] + i, inicio, fim, estatisticas)
+                           for i in range(config['sessoes'])))
+    estatisticas.duracao = time.monotonic() - inicio
+    return estatisticas
+
+
+def trabalhador(config):
+    """Ponto de entrada de cada processo (os clientes imprimem; aqui fica em silêncio)"""
+    with open(os.devnull, 'w') as nulo, contextlib.redirect_stdout(nulo):
+        return asyncio.run(rodar_processo(config))
+
+
+def relatorio(estatisticas, duracao, config):
+    total = estatisticas.sucesso + estatisticas.erros
+    return {
+        'protocolo': config['protocolo'],
+        'sessoes': config['sessoes_total'],
+        'processos': config['processos'],
+        'modo': 'taxa' if config['taxa'] else 'malha_fechada',
+        'taxa_alvo': config['taxa'],
+        'duracao_s': duracao,
+        'operacoes': total,
+        'sucesso': estatisticas.sucesso,
+        'erros': estatisticas.erros,
+        'taxa_erro': estatisticas.erros / total if total else 0.0,
+        'vazao_ops': estatisticas.sucesso / duracao if duracao else 0.0,
+        'latencia_us': estatisticas.latencia.resumo(),
+        'por_operacao_us': {op: h.resumo() for op, h in sorted(estatisticas.por_operacao.items())},
+    }
+
+
+def imprimir(resultado):
+    lat = resultado['latencia_us']
+    print(f"\n{'='*60}")
+    print(f"Protocolo: {resultado['protocolo']}  ({resultado['sessoes']} sessões, "
+          f"{resultado['processos']} processos, {resultado['modo']})")
+    print(f"Operações: {resultado['operacoes']}  Erros: {resultado['erros']} "
+          f"({resultado['taxa_erro']:.2%})")
+    print(f"Vazão: {resultado['vazao_ops']:.1f} ops/s")
+    if lat.get('contagem'):
+        print(f"Latência (ms): p50={lat['p50']/1000:.2f}  p90={lat['p90']/1000:.2f}  "
+              f"p99={lat['p99']/1000:.2f}  máx={lat['max']/1000:.2f}")
+    for operacao, resumo in resultado['por_operacao_us'].items():
+        print(f"  {operacao:<10} n={resumo['contagem']:<8} p50={resumo['p50']/1000:.2f} ms  "
+              f"p99={resumo['p99']/1000:.2f} ms")
+    print('='*60)
+
+
+def main():
+    """Função principal"""
+    parser = argparse.ArgumentParser(description="Gerador de carga para os clientes strings/JSON/protobuf")
+    parser.add_argument('--protocolo', default='json', help="strings, json, protobuf (vírgula para vários)")
+    parser.add_argument('--host', help="servidor externo (padrão: sobe o servidor local)")
+    parser.add_argument('--porta', type=int, help="porta do servidor externo (padrão: a do protocolo)")
+    parser.add_argument('--aluno-id', default='554576')
+    parser.add_argument('--sessoes', type=int, default=50, help="sessões simultâneas no total")
+    parser.add_argument('--processos', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--duracao', type=float, default=10.0, help="segundos")
+    parser.add_argument('--taxa', type=float, help="operações/s no total (sem isso: malha fechada)")
+    parser.add_argument('--mix', default=MIX_PADRAO)
+    parser.add_argument('--tamanho-echo', type=int, default=64)
+    parser.add_argument('--tamanho-soma', type=int, default=10)
+    parser.add_argument('--semente', type=int, default=1)
+    parser.add_argument('--saida', help="grava os resultados em JSON")
+    args = parser.parse_args()
+    analisar_mix(args.mix)
+
+    processos = max(1, min(args.processos, args.sessoes))
+    servidor = None
+    if not args.host:
+        servidor = ServidorLocal(portas={p: 0 for p in PORTAS}).iniciar_em_thread()
+
+    resultados = []
+    try:
+        for protocolo in [p.strip() for p in args.protocolo.split(',') if p.strip()]:
+            host = args.host or servidor.host
+            porta = args.porta or (servidor.portas if servidor else PORTAS)[protocolo]
+            configs = []
+            primeira = 0
+            for i in range(processos):
+                sessoes = args.sessoes // processos + (1 if i < args.sessoes % processos else 0)
+                configs.append({
+                    'protocolo': protocolo,
+                    'host': host,
+                    'porta': porta,
+                    'aluno_id': args.aluno_id,
+                    'sessoes': sessoes,
+                    'primeira_sessao': primeira,
+                    'duracao': args.duracao,
+                    # Intervalo entre operações de uma mesma sessão no modo taxa
+                    'intervalo': args.sessoes / args.taxa if args.taxa else 0,
+                    'mix': args.mix,
+                    'tamanho_echo': args.tamanho_echo,
+                    'tamanho_soma': args.tamanho_soma,
+                    'semente': args.semente,
+                })
+                primeira += sessoes
+
+            estatisticas = Estatisticas()
+            if processos == 1:
+                estatisticas.mesclar(trabalhador(configs[0]))
+            else:
+                with ProcessPoolExecutor(processos) as executor:
+                    for parcial in executor.map(trabalhador, configs):
+                        estatisticas.mesclar(parcial)
+
+            resultado = relatorio(estatisticas, estatisticas.duracao, {
+                'protocolo': protocolo, 'sessoes_total': args.sessoes,
+                'processos': processos, 'taxa': args.taxa})
+            imprimir(resultado)
+            resultados.append(resultado)
+    finally:
+        if servidor:
+            servidor.parar_thread()
+
+    if args.saida:
+        with open(args.saida, 'w', encoding='utf-8') as arquivo:
+            json.dump(resultados, arquivo, indent=2, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,139 +1,134 @@
-import socket
+import os
 import json
+import sys
 from datetime import datetime
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from comum.codec_json import obter_codec
+from comum.enquadramento import DecodificadorLinhas, LeitorLinhas
+from comum.modelos import Modelos
+from comum.nucleo import ClienteBase, Codec
+from comum.rastreio import RastreioTerminal
+from comum.vetores import como_lista
 
-class ClienteJSON:
-    
-    def __init__(self, host: str, port: int = 8081, timeout: int = 30):
-        self.host = host
-        self.port = port
-        self.timeout = timeout
-        self.socket = None
-        self.token = None
-        
-    def conectar(self):
-        """Estabelece conexão TCP"""
-        self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.socket.settimeout(self.timeout)
-        self.socket.connect((self.host, self.port))
-        print(f"Conectado a {self.host}:{self.port}")
-    
-    def desconectar(self):
-        """Fecha conexão"""
-        if self.socket:
-            self.socket.close()
-            print("Desconectado")
-    
-    def enviar(self, dados):
-        """Envia JSON ao servidor"""
-        mensagem = json.dumps(dados, ensure_ascii=False) + '\n'
-        self.socket.sendall(mensagem.encode('utf-8'))
-        print(f"\n{'─'*60}")
-        print("📤 ENVIANDO:")
-        print(json.dumps(dados, indent=2, ensure_ascii=False))
-        print('─'*60)
-    
-    def receber(self):
-        """Recebe resposta JSON do servidor"""
-        dados = b''
-        self.socket.settimeout(2)
-        tentativas = 0
-        
-        while tentativas < 20:
-            try:
-                chunk = self.socket.recv(4096)
-                if not chunk:
-                    break
-                dados += chunk
-                if b'\n' in dados:
-                    break
-                tentativas += 1
-            except socket.timeout:
-                if dados:
-                    break
-                tentativas += 1
-        
-        resposta = json.loads(dados.decode('utf-8').strip())
-        print(f"\n{'─'*60}")
-        print("📥 RECEBIDO:")
-        print(json.dumps(resposta, indent=2, ensure_ascii=False))
-        print('─'*60)
-        return resposta
-    
-    def autenticar(self, aluno_id):
-        """Autentica no servidor"""
-        self.enviar({
+
+class CodecJSON(Codec):
+    """Protocolo JSON: um objeto por linha"""
+    
+    Leitor = LeitorLinhas
+    Decodificador = DecodificadorLinhas
+    
+    def __init__(self, codec_json=None, lote: bool = False):
+        self.usar_modelos = True
+        self.json = obter_codec(codec_json)  # orjson se instalado, senão json
+        self.modelos = Modelos(self.prefixo_operacao)
+        # Lote num objeto só (servidor estendido); suporte_lote fica None até
+        # o servidor responder ao primeiro
+        self.lote = lote
+        self.suporte_lote = None
+    
+    def codificar(self, dados):
+        """Objeto em uma linha JSON (bytes)"""
+        if isinstance(dados, bytes):
+            return dados  # já montada a partir do modelo
+        return self.json.codificar(dados) + b'\n'
+    
+    def decodificar(self, dados):
+        """Linha recebida em objeto Python"""
+        return self.json.decodificar(dados)
+    
+    def mensagem_auth(self, aluno_id):
+        """Monta a requisição de autenticação"""
+        return {
             "tipo": "autenticar",
             "aluno_id": aluno_id,
             "timestamp": datetime.now().isoformat()
-        })
-        
-        resposta = self.receber()
-        if resposta.get('sucesso'):
-            self.token = resposta.get('token')
-            print(f"\033[32mAutenticado como {resposta['dados_aluno']['nome']}\033[0m")
-            return True
-        print(f"Erro: {resposta.get('erro')}")
-        return False
+        }
     
-    def operacao(self, nome, parametros=None):
-        """Executa uma operação genérica"""
-        if not self.token:
-            print("\033[31mNão autenticado\033[0m")
-            return None
-        
-        self.enviar({
-            "tipo": "operacao",
-            "token": self.token,
-            "operacao": nome,
-            "parametros": parametros or {},
-            "timestamp": datetime.now().isoformat()
-        })
-        
-        resposta = self.receber()
+    def interpretar_auth(self, resposta):
+        """Token da sessão se a autenticação deu certo"""
         if resposta.get('sucesso'):
-            return resposta.get('resultado')
+            print(f"\033[32mAutenticado como {resposta['dados_aluno']['nome']}\033[0m")
+            return resposta.get('token')
         print(f"Erro: {resposta.get('erro')}")
         return None
     
-    def echo(self, mensagem):
-        """Operação ECHO"""
-        return self.operacao("echo", {"mensagem": mensagem})
-    
-    def soma(self, numeros):
-        """Operação SOMA"""
-        return self.operacao("soma", {"numeros": numeros})
+    def mensagem_operacao(self, token, nome, parametros):
+        """Monta a requisição de operação: prefixo pré-codificado da sessão + campos variáveis"""
+        if not self.usar_modelos:
+            return {
+                "tipo": "operacao",
+                "token": token,
+                "operacao": nome,
+                "parametros": parametros,
+                "timestamp": datetime.now().isoformat()
+            }
+        # Com o codec json, mesmos bytes que o dicionário acima codificado
+        prefixo = self.modelos.prefixo(token, nome)
+        return b''.join((prefixo, self.json.codificar(parametros),
+                         f', "timestamp": "{datetime.now().isoformat()}"}}\n'.encode('utf-8')))
     
-    def timestamp(self):
-        """Operação TIMESTAMP"""
-        return self.operacao("timestamp")
+    def prefixo_operacao(self, token, nome):
+        """Início fixo da requisição de uma operação, até '"parametros": '"""
+        inicio = json.dumps({"tipo": "operacao", "token": token, "operacao": nome}, ensure_ascii=False)
+        return (inicio[:-1] + ', "parametros": ').encode('utf-8')
     
-    def status(self, detalhado=False):
-        """Operação STATUS"""
-        return self.operacao("status", {"detalhado": detalhado})
-    
-    def historico(self, limite=10):
-        """Operação HISTÓRICO"""
-        return self.operacao("historico", {"limite": limite})
+    def interpretar_operacao(self, resposta):
+        """Converte a resposta de uma operação no resultado"""
+        if resposta.get('sucesso'):
+            return resposta.get('resultado')
+        self.ultimo_erro = resposta.get('erro')
+        print(f"Erro: {self.ultimo_erro}")
+        return None
     
-    def logout(self):
-        """Encerra sessão"""
-        if not self.token:
-            return False
-        
-        self.enviar({
+    def mensagem_logout(self, token):
+        """Monta a requisição de logout"""
+        return {
             "tipo": "logout",
-            "token": self.token,
+            "token": token,
             "timestamp": datetime.now().isoformat()
-        })
-        
-        resposta = self.receber()
+        }
+    
+    def interpretar_logout(self, resposta):
+        """True se o logout deu certo"""
         if resposta.get('sucesso'):
             print("Logout realizado")
-            self.token = None
             return True
         return False
+    
+    def usar_lote(self):
+        return self.lote and self.suporte_lote is not False
+    
+    def mensagem_lote(self, token, itens):
+        """Requisição de lote: as operações num array, com o token uma vez só"""
+        return {
+            "tipo": "lote",
+            "token": token,
+            "operacoes": [{"operacao": nome, "parametros": parametros} for nome, parametros in itens],
+            "timestamp": datetime.now().isoformat()
+        }
+    
+    def interpretar_lote(self, resposta):
+        """Resultados do lote; None se o servidor não conhece o tipo lote"""
+        respostas = resposta.get('respostas') if resposta.get('sucesso') else None
+        if respostas is None:
+            self.suporte_lote = False
+            return None
+        self.suporte_lote = True
+        return [self.interpretar_operacao(r) for r in respostas]
+    
+    def parametros(self, nome, valores):
+        """Parâmetros com os tipos do JSON (números em lista nativa)"""
+        if nome == 'soma':
+            return {'numeros': como_lista(valores['numeros'])}
+        return valores
+
+
+class ClienteJSON(ClienteBase):
+    
+    def __init__(self, host: str, port: int = 8081, timeout: int = 30, rastreio=None,
+                 codec_json=None, lote: bool = False, perfil=None):
+        super().__init__(host, port, timeout, rastreio, CodecJSON(codec_json, lote), perfil)
 
 
 def main():
@@ -141,10 +136,10 @@ def main():
     print("="*50)
     print("CLIENTE PROTOCOLO JSON")
     print("="*50)
-    host = "3.88.99.255"
+    host = os.environ.get("SERVIDORES", "3.88.99.255")  # réplicas: "h1:porta,h2:porta"
     aluno_id = input("Matrícula: ").strip()
     
-    cliente = ClienteJSON(host)
+    cliente = ClienteJSON(host, rastreio=RastreioTerminal())
     
     try:
         cliente.conectar()
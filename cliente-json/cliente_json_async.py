@@ -0,0 +1,11 @@
+import os
+import sys
+
+from cliente_json import ClienteJSON
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from comum.assincrono import ClienteAsync
+
+
+class ClienteJSONAsync(ClienteAsync, ClienteJSON):
+    """ClienteJSON sobre asyncio: mesmas operações, todas aguardáveis"""
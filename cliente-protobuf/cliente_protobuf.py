@@ -1,187 +1,284 @@
-import socket
-import struct
+import os
+import sys
 from datetime import datetime
 import mensagens_pb2 as pb
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from comum.enquadramento import CABECALHO, DecodificadorFrames, LeitorFrames
+from comum.nucleo import ClienteBase, Codec
+from comum.pipeline import RespostaPendente
+from comum.rastreio import RastreioTerminal
+from comum.vetores import como_lista, como_vetor, texto_numeros
 
-class ClienteProtobuf:
-    
-    def __init__(self, host: str, port: int = 8082, timeout: int = 30):
-        self.host = host
-        self.port = port
-        self.timeout = timeout
-        self.socket = None
-        self.token = None
-        
-    def conectar(self):
-        """Estabelece conexão TCP"""
-        self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.socket.settimeout(self.timeout)
-        self.socket.connect((self.host, self.port))
-        print(f"Conectado a {self.host}:{self.port}")
-    
-    def desconectar(self):
-        """Fecha conexão"""
-        if self.socket:
-            self.socket.close()
-            print("Desconectado")
-    
-    def enviar(self, requisicao):
-        """Envia mensagem Protocol Buffers com cabeçalho de tamanho"""
+
+def mensagem_para_dict(mensagem):
+    """Resultado tipado -> dict com tipos nativos (inclui campos com valor padrão)"""
+    resultado = {}
+    for campo in mensagem.DESCRIPTOR.fields:
+        valor = getattr(mensagem, campo.name)
+        if campo.message_type is not None and campo.message_type.GetOptions().map_entry:
+            valor = dict(valor)
+        elif campo.label == campo.LABEL_REPEATED:
+            valor = [mensagem_para_dict(v) for v in valor] if campo.message_type else list(valor)
+        elif campo.message_type is not None:
+            valor = mensagem_para_dict(valor)
+        resultado[campo.name] = valor
+    return resultado
+
+
+def trocar_campos_token(mensagem, antigo, novo):
+    """Troca o token em todos os campos 'token' da mensagem e das submensagens"""
+    for campo, valor in mensagem.ListFields():
+        if campo.name == 'token' and valor == antigo:
+            mensagem.token = novo
+        elif campo.message_type is None or campo.message_type.GetOptions().map_entry:
+            continue
+        elif campo.label == campo.LABEL_REPEATED:
+            for item in valor:
+                trocar_campos_token(item, antigo, novo)
+        else:
+            trocar_campos_token(valor, antigo, novo)
+
+
+class CodecProtobuf(Codec):
+    """Protocol Buffers: [4 bytes tamanho][Requisicao/Resposta serializada]"""
+    
+    Leitor = LeitorFrames
+    Decodificador = DecodificadorFrames
+    
+    def __init__(self, tipado: bool = False, lote: bool = False):
+        # Resultados tipados (ResultadoSoma, ...) em vez do map de strings;
+        # suporte_tipado fica None até o servidor mostrar se entende o pedido
+        self.tipado = tipado
+        self.suporte_tipado = None
+        # ComandoLote num frame só, com o mesmo esquema de detecção
+        self.lote = lote
+        self.suporte_lote = None
+        self.calado = False  # não imprime o erro da tentativa tipada que pode ser repetida
+    
+    def codificar(self, requisicao):
+        """Serializa a requisição: 4 bytes (tamanho) + dados"""
         dados = requisicao.SerializeToString()
-        tamanho = len(dados)
-        
-        # Envia: 4 bytes (tamanho) + dados
-        cabecalho = struct.pack('!I', tamanho)
-        self.socket.sendall(cabecalho + dados)
-        
-        print(f"\n{'─'*60}")
-        print("📤 ENVIANDO (Protocol Buffers):")
-        print(f"Tamanho: {tamanho} bytes")
-        print(requisicao)
-        print('─'*60)
-    
-    def receber(self):
-        """Recebe resposta Protocol Buffers com cabeçalho de tamanho"""
-        # Lê cabeçalho (4 bytes com tamanho)
-        cabecalho = self._receber_exato(4)
-        tamanho = struct.unpack('!I', cabecalho)[0]
-        
-        # Lê dados da mensagem
-        dados = self._receber_exato(tamanho)
-        
-        # Deserializa
+        return CABECALHO.pack(len(dados)) + dados
+    
+    def decodificar(self, dados):
+        """Deserializa o corpo do frame (aceita memoryview, sem copiar)"""
         resposta = pb.Resposta()
         resposta.ParseFromString(dados)
-        
-        print(f"\n{'─'*60}")
-        print("📥 RECEBIDO (Protocol Buffers):")
-        print(f"Tamanho: {tamanho} bytes")
-        print(resposta)
-        print('─'*60)
-        
         return resposta
     
-    def _receber_exato(self, n):
-        """Recebe exatamente n bytes"""
-        dados = b''
-        while len(dados) < n:
-            chunk = self.socket.recv(n - len(dados))
-            if not chunk:
-                raise ConnectionError("Conexão fechada pelo servidor")
-            dados += chunk
-        return dados
-    
-    def autenticar(self, aluno_id):
-        """Autentica no servidor"""
+    def mensagem_auth(self, aluno_id):
+        """Monta a requisição de autenticação"""
         requisicao = pb.Requisicao()
         requisicao.auth.aluno_id = aluno_id
         requisicao.auth.timestamp_cliente = datetime.now().isoformat()
-        
-        self.enviar(requisicao)
-        resposta = self.receber()
-        
+        return requisicao
+    
+    def interpretar_auth(self, resposta):
+        """Token da sessão se a autenticação deu certo"""
         if resposta.HasField('ok'):
             # Extrai o token do map de dados
-            self.token = resposta.ok.dados.get('token', '')
+            token = resposta.ok.dados.get('token', '')
             nome = resposta.ok.dados.get('nome', '')
             matricula = resposta.ok.dados.get('matricula', '')
             
             print(f"\nAUTENTICAÇÃO BEM-SUCEDIDA!")
-            print(f"Token: {self.token[:50]}..." if len(self.token) > 50 else f"Token: {self.token}")
+            print(f"Token: {token[:50]}..." if len(token) > 50 else f"Token: {token}")
             if nome:
                 print(f"Nome: {nome}")
             if matricula:
                 print(f"Matrícula: {matricula}")
-            return True
+            return token
         elif resposta.HasField('erro'):
             print(f"Erro: {resposta.erro.mensagem}")
-            return False
+            return None
         
         print("Resposta inesperada do servidor")
-        return False
+        return None
     
-    def operacao(self, nome, parametros=None):
-        """Executa uma operação genérica"""
-        if not self.token:
-            print("Não autenticado")
-            return None
-        
+    def mensagem_operacao(self, token, nome, parametros):
+        """Monta a requisição de operação com o token da sessão"""
         requisicao = pb.Requisicao()
-        requisicao.operacao.token = self.token
-        requisicao.operacao.operacao = nome
+        requisicao.operacao.token = token
+        self.preencher_operacao(requisicao.operacao, nome, parametros)
+        return requisicao
+    
+    def preencher_operacao(self, comando, nome, parametros):
+        """Nome, modo tipado e parâmetros de um ComandoOperacao"""
+        comando.operacao = nome
+        if self.usar_tipado():
+            comando.tipado = True
         
         # Adiciona parâmetros ao map
-        if parametros:
-            for chave, valor in parametros.items():
-                requisicao.operacao.parametros[chave] = str(valor)
-        
-        self.enviar(requisicao)
-        resposta = self.receber()
-        
+        for chave, valor in parametros.items():
+            if chave == 'numeros' and not isinstance(valor, str):
+                # repeated double empacotado: 8 bytes por número, sem texto
+                comando.numeros.extend(valor)
+            else:
+                comando.parametros[chave] = str(valor)
+    
+    def usar_tipado(self):
+        """Pede resultado tipado, a menos que o servidor já tenha mostrado não suportar"""
+        return self.tipado and self.suporte_tipado is not False
+    
+    def interpretar_operacao(self, resposta):
+        """Converte a resposta de uma operação no resultado"""
         if resposta.HasField('ok'):
+            campo = resposta.ok.WhichOneof('resultado')
+            if campo:
+                self.suporte_tipado = True
+                return mensagem_para_dict(getattr(resposta.ok, campo))
+            if self.usar_tipado() and resposta.ok.dados:
+                # Servidor antigo: ignorou o pedido e respondeu só com o map
+                self.suporte_tipado = False
             # Converte map de dados para dicionário Python
             resultado = dict(resposta.ok.dados)
             return resultado
         elif resposta.HasField('erro'):
-            print(f"✗ Erro: {resposta.erro.mensagem}")
+            self.ultimo_erro = resposta.erro.mensagem
+            if not self.calado:
+                print(f"✗ Erro: {self.ultimo_erro}")
             return None
         
         return None
     
-    def echo(self, mensagem):
-        """Operação ECHO"""
-        return self.operacao("echo", {"mensagem": mensagem})
+    def sondar_tipado(self, numeros):
+        """True se esta SOMA tipada ainda pode ser recusada por um servidor sem suporte"""
+        return self.usar_tipado() and self.suporte_tipado is None and len(numeros) > 0
     
-    def soma(self, numeros):
-        """Operação SOMA"""
-        numeros_str = ','.join(map(str, numeros))
-        return self.operacao("soma", {"numeros": numeros_str})
-    
-    def timestamp(self):
-        """Operação TIMESTAMP"""
-        return self.operacao("timestamp")
-    
-    def status(self, detalhado=False):
-        """Operação STATUS"""
-        params = {"detalhado": "true" if detalhado else "false"}
-        return self.operacao("status", params)
-    
-    def historico(self, limite=10):
-        """Operação HISTÓRICO"""
-        return self.operacao("historico", {"limite": str(limite)})
-    
-    def logout(self):
-        """Encerra sessão"""
-        if not self.token:
-            return False
-        
+    def recusou_tipado(self, resposta):
+        """True se a sondagem voltou com erro: o servidor não viu os números no campo novo"""
+        # Outra sondagem concorrente pode já ter desligado o modo tipado
+        return resposta.HasField('erro') and self.suporte_tipado is not True
+    
+    def usar_lote(self):
+        return self.lote and self.suporte_lote is not False
+    
+    def mensagem_lote(self, token, itens):
+        """ComandoLote: as operações herdam o token do lote"""
         requisicao = pb.Requisicao()
-        requisicao.logout.token = self.token
-        
-        self.enviar(requisicao)
-        resposta = self.receber()
-        
+        requisicao.lote.token = token
+        for nome, parametros in itens:
+            self.preencher_operacao(requisicao.lote.operacoes.add(), nome, parametros)
+        return requisicao
+    
+    def interpretar_lote(self, resposta):
+        """Resultados do lote; None se o servidor não conhece ComandoLote"""
+        if not resposta.HasField('lote'):
+            self.suporte_lote = False
+            return None
+        self.suporte_lote = True
+        return [self.interpretar_operacao(r) for r in resposta.lote.respostas]
+    
+    def mensagem_logout(self, token):
+        """Monta a requisição de logout"""
+        requisicao = pb.Requisicao()
+        requisicao.logout.token = token
+        return requisicao
+    
+    def interpretar_logout(self, resposta):
+        """True se o logout deu certo"""
         if resposta.HasField('ok'):
             print(f"Logout realizado: {resposta.ok.dados.get('mensagem', 'Sucesso')}")
-            self.token = None
             return True
         elif resposta.HasField('erro'):
             print(f"Erro: {resposta.erro.mensagem}")
         
         return False
+    
+    def parametros(self, nome, valores):
+        """Valores do map em texto; números no campo repetido quando tipado"""
+        if nome == 'soma':
+            numeros = valores['numeros']
+            return {'numeros': como_lista(numeros) if self.usar_tipado() else texto_numeros(numeros)}
+        if nome == 'status':
+            return {'detalhado': "true" if valores['detalhado'] else "false"}
+        if nome == 'historico':
+            return {'limite': str(valores['limite'])}
+        return valores
+    
+    def trocar_token(self, quadro, antigo, novo):
+        """Troca o token nos campos da requisição (o tamanho do frame muda junto)"""
+        requisicao = pb.Requisicao()
+        requisicao.ParseFromString(quadro[CABECALHO.size:])
+        trocar_campos_token(requisicao, antigo, novo)
+        return self.codificar(requisicao)
 
 
+class ClienteProtobuf(ClienteBase):
+    
+    def __init__(self, host: str, port: int = 8082, timeout: int = 30, rastreio=None,
+                 tipado: bool = False, lote: bool = False, perfil=None):
+        super().__init__(host, port, timeout, rastreio, CodecProtobuf(tipado, lote), perfil)
+    
+    def soma(self, numeros):
+        """Operação SOMA; sem suporte tipado no servidor, repete no map de strings"""
+        numeros = como_vetor(numeros)
+        if not self.codec.sondar_tipado(numeros):
+            return super().soma(numeros)
+        pipeline = self.pipeline_ativo
+        if not pipeline:
+            return self._sondar_soma(numeros)
+        # A sondagem precisa ver a resposta antes da próxima requisição: sai fora do pipeline
+        pipeline.concluir()
+        self.pipeline_ativo = None
+        try:
+            resultado = self._sondar_soma(numeros)
+        finally:
+            self.pipeline_ativo = pipeline
+        pendente = RespostaPendente(pipeline)
+        pendente.resolver(resultado)
+        return pendente
+    
+    def batch(self, operacoes):
+        """batch(); enquanto o suporte tipado é desconhecido, a primeira SOMA sai sozinha como sondagem"""
+        operacoes = list(operacoes)
+        indice = self._primeira_soma_sondada(operacoes)
+        if indice is None or not self.token:
+            return super().batch(operacoes)
+        antes = super().batch(operacoes[:indice]) if indice else []
+        pipeline = self.pipeline_ativo  # já concluído pelo batch() acima, se havia
+        self.pipeline_ativo = None
+        try:
+            sondagem = self._sondar_soma(como_vetor(operacoes[indice][1]["numeros"]))
+        finally:
+            self.pipeline_ativo = pipeline
+        return antes + [sondagem] + self.batch(operacoes[indice + 1:])
+    
+    def _primeira_soma_sondada(self, operacoes):
+        """Posição da primeira SOMA que ainda serviria de sondagem do campo tipado"""
+        if not self.codec.usar_tipado() or self.codec.suporte_tipado is not None:
+            return None
+        for indice, operacao in enumerate(operacoes):
+            if not isinstance(operacao, str) and operacao[0] == "soma" and len(operacao) > 1:
+                if self.codec.sondar_tipado(como_vetor(operacao[1].get("numeros", []))):
+                    return indice
+        return None
+    
+    def _sondar_soma(self, numeros):
+        """SOMA tipada avulsa; se o servidor não a entende, repete no map de strings"""
+        codec = self.codec
+        codec.calado = True  # o erro só aparece se a repetição no map falhar também
+        try:
+            resultado = ClienteBase.soma(self, numeros)
+        finally:
+            codec.calado = False
+        if resultado is None and codec.suporte_tipado is None:
+            # Servidor sem suporte não vê os números no campo novo: volta ao map
+            codec.suporte_tipado = False
+            return ClienteBase.soma(self, numeros)
+        return resultado
+
 def main():
     """Função principal"""
     print("="*50)
     print("CLIENTE PROTOCOL BUFFERS")
     print("="*50)
     
-    host = "3.88.99.255"
+    host = os.environ.get("SERVIDORES", "3.88.99.255")  # réplicas: "h1:porta,h2:porta"
     aluno_id = input("Matrícula: ").strip()
     
-    cliente = ClienteProtobuf(host)
+    cliente = ClienteProtobuf(host, rastreio=RastreioTerminal())
     
     try:
         cliente.conectar()
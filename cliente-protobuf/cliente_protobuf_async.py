@@ -0,0 +1,42 @@
+import os
+import sys
+
+from cliente_protobuf import ClienteProtobuf
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from comum.assincrono import ClienteAsync
+from comum.metricas import Medicao
+from comum.nucleo import ClienteBase
+from comum.vetores import como_vetor
+
+
+class ClienteProtobufAsync(ClienteAsync, ClienteProtobuf):
+    """ClienteProtobuf sobre asyncio: mesmas operações, todas aguardáveis"""
+    
+    async def soma(self, numeros):
+        """Operação SOMA; sem suporte tipado no servidor, repete no map de strings"""
+        numeros = como_vetor(numeros)
+        codec = self.codec
+        if not self.token or len(numeros) > self.tamanho_lote or not codec.sondar_tipado(numeros):
+            return await ClienteBase.soma(self, numeros)
+        # Sondagem: olha a resposta antes de interpretar (e imprimir) um erro que
+        # a repetição no map pode desfazer; sem estado no codec, por ser concorrente
+        medicao = Medicao("soma")
+        mensagem = self.mensagem_operacao("soma", codec.parametros("soma", {"numeros": numeros}))
+        resposta = await self.requisitar(mensagem, medicao)
+        if codec.recusou_tipado(resposta):
+            codec.suporte_tipado = False
+            return await ClienteBase.soma(self, numeros)
+        resultado = self.interpretar_operacao(resposta)
+        self.metricas.registrar(medicao.concluir())
+        return resultado
+    
+    async def batch(self, operacoes):
+        """batch(); enquanto o suporte tipado é desconhecido, a primeira SOMA sai sozinha como sondagem"""
+        operacoes = list(operacoes)
+        indice = self._primeira_soma_sondada(operacoes)
+        if indice is None or not self.token:
+            return await ClienteAsync.batch(self, operacoes)
+        antes = await ClienteAsync.batch(self, operacoes[:indice]) if indice else []
+        sondagem = await self.soma(operacoes[indice][1]["numeros"])
+        return antes + [sondagem] + await self.batch(operacoes[indice + 1:])
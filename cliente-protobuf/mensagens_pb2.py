@@ -1,10 +1,10 @@
 # -*- coding: utf-8 -*-
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # source: mensagens.proto
-
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
 from google.protobuf import descriptor as _descriptor
-from google.protobuf import message as _message
-from google.protobuf import reflection as _reflection
+from google.protobuf import descriptor_pool as _descriptor_pool
 from google.protobuf import symbol_database as _symbol_database
 # @@protoc_insertion_point(imports)
 
@@ -13,1470 +13,79 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor.FileDescriptor(
-  name='mensagens.proto',
-  package='servidor_validacao',
-  syntax='proto3',
-  serialized_options=None,
-  create_key=_descriptor._internal_create_key,
-  serialized_pb=b'\n\x0fmensagens.proto\x12\x12servidor_validacao\"\xe4\x01\n\nRequisicao\x12/\n\x04\x61uth\x18\x01 \x01(\x0b\x32\x1f.servidor_validacao.ComandoAuthH\x00\x12\x37\n\x08operacao\x18\x02 \x01(\x0b\x32#.servidor_validacao.ComandoOperacaoH\x00\x12/\n\x04info\x18\x03 \x01(\x0b\x32\x1f.servidor_validacao.ComandoInfoH\x00\x12\x33\n\x06logout\x18\x04 \x01(\x0b\x32!.servidor_validacao.ComandoLogoutH\x00\x42\x06\n\x04tipo\"r\n\x08Resposta\x12,\n\x02ok\x18\x01 \x01(\x0b\x32\x1e.servidor_validacao.RespostaOkH\x00\x12\x30\n\x04\x65rro\x18\x02 \x01(\x0b\x32 .servidor_validacao.RespostaErroH\x00\x42\x06\n\x04tipo\":\n\x0b\x43omandoAuth\x12\x10\n\x08\x61luno_id\x18\x01 \x01(\t\x12\x19\n\x11timestamp_cliente\x18\x02 \x01(\t\"\xae\x01\n\x0f\x43omandoOperacao\x12\r\n\x05token\x18\x01 \x01(\t\x12\x10\n\x08operacao\x18\x02 \x01(\t\x12G\n\nparametros\x18\x03 \x03(\x0b\x32\x33.servidor_validacao.ComandoOperacao.ParametrosEntry\x1a\x31\n\x0fParametrosEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\x1b\n\x0b\x43omandoInfo\x12\x0c\n\x04tipo\x18\x01 \x01(\t\"\x1e\n\rComandoLogout\x12\r\n\x05token\x18\x01 \x01(\t\"\x98\x01\n\nRespostaOk\x12\x0f\n\x07\x63omando\x18\x01 \x01(\t\x12\x38\n\x05\x64\x61\x64os\x18\x02 \x03(\x0b\x32).servidor_validacao.RespostaOk.DadosEntry\x12\x11\n\ttimestamp\x18\x03 \x01(\t\x1a,\n\nDadosEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\xb7\x01\n\x0cRespostaErro\x12\x0f\n\x07\x63omando\x18\x01 \x01(\t\x12\x10\n\x08mensagem\x18\x02 \x01(\t\x12\x11\n\ttimestamp\x18\x03 \x01(\t\x12@\n\x08\x64\x65talhes\x18\x04 \x03(\x0b\x32..servidor_validacao.RespostaErro.DetalhesEntry\x1a/\n\rDetalhesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"h\n\tDadosAuth\x12\r\n\x05token\x18\x01 \x01(\t\x12\x0c\n\x04nome\x18\x02 \x01(\t\x12\x11\n\tmatricula\x18\x03 \x01(\t\x12\x11\n\ttimestamp\x18\x04 \x01(\t\x12\x18\n\x10timeout_segundos\x18\x05 \x01(\x03\"\x88\x01\n\rResultadoEcho\x12\x19\n\x11mensagem_original\x18\x01 \x01(\t\x12\x14\n\x0cmensagem_eco\x18\x02 \x01(\t\x12\x10\n\x08hash_md5\x18\x03 \x01(\t\x12\x18\n\x10tamanho_mensagem\x18\x04 \x01(\x05\x12\x1a\n\x12timestamp_servidor\x18\x05 \x01(\t\"\x96\x01\n\rResultadoSoma\x12\x19\n\x11numeros_originais\x18\x01 \x03(\x01\x12\x12\n\nquantidade\x18\x02 \x01(\x05\x12\x0c\n\x04soma\x18\x03 \x01(\x01\x12\r\n\x05media\x18\x04 \x01(\x01\x12\x0e\n\x06maximo\x18\x05 \x01(\x01\x12\x0e\n\x06minimo\x18\x06 \x01(\x01\x12\x19\n\x11timestamp_calculo\x18\x07 \x01(\t\"\xcc\x01\n\x12ResultadoTimestamp\x12\x16\n\x0etimestamp_unix\x18\x01 \x01(\x01\x12\x15\n\rtimestamp_iso\x18\x02 \x01(\t\x12\x1b\n\x13timestamp_formatado\x18\x03 \x01(\t\x12\x0b\n\x03\x61no\x18\x04 \x01(\x05\x12\x0b\n\x03mes\x18\x05 \x01(\x05\x12\x0b\n\x03\x64ia\x18\x06 \x01(\x05\x12\x0c\n\x04hora\x18\x07 \x01(\x05\x12\x0e\n\x06minuto\x18\x08 \x01(\x05\x12\x0f\n\x07segundo\x18\t \x01(\x05\x12\x14\n\x0cmicrosegundo\x18\n \x01(\x05\"\x8d\x04\n\x0eStatusServidor\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x1d\n\x15operacoes_processadas\x18\x02 \x01(\x03\x12\x16\n\x0esessoes_ativas\x18\x03 \x01(\x05\x12\x13\n\x0btempo_ativo\x18\x04 \x01(\x01\x12\x0e\n\x06versao\x18\x05 \x01(\t\x12U\n\x12\x65statisticas_banco\x18\x06 \x03(\x0b\x32\x39.servidor_validacao.StatusServidor.EstatisticasBancoEntry\x12Q\n\x10sessoes_detalhes\x18\x07 \x03(\x0b\x32\x37.servidor_validacao.StatusServidor.SessoesDetalhesEntry\x12\x42\n\x08metricas\x18\x08 \x03(\x0b\x32\x30.servidor_validacao.StatusServidor.MetricasEntry\x1a\x38\n\x16\x45statisticasBancoEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1a\x36\n\x14SessoesDetalhesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1a/\n\rMetricasEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x01:\x02\x38\x01\"\xa4\x01\n\x0cInfoServidor\x12\x0c\n\x04nome\x18\x01 \x01(\t\x12\x0e\n\x06versao\x18\x02 \x01(\t\x12\x0c\n\x04host\x18\x03 \x01(\t\x12\x0c\n\x04port\x18\x04 \x01(\x05\x12\x11\n\tprotocolo\x18\x05 \x01(\t\x12\x0f\n\x07\x66ormato\x18\x06 \x01(\t\x12\x1d\n\x15operacoes_disponiveis\x18\x07 \x03(\t\x12\x17\n\x0ftotal_operacoes\x18\x08 \x01(\x05\"\xc2\x02\n\x11HistoricoOperacao\x12\x10\n\x08operacao\x18\x01 \x01(\t\x12I\n\nparametros\x18\x02 \x03(\x0b\x32\x35.servidor_validacao.HistoricoOperacao.ParametrosEntry\x12G\n\tresultado\x18\x03 \x03(\x0b\x32\x34.servidor_validacao.HistoricoOperacao.ResultadoEntry\x12\x11\n\ttimestamp\x18\x04 \x01(\t\x12\x0f\n\x07sucesso\x18\x05 \x01(\x08\x1a\x31\n\x0fParametrosEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1a\x30\n\x0eResultadoEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"k\n\x0eHistoricoAluno\x12\x10\n\x08\x61luno_id\x18\x01 \x01(\t\x12\x38\n\toperacoes\x18\x02 \x03(\x0b\x32%.servidor_validacao.HistoricoOperacao\x12\r\n\x05total\x18\x03 \x01(\x05\x62\x06proto3'
-)
-
-
-
-
-_REQUISICAO = _descriptor.Descriptor(
-  name='Requisicao',
-  full_name='servidor_validacao.Requisicao',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='auth', full_name='servidor_validacao.Requisicao.auth', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='operacao', full_name='servidor_validacao.Requisicao.operacao', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='info', full_name='servidor_validacao.Requisicao.info', index=2,
-      number=3, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='logout', full_name='servidor_validacao.Requisicao.logout', index=3,
-      number=4, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-    _descriptor.OneofDescriptor(
-      name='tipo', full_name='servidor_validacao.Requisicao.tipo',
-      index=0, containing_type=None,
-      create_key=_descriptor._internal_create_key,
-    fields=[]),
-  ],
-  serialized_start=40,
-  serialized_end=268,
-)
-
-
-_RESPOSTA = _descriptor.Descriptor(
-  name='Resposta',
-  full_name='servidor_validacao.Resposta',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='ok', full_name='servidor_validacao.Resposta.ok', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='erro', full_name='servidor_validacao.Resposta.erro', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-    _descriptor.OneofDescriptor(
-      name='tipo', full_name='servidor_validacao.Resposta.tipo',
-      index=0, containing_type=None,
-      create_key=_descriptor._internal_create_key,
-    fields=[]),
-  ],
-  serialized_start=270,
-  serialized_end=384,
-)
-
-
-_COMANDOAUTH = _descriptor.Descriptor(
-  name='ComandoAuth',
-  full_name='servidor_validacao.ComandoAuth',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='aluno_id', full_name='servidor_validacao.ComandoAuth.aluno_id', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='timestamp_cliente', full_name='servidor_validacao.ComandoAuth.timestamp_cliente', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=386,
-  serialized_end=444,
-)
-
-
-_COMANDOOPERACAO_PARAMETROSENTRY = _descriptor.Descriptor(
-  name='ParametrosEntry',
-  full_name='servidor_validacao.ComandoOperacao.ParametrosEntry',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='key', full_name='servidor_validacao.ComandoOperacao.ParametrosEntry.key', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='value', full_name='servidor_validacao.ComandoOperacao.ParametrosEntry.value', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=b'8\001',
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=572,
-  serialized_end=621,
-)
-
-_COMANDOOPERACAO = _descriptor.Descriptor(
-  name='ComandoOperacao',
-  full_name='servidor_validacao.ComandoOperacao',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='token', full_name='servidor_validacao.ComandoOperacao.token', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='operacao', full_name='servidor_validacao.ComandoOperacao.operacao', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='parametros', full_name='servidor_validacao.ComandoOperacao.parametros', index=2,
-      number=3, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[_COMANDOOPERACAO_PARAMETROSENTRY, ],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=447,
-  serialized_end=621,
-)
-
-
-_COMANDOINFO = _descriptor.Descriptor(
-  name='ComandoInfo',
-  full_name='servidor_validacao.ComandoInfo',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='tipo', full_name='servidor_validacao.ComandoInfo.tipo', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=623,
-  serialized_end=650,
-)
-
-
-_COMANDOLOGOUT = _descriptor.Descriptor(
-  name='ComandoLogout',
-  full_name='servidor_validacao.ComandoLogout',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='token', full_name='servidor_validacao.ComandoLogout.token', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=652,
-  serialized_end=682,
-)
-
-
-_RESPOSTAOK_DADOSENTRY = _descriptor.Descriptor(
-  name='DadosEntry',
-  full_name='servidor_validacao.RespostaOk.DadosEntry',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='key', full_name='servidor_validacao.RespostaOk.DadosEntry.key', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='value', full_name='servidor_validacao.RespostaOk.DadosEntry.value', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=b'8\001',
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=793,
-  serialized_end=837,
-)
-
-_RESPOSTAOK = _descriptor.Descriptor(
-  name='RespostaOk',
-  full_name='servidor_validacao.RespostaOk',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='comando', full_name='servidor_validacao.RespostaOk.comando', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='dados', full_name='servidor_validacao.RespostaOk.dados', index=1,
-      number=2, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='timestamp', full_name='servidor_validacao.RespostaOk.timestamp', index=2,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[_RESPOSTAOK_DADOSENTRY, ],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=685,
-  serialized_end=837,
-)
-
-
-_RESPOSTAERRO_DETALHESENTRY = _descriptor.Descriptor(
-  name='DetalhesEntry',
-  full_name='servidor_validacao.RespostaErro.DetalhesEntry',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='key', full_name='servidor_validacao.RespostaErro.DetalhesEntry.key', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='value', full_name='servidor_validacao.RespostaErro.DetalhesEntry.value', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=b'8\001',
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=976,
-  serialized_end=1023,
-)
-
-_RESPOSTAERRO = _descriptor.Descriptor(
-  name='RespostaErro',
-  full_name='servidor_validacao.RespostaErro',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='comando', full_name='servidor_validacao.RespostaErro.comando', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='mensagem', full_name='servidor_validacao.RespostaErro.mensagem', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='timestamp', full_name='servidor_validacao.RespostaErro.timestamp', index=2,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='detalhes', full_name='servidor_validacao.RespostaErro.detalhes', index=3,
-      number=4, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[_RESPOSTAERRO_DETALHESENTRY, ],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=840,
-  serialized_end=1023,
-)
-
-
-_DADOSAUTH = _descriptor.Descriptor(
-  name='DadosAuth',
-  full_name='servidor_validacao.DadosAuth',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='token', full_name='servidor_validacao.DadosAuth.token', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='nome', full_name='servidor_validacao.DadosAuth.nome', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='matricula', full_name='servidor_validacao.DadosAuth.matricula', index=2,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='timestamp', full_name='servidor_validacao.DadosAuth.timestamp', index=3,
-      number=4, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='timeout_segundos', full_name='servidor_validacao.DadosAuth.timeout_segundos', index=4,
-      number=5, type=3, cpp_type=2, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1025,
-  serialized_end=1129,
-)
-
-
-_RESULTADOECHO = _descriptor.Descriptor(
-  name='ResultadoEcho',
-  full_name='servidor_validacao.ResultadoEcho',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='mensagem_original', full_name='servidor_validacao.ResultadoEcho.mensagem_original', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='mensagem_eco', full_name='servidor_validacao.ResultadoEcho.mensagem_eco', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='hash_md5', full_name='servidor_validacao.ResultadoEcho.hash_md5', index=2,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='tamanho_mensagem', full_name='servidor_validacao.ResultadoEcho.tamanho_mensagem', index=3,
-      number=4, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='timestamp_servidor', full_name='servidor_validacao.ResultadoEcho.timestamp_servidor', index=4,
-      number=5, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1132,
-  serialized_end=1268,
-)
-
-
-_RESULTADOSOMA = _descriptor.Descriptor(
-  name='ResultadoSoma',
-  full_name='servidor_validacao.ResultadoSoma',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='numeros_originais', full_name='servidor_validacao.ResultadoSoma.numeros_originais', index=0,
-      number=1, type=1, cpp_type=5, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='quantidade', full_name='servidor_validacao.ResultadoSoma.quantidade', index=1,
-      number=2, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='soma', full_name='servidor_validacao.ResultadoSoma.soma', index=2,
-      number=3, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='media', full_name='servidor_validacao.ResultadoSoma.media', index=3,
-      number=4, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='maximo', full_name='servidor_validacao.ResultadoSoma.maximo', index=4,
-      number=5, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='minimo', full_name='servidor_validacao.ResultadoSoma.minimo', index=5,
-      number=6, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='timestamp_calculo', full_name='servidor_validacao.ResultadoSoma.timestamp_calculo', index=6,
-      number=7, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1271,
-  serialized_end=1421,
-)
-
-
-_RESULTADOTIMESTAMP = _descriptor.Descriptor(
-  name='ResultadoTimestamp',
-  full_name='servidor_validacao.ResultadoTimestamp',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='timestamp_unix', full_name='servidor_validacao.ResultadoTimestamp.timestamp_unix', index=0,
-      number=1, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='timestamp_iso', full_name='servidor_validacao.ResultadoTimestamp.timestamp_iso', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='timestamp_formatado', full_name='servidor_validacao.ResultadoTimestamp.timestamp_formatado', index=2,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='ano', full_name='servidor_validacao.ResultadoTimestamp.ano', index=3,
-      number=4, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='mes', full_name='servidor_validacao.ResultadoTimestamp.mes', index=4,
-      number=5, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='dia', full_name='servidor_validacao.ResultadoTimestamp.dia', index=5,
-      number=6, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='hora', full_name='servidor_validacao.ResultadoTimestamp.hora', index=6,
-      number=7, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='minuto', full_name='servidor_validacao.ResultadoTimestamp.minuto', index=7,
-      number=8, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='segundo', full_name='servidor_validacao.ResultadoTimestamp.segundo', index=8,
-      number=9, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='microsegundo', full_name='servidor_validacao.ResultadoTimestamp.microsegundo', index=9,
-      number=10, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1424,
-  serialized_end=1628,
-)
-
-
-_STATUSSERVIDOR_ESTATISTICASBANCOENTRY = _descriptor.Descriptor(
-  name='EstatisticasBancoEntry',
-  full_name='servidor_validacao.StatusServidor.EstatisticasBancoEntry',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='key', full_name='servidor_validacao.StatusServidor.EstatisticasBancoEntry.key', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='value', full_name='servidor_validacao.StatusServidor.EstatisticasBancoEntry.value', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=b'8\001',
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1995,
-  serialized_end=2051,
-)
-
-_STATUSSERVIDOR_SESSOESDETALHESENTRY = _descriptor.Descriptor(
-  name='SessoesDetalhesEntry',
-  full_name='servidor_validacao.StatusServidor.SessoesDetalhesEntry',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='key', full_name='servidor_validacao.StatusServidor.SessoesDetalhesEntry.key', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='value', full_name='servidor_validacao.StatusServidor.SessoesDetalhesEntry.value', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=b'8\001',
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2053,
-  serialized_end=2107,
-)
-
-_STATUSSERVIDOR_METRICASENTRY = _descriptor.Descriptor(
-  name='MetricasEntry',
-  full_name='servidor_validacao.StatusServidor.MetricasEntry',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='key', full_name='servidor_validacao.StatusServidor.MetricasEntry.key', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='value', full_name='servidor_validacao.StatusServidor.MetricasEntry.value', index=1,
-      number=2, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=b'8\001',
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2109,
-  serialized_end=2156,
-)
-
-_STATUSSERVIDOR = _descriptor.Descriptor(
-  name='StatusServidor',
-  full_name='servidor_validacao.StatusServidor',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='status', full_name='servidor_validacao.StatusServidor.status', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='operacoes_processadas', full_name='servidor_validacao.StatusServidor.operacoes_processadas', index=1,
-      number=2, type=3, cpp_type=2, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='sessoes_ativas', full_name='servidor_validacao.StatusServidor.sessoes_ativas', index=2,
-      number=3, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='tempo_ativo', full_name='servidor_validacao.StatusServidor.tempo_ativo', index=3,
-      number=4, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='versao', full_name='servidor_validacao.StatusServidor.versao', index=4,
-      number=5, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='estatisticas_banco', full_name='servidor_validacao.StatusServidor.estatisticas_banco', index=5,
-      number=6, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='sessoes_detalhes', full_name='servidor_validacao.StatusServidor.sessoes_detalhes', index=6,
-      number=7, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='metricas', full_name='servidor_validacao.StatusServidor.metricas', index=7,
-      number=8, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[_STATUSSERVIDOR_ESTATISTICASBANCOENTRY, _STATUSSERVIDOR_SESSOESDETALHESENTRY, _STATUSSERVIDOR_METRICASENTRY, ],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1631,
-  serialized_end=2156,
-)
-
-
-_INFOSERVIDOR = _descriptor.Descriptor(
-  name='InfoServidor',
-  full_name='servidor_validacao.InfoServidor',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='nome', full_name='servidor_validacao.InfoServidor.nome', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='versao', full_name='servidor_validacao.InfoServidor.versao', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='host', full_name='servidor_validacao.InfoServidor.host', index=2,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='port', full_name='servidor_validacao.InfoServidor.port', index=3,
-      number=4, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='protocolo', full_name='servidor_validacao.InfoServidor.protocolo', index=4,
-      number=5, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='formato', full_name='servidor_validacao.InfoServidor.formato', index=5,
-      number=6, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='operacoes_disponiveis', full_name='servidor_validacao.InfoServidor.operacoes_disponiveis', index=6,
-      number=7, type=9, cpp_type=9, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='total_operacoes', full_name='servidor_validacao.InfoServidor.total_operacoes', index=7,
-      number=8, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2159,
-  serialized_end=2323,
-)
-
-
-_HISTORICOOPERACAO_PARAMETROSENTRY = _descriptor.Descriptor(
-  name='ParametrosEntry',
-  full_name='servidor_validacao.HistoricoOperacao.ParametrosEntry',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='key', full_name='servidor_validacao.HistoricoOperacao.ParametrosEntry.key', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='value', full_name='servidor_validacao.HistoricoOperacao.ParametrosEntry.value', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=b'8\001',
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=572,
-  serialized_end=621,
-)
-
-_HISTORICOOPERACAO_RESULTADOENTRY = _descriptor.Descriptor(
-  name='ResultadoEntry',
-  full_name='servidor_validacao.HistoricoOperacao.ResultadoEntry',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='key', full_name='servidor_validacao.HistoricoOperacao.ResultadoEntry.key', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='value', full_name='servidor_validacao.HistoricoOperacao.ResultadoEntry.value', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=b'8\001',
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2600,
-  serialized_end=2648,
-)
-
-_HISTORICOOPERACAO = _descriptor.Descriptor(
-  name='HistoricoOperacao',
-  full_name='servidor_validacao.HistoricoOperacao',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='operacao', full_name='servidor_validacao.HistoricoOperacao.operacao', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='parametros', full_name='servidor_validacao.HistoricoOperacao.parametros', index=1,
-      number=2, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='resultado', full_name='servidor_validacao.HistoricoOperacao.resultado', index=2,
-      number=3, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='timestamp', full_name='servidor_validacao.HistoricoOperacao.timestamp', index=3,
-      number=4, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='sucesso', full_name='servidor_validacao.HistoricoOperacao.sucesso', index=4,
-      number=5, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[_HISTORICOOPERACAO_PARAMETROSENTRY, _HISTORICOOPERACAO_RESULTADOENTRY, ],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2326,
-  serialized_end=2648,
-)
-
-
-_HISTORICOALUNO = _descriptor.Descriptor(
-  name='HistoricoAluno',
-  full_name='servidor_validacao.HistoricoAluno',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='aluno_id', full_name='servidor_validacao.HistoricoAluno.aluno_id', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='operacoes', full_name='servidor_validacao.HistoricoAluno.operacoes', index=1,
-      number=2, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='total', full_name='servidor_validacao.HistoricoAluno.total', index=2,
-      number=3, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2650,
-  serialized_end=2757,
-)
-
-_REQUISICAO.fields_by_name['auth'].message_type = _COMANDOAUTH
-_REQUISICAO.fields_by_name['operacao'].message_type = _COMANDOOPERACAO
-_REQUISICAO.fields_by_name['info'].message_type = _COMANDOINFO
-_REQUISICAO.fields_by_name['logout'].message_type = _COMANDOLOGOUT
-_REQUISICAO.oneofs_by_name['tipo'].fields.append(
-  _REQUISICAO.fields_by_name['auth'])
-_REQUISICAO.fields_by_name['auth'].containing_oneof = _REQUISICAO.oneofs_by_name['tipo']
-_REQUISICAO.oneofs_by_name['tipo'].fields.append(
-  _REQUISICAO.fields_by_name['operacao'])
-_REQUISICAO.fields_by_name['operacao'].containing_oneof = _REQUISICAO.oneofs_by_name['tipo']
-_REQUISICAO.oneofs_by_name['tipo'].fields.append(
-  _REQUISICAO.fields_by_name['info'])
-_REQUISICAO.fields_by_name['info'].containing_oneof = _REQUISICAO.oneofs_by_name['tipo']
-_REQUISICAO.oneofs_by_name['tipo'].fields.append(
-  _REQUISICAO.fields_by_name['logout'])
-_REQUISICAO.fields_by_name['logout'].containing_oneof = _REQUISICAO.oneofs_by_name['tipo']
-_RESPOSTA.fields_by_name['ok'].message_type = _RESPOSTAOK
-_RESPOSTA.fields_by_name['erro'].message_type = _RESPOSTAERRO
-_RESPOSTA.oneofs_by_name['tipo'].fields.append(
-  _RESPOSTA.fields_by_name['ok'])
-_RESPOSTA.fields_by_name['ok'].containing_oneof = _RESPOSTA.oneofs_by_name['tipo']
-_RESPOSTA.oneofs_by_name['tipo'].fields.append(
-  _RESPOSTA.fields_by_name['erro'])
-_RESPOSTA.fields_by_name['erro'].containing_oneof = _RESPOSTA.oneofs_by_name['tipo']
-_COMANDOOPERACAO_PARAMETROSENTRY.containing_type = _COMANDOOPERACAO
-_COMANDOOPERACAO.fields_by_name['parametros'].message_type = _COMANDOOPERACAO_PARAMETROSENTRY
-_RESPOSTAOK_DADOSENTRY.containing_type = _RESPOSTAOK
-_RESPOSTAOK.fields_by_name['dados'].message_type = _RESPOSTAOK_DADOSENTRY
-_RESPOSTAERRO_DETALHESENTRY.containing_type = _RESPOSTAERRO
-_RESPOSTAERRO.fields_by_name['detalhes'].message_type = _RESPOSTAERRO_DETALHESENTRY
-_STATUSSERVIDOR_ESTATISTICASBANCOENTRY.containing_type = _STATUSSERVIDOR
-_STATUSSERVIDOR_SESSOESDETALHESENTRY.containing_type = _STATUSSERVIDOR
-_STATUSSERVIDOR_METRICASENTRY.containing_type = _STATUSSERVIDOR
-_STATUSSERVIDOR.fields_by_name['estatisticas_banco'].message_type = _STATUSSERVIDOR_ESTATISTICASBANCOENTRY
-_STATUSSERVIDOR.fields_by_name['sessoes_detalhes'].message_type = _STATUSSERVIDOR_SESSOESDETALHESENTRY
-_STATUSSERVIDOR.fields_by_name['metricas'].message_type = _STATUSSERVIDOR_METRICASENTRY
-_HISTORICOOPERACAO_PARAMETROSENTRY.containing_type = _HISTORICOOPERACAO
-_HISTORICOOPERACAO_RESULTADOENTRY.containing_type = _HISTORICOOPERACAO
-_HISTORICOOPERACAO.fields_by_name['parametros'].message_type = _HISTORICOOPERACAO_PARAMETROSENTRY
-_HISTORICOOPERACAO.fields_by_name['resultado'].message_type = _HISTORICOOPERACAO_RESULTADOENTRY
-_HISTORICOALUNO.fields_by_name['operacoes'].message_type = _HISTORICOOPERACAO
-DESCRIPTOR.message_types_by_name['Requisicao'] = _REQUISICAO
-DESCRIPTOR.message_types_by_name['Resposta'] = _RESPOSTA
-DESCRIPTOR.message_types_by_name['ComandoAuth'] = _COMANDOAUTH
-DESCRIPTOR.message_types_by_name['ComandoOperacao'] = _COMANDOOPERACAO
-DESCRIPTOR.message_types_by_name['ComandoInfo'] = _COMANDOINFO
-DESCRIPTOR.message_types_by_name['ComandoLogout'] = _COMANDOLOGOUT
-DESCRIPTOR.message_types_by_name['RespostaOk'] = _RESPOSTAOK
-DESCRIPTOR.message_types_by_name['RespostaErro'] = _RESPOSTAERRO
-DESCRIPTOR.message_types_by_name['DadosAuth'] = _DADOSAUTH
-DESCRIPTOR.message_types_by_name['ResultadoEcho'] = _RESULTADOECHO
-DESCRIPTOR.message_types_by_name['ResultadoSoma'] = _RESULTADOSOMA
-DESCRIPTOR.message_types_by_name['ResultadoTimestamp'] = _RESULTADOTIMESTAMP
-DESCRIPTOR.message_types_by_name['StatusServidor'] = _STATUSSERVIDOR
-DESCRIPTOR.message_types_by_name['InfoServidor'] = _INFOSERVIDOR
-DESCRIPTOR.message_types_by_name['HistoricoOperacao'] = _HISTORICOOPERACAO
-DESCRIPTOR.message_types_by_name['HistoricoAluno'] = _HISTORICOALUNO
-_sym_db.RegisterFileDescriptor(DESCRIPTOR)
-
-Requisicao = _reflection.GeneratedProtocolMessageType('Requisicao', (_message.Message,), {
-  'DESCRIPTOR' : _REQUISICAO,
-  '__module__' : 'mensagens_pb2'
-  # @@protoc_insertion_point(class_scope:servidor_validacao.Requisicao)
-  })
-_sym_db.RegisterMessage(Requisicao)
-
-Resposta = _reflection.GeneratedProtocolMessageType('Resposta', (_message.Message,), {
-  'DESCRIPTOR' : _RESPOSTA,
-  '__module__' : 'mensagens_pb2'
-  # @@protoc_insertion_point(class_scope:servidor_validacao.Resposta)
-  })
-_sym_db.RegisterMessage(Resposta)
-
-ComandoAuth = _reflection.GeneratedProtocolMessageType('ComandoAuth', (_message.Message,), {
-  'DESCRIPTOR' : _COMANDOAUTH,
-  '__module__' : 'mensagens_pb2'
-  # @@protoc_insertion_point(class_scope:servidor_validacao.ComandoAuth)
-  })
-_sym_db.RegisterMessage(ComandoAuth)
-
-ComandoOperacao = _reflection.GeneratedProtocolMessageType('ComandoOperacao', (_message.Message,), {
-
-  'ParametrosEntry' : _reflection.GeneratedProtocolMessageType('ParametrosEntry', (_message.Message,), {
-    'DESCRIPTOR' : _COMANDOOPERACAO_PARAMETROSENTRY,
-    '__module__' : 'mensagens_pb2'
-    # @@protoc_insertion_point(class_scope:servidor_validacao.ComandoOperacao.ParametrosEntry)
-    })
-  ,
-  'DESCRIPTOR' : _COMANDOOPERACAO,
-  '__module__' : 'mensagens_pb2'
-  # @@protoc_insertion_point(class_scope:servidor_validacao.ComandoOperacao)
-  })
-_sym_db.RegisterMessage(ComandoOperacao)
-_sym_db.RegisterMessage(ComandoOperacao.ParametrosEntry)
-
-ComandoInfo = _reflection.GeneratedProtocolMessageType('ComandoInfo', (_message.Message,), {
-  'DESCRIPTOR' : _COMANDOINFO,
-  '__module__' : 'mensagens_pb2'
-  # @@protoc_insertion_point(class_scope:servidor_validacao.ComandoInfo)
-  })
-_sym_db.RegisterMessage(ComandoInfo)
-
-ComandoLogout = _reflection.GeneratedProtocolMessageType('ComandoLogout', (_message.Message,), {
-  'DESCRIPTOR' : _COMANDOLOGOUT,
-  '__module__' : 'mensagens_pb2'
-  # @@protoc_insertion_point(class_scope:servidor_validacao.ComandoLogout)
-  })
-_sym_db.RegisterMessage(ComandoLogout)
-
-RespostaOk = _reflection.GeneratedProtocolMessageType('RespostaOk', (_message.Message,), {
-
-  'DadosEntry' : _reflection.GeneratedProtocolMessageType('DadosEntry', (_message.Message,), {
-    'DESCRIPTOR' : _RESPOSTAOK_DADOSENTRY,
-    '__module__' : 'mensagens_pb2'
-    # @@protoc_insertion_point(class_scope:servidor_validacao.RespostaOk.DadosEntry)
-    })
-  ,
-  'DESCRIPTOR' : _RESPOSTAOK,
-  '__module__' : 'mensagens_pb2'
-  # @@protoc_insertion_point(class_scope:servidor_validacao.RespostaOk)
-  })
-_sym_db.RegisterMessage(RespostaOk)
-_sym_db.RegisterMessage(RespostaOk.DadosEntry)
-
-RespostaErro = _reflection.GeneratedProtocolMessageType('RespostaErro', (_message.Message,), {
-
-  'DetalhesEntry' : _reflection.GeneratedProtocolMessageType('DetalhesEntry', (_message.Message,), {
-    'DESCRIPTOR' : _RESPOSTAERRO_DETALHESENTRY,
-    '__module__' : 'mensagens_pb2'
-    # @@protoc_insertion_point(class_scope:servidor_validacao.RespostaErro.DetalhesEntry)
-    })
-  ,
-  'DESCRIPTOR' : _RESPOSTAERRO,
-  '__module__' : 'mensagens_pb2'
-  # @@protoc_insertion_point(class_scope:servidor_validacao.RespostaErro)
-  })
-_sym_db.RegisterMessage(RespostaErro)
-_sym_db.RegisterMessage(RespostaErro.DetalhesEntry)
-
-DadosAuth = _reflection.GeneratedProtocolMessageType('DadosAuth', (_message.Message,), {
-  'DESCRIPTOR' : _DADOSAUTH,
-  '__module__' : 'mensagens_pb2'
-  # @@protoc_insertion_point(class_scope:servidor_validacao.DadosAuth)
-  })
-_sym_db.RegisterMessage(DadosAuth)
-
-ResultadoEcho = _reflection.GeneratedProtocolMessageType('ResultadoEcho', (_message.Message,), {
-  'DESCRIPTOR' : _RESULTADOECHO,
-  '__module__' : 'mensagens_pb2'
-  # @@protoc_insertion_point(class_scope:servidor_validacao.ResultadoEcho)
-  })
-_sym_db.RegisterMessage(ResultadoEcho)
-
-ResultadoSoma = _reflection.GeneratedProtocolMessageType('ResultadoSoma', (_message.Message,), {
-  'DESCRIPTOR' : _RESULTADOSOMA,
-  '__module__' : 'mensagens_pb2'
-  # @@protoc_insertion_point(class_scope:servidor_validacao.ResultadoSoma)
-  })
-_sym_db.RegisterMessage(ResultadoSoma)
-
-ResultadoTimestamp = _reflection.GeneratedProtocolMessageType('ResultadoTimestamp', (_message.Message,), {
-  'DESCRIPTOR' : _RESULTADOTIMESTAMP,
-  '__module__' : 'mensagens_pb2'
-  # @@protoc_insertion_point(class_scope:servidor_validacao.ResultadoTimestamp)
-  })
-_sym_db.RegisterMessage(ResultadoTimestamp)
-
-StatusServidor = _reflection.GeneratedProtocolMessageType('StatusServidor', (_message.Message,), {
-
-  'EstatisticasBancoEntry' : _reflection.GeneratedProtocolMessageType('EstatisticasBancoEntry', (_message.Message,), {
-    'DESCRIPTOR' : _STATUSSERVIDOR_ESTATISTICASBANCOENTRY,
-    '__module__' : 'mensagens_pb2'
-    # @@protoc_insertion_point(class_scope:servidor_validacao.StatusServidor.EstatisticasBancoEntry)
-    })
-  ,
-
-  'SessoesDetalhesEntry' : _reflection.GeneratedProtocolMessageType('SessoesDetalhesEntry', (_message.Message,), {
-    'DESCRIPTOR' : _STATUSSERVIDOR_SESSOESDETALHESENTRY,
-    '__module__' : 'mensagens_pb2'
-    # @@protoc_insertion_point(class_scope:servidor_validacao.StatusServidor.SessoesDetalhesEntry)
-    })
-  ,
-
-  'MetricasEntry' : _reflection.GeneratedProtocolMessageType('MetricasEntry', (_message.Message,), {
-    'DESCRIPTOR' : _STATUSSERVIDOR_METRICASENTRY,
-    '__module__' : 'mensagens_pb2'
-    # @@protoc_insertion_point(class_scope:servidor_validacao.StatusServidor.MetricasEntry)
-    })
-  ,
-  'DESCRIPTOR' : _STATUSSERVIDOR,
-  '__module__' : 'mensagens_pb2'
-  # @@protoc_insertion_point(class_scope:servidor_validacao.StatusServidor)
-  })
-_sym_db.RegisterMessage(StatusServidor)
-_sym_db.RegisterMessage(StatusServidor.EstatisticasBancoEntry)
-_sym_db.RegisterMessage(StatusServidor.SessoesDetalhesEntry)
-_sym_db.RegisterMessage(StatusServidor.MetricasEntry)
-
-InfoServidor = _reflection.GeneratedProtocolMessageType('InfoServidor', (_message.Message,), {
-  'DESCRIPTOR' : _INFOSERVIDOR,
-  '__module__' : 'mensagens_pb2'
-  # @@protoc_insertion_point(class_scope:servidor_validacao.InfoServidor)
-  })
-_sym_db.RegisterMessage(InfoServidor)
-
-HistoricoOperacao = _reflection.GeneratedProtocolMessageType('HistoricoOperacao', (_message.Message,), {
-
-  'ParametrosEntry' : _reflection.GeneratedProtocolMessageType('ParametrosEntry', (_message.Message,), {
-    'DESCRIPTOR' : _HISTORICOOPERACAO_PARAMETROSENTRY,
-    '__module__' : 'mensagens_pb2'
-    # @@protoc_insertion_point(class_scope:servidor_validacao.HistoricoOperacao.ParametrosEntry)
-    })
-  ,
-
-  'ResultadoEntry' : _reflection.GeneratedProtocolMessageType('ResultadoEntry', (_message.Message,), {
-    'DESCRIPTOR' : _HISTORICOOPERACAO_RESULTADOENTRY,
-    '__module__' : 'mensagens_pb2'
-    # @@protoc_insertion_point(class_scope:servidor_validacao.HistoricoOperacao.ResultadoEntry)
-    })
-  ,
-  'DESCRIPTOR' : _HISTORICOOPERACAO,
-  '__module__' : 'mensagens_pb2'
-  # @@protoc_insertion_point(class_scope:servidor_validacao.HistoricoOperacao)
-  })
-_sym_db.RegisterMessage(HistoricoOperacao)
-_sym_db.RegisterMessage(HistoricoOperacao.ParametrosEntry)
-_sym_db.RegisterMessage(HistoricoOperacao.ResultadoEntry)
-
-HistoricoAluno = _reflection.GeneratedProtocolMessageType('HistoricoAluno', (_message.Message,), {
-  'DESCRIPTOR' : _HISTORICOALUNO,
-  '__module__' : 'mensagens_pb2'
-  # @@protoc_insertion_point(class_scope:servidor_validacao.HistoricoAluno)
-  })
-_sym_db.RegisterMessage(HistoricoAluno)
-
-
-_COMANDOOPERACAO_PARAMETROSENTRY._options = None
-_RESPOSTAOK_DADOSENTRY._options = None
-_RESPOSTAERRO_DETALHESENTRY._options = None
-_STATUSSERVIDOR_ESTATISTICASBANCOENTRY._options = None
-_STATUSSERVIDOR_SESSOESDETALHESENTRY._options = None
-_STATUSSERVIDOR_METRICASENTRY._options = None
-_HISTORICOOPERACAO_PARAMETROSENTRY._options = None
-_HISTORICOOPERACAO_RESULTADOENTRY._options = None
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0fmensagens.proto\x12\x12servidor_validacao\"\x95\x02\n\nRequisicao\x12/\n\x04\x61uth\x18\x01 \x01(\x0b\x32\x1f.servidor_validacao.ComandoAuthH\x00\x12\x37\n\x08operacao\x18\x02 \x01(\x0b\x32#.servidor_validacao.ComandoOperacaoH\x00\x12/\n\x04info\x18\x03 \x01(\x0b\x32\x1f.servidor_validacao.ComandoInfoH\x00\x12\x33\n\x06logout\x18\x04 \x01(\x0b\x32!.servidor_validacao.ComandoLogoutH\x00\x12/\n\x04lote\x18\x05 \x01(\x0b\x32\x1f.servidor_validacao.ComandoLoteH\x00\x42\x06\n\x04tipo\"\xa4\x01\n\x08Resposta\x12,\n\x02ok\x18\x01 \x01(\x0b\x32\x1e.servidor_validacao.RespostaOkH\x00\x12\x30\n\x04\x65rro\x18\x02 \x01(\x0b\x32 .servidor_validacao.RespostaErroH\x00\x12\x30\n\x04lote\x18\x03 \x01(\x0b\x32 .servidor_validacao.RespostaLoteH\x00\x42\x06\n\x04tipo\":\n\x0b\x43omandoAuth\x12\x10\n\x08\x61luno_id\x18\x01 \x01(\t\x12\x19\n\x11timestamp_cliente\x18\x02 \x01(\t\"\xcf\x01\n\x0f\x43omandoOperacao\x12\r\n\x05token\x18\x01 \x01(\t\x12\x10\n\x08operacao\x18\x02 \x01(\t\x12G\n\nparametros\x18\x03 \x03(\x0b\x32\x33.servidor_validacao.ComandoOperacao.ParametrosEntry\x12\x0f\n\x07numeros\x18\x04 \x03(\x01\x12\x0e\n\x06tipado\x18\x05 \x01(\x08\x1a\x31\n\x0fParametrosEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"T\n\x0b\x43omandoLote\x12\r\n\x05token\x18\x01 \x01(\t\x12\x36\n\toperacoes\x18\x02 \x03(\x0b\x32#.servidor_validacao.ComandoOperacao\"\x1b\n\x0b\x43omandoInfo\x12\x0c\n\x04tipo\x18\x01 \x01(\t\"\x1e\n\rComandoLogout\x12\r\n\x05token\x18\x01 \x01(\t\"\xc1\x03\n\nRespostaOk\x12\x0f\n\x07\x63omando\x18\x01 \x01(\t\x12\x38\n\x05\x64\x61\x64os\x18\x02 \x03(\x0b\x32).servidor_validacao.RespostaOk.DadosEntry\x12\x11\n\ttimestamp\x18\x03 \x01(\t\x12\x31\n\x04\x65\x63ho\x18\x04 \x01(\x0b\x32!.servidor_validacao.ResultadoEchoH\x00\x12\x31\n\x04soma\x18\x05 \x01(\x0b\x32!.servidor_validacao.ResultadoSomaH\x00\x12\x45\n\x13resultado_timestamp\x18\x06 \x01(\x0b\x32&.servidor_validacao.ResultadoTimestampH\x00\x12\x34\n\x06status\x18\x07 \x01(\x0b\x32\".servidor_validacao.StatusServidorH\x00\x12\x37\n\thistorico\x18\x08 \x01(\x0b\x32\".servidor_validacao.HistoricoAlunoH\x00\x1a,\n\nDadosEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x42\x0b\n\tresultado\"?\n\x0cRespostaLote\x12/\n\trespostas\x18\x01 \x03(\x0b\x32\x1c.servidor_validacao.Resposta\"\xb7\x01\n\x0cRespostaErro\x12\x0f\n\x07\x63omando\x18\x01 \x01(\t\x12\x10\n\x08mensagem\x18\x02 \x01(\t\x12\x11\n\ttimestamp\x18\x03 \x01(\t\x12@\n\x08\x64\x65talhes\x18\x04 \x03(\x0b\x32..servidor_validacao.RespostaErro.DetalhesEntry\x1a/\n\rDetalhesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"h\n\tDadosAuth\x12\r\n\x05token\x18\x01 \x01(\t\x12\x0c\n\x04nome\x18\x02 \x01(\t\x12\x11\n\tmatricula\x18\x03 \x01(\t\x12\x11\n\ttimestamp\x18\x04 \x01(\t\x12\x18\n\x10timeout_segundos\x18\x05 \x01(\x03\"\x88\x01\n\rResultadoEcho\x12\x19\n\x11mensagem_original\x18\x01 \x01(\t\x12\x14\n\x0cmensagem_eco\x18\x02 \x01(\t\x12\x10\n\x08hash_md5\x18\x03 \x01(\t\x12\x18\n\x10tamanho_mensagem\x18\x04 \x01(\x05\x12\x1a\n\x12timestamp_servidor\x18\x05 \x01(\t\"\x96\x01\n\rResultadoSoma\x12\x19\n\x11numeros_originais\x18\x01 \x03(\x01\x12\x12\n\nquantidade\x18\x02 \x01(\x05\x12\x0c\n\x04soma\x18\x03 \x01(\x01\x12\r\n\x05media\x18\x04 \x01(\x01\x12\x0e\n\x06maximo\x18\x05 \x01(\x01\x12\x0e\n\x06minimo\x18\x06 \x01(\x01\x12\x19\n\x11timestamp_calculo\x18\x07 \x01(\t\"\xcc\x01\n\x12ResultadoTimestamp\x12\x16\n\x0etimestamp_unix\x18\x01 \x01(\x01\x12\x15\n\rtimestamp_iso\x18\x02 \x01(\t\x12\x1b\n\x13timestamp_formatado\x18\x03 \x01(\t\x12\x0b\n\x03\x61no\x18\x04 \x01(\x05\x12\x0b\n\x03mes\x18\x05 \x01(\x05\x12\x0b\n\x03\x64ia\x18\x06 \x01(\x05\x12\x0c\n\x04hora\x18\x07 \x01(\x05\x12\x0e\n\x06minuto\x18\x08 \x01(\x05\x12\x0f\n\x07segundo\x18\t \x01(\x05\x12\x14\n\x0cmicrosegundo\x18\n \x01(\x05\"\x8d\x04\n\x0eStatusServidor\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x1d\n\x15operacoes_processadas\x18\x02 \x01(\x03\x12\x16\n\x0esessoes_ativas\x18\x03 \x01(\x05\x12\x13\n\x0btempo_ativo\x18\x04 \x01(\x01\x12\x0e\n\x06versao\x18\x05 \x01(\t\x12U\n\x12\x65statisticas_banco\x18\x06 \x03(\x0b\x32\x39.servidor_validacao.StatusServidor.EstatisticasBancoEntry\x12Q\n\x10sessoes_detalhes\x18\x07 \x03(\x0b\x32\x37.servidor_validacao.StatusServidor.SessoesDetalhesEntry\x12\x42\n\x08metricas\x18\x08 \x03(\x0b\x32\x30.servidor_validacao.StatusServidor.MetricasEntry\x1a\x38\n\x16\x45statisticasBancoEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1a\x36\n\x14SessoesDetalhesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1a/\n\rMetricasEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x01:\x02\x38\x01\"\xa4\x01\n\x0cInfoServidor\x12\x0c\n\x04nome\x18\x01 \x01(\t\x12\x0e\n\x06versao\x18\x02 \x01(\t\x12\x0c\n\x04host\x18\x03 \x01(\t\x12\x0c\n\x04port\x18\x04 \x01(\x05\x12\x11\n\tprotocolo\x18\x05 \x01(\t\x12\x0f\n\x07\x66ormato\x18\x06 \x01(\t\x12\x1d\n\x15operacoes_disponiveis\x18\x07 \x03(\t\x12\x17\n\x0ftotal_operacoes\x18\x08 \x01(\x05\"\xc2\x02\n\x11HistoricoOperacao\x12\x10\n\x08operacao\x18\x01 \x01(\t\x12I\n\nparametros\x18\x02 \x03(\x0b\x32\x35.servidor_validacao.HistoricoOperacao.ParametrosEntry\x12G\n\tresultado\x18\x03 \x03(\x0b\x32\x34.servidor_validacao.HistoricoOperacao.ResultadoEntry\x12\x11\n\ttimestamp\x18\x04 \x01(\t\x12\x0f\n\x07sucesso\x18\x05 \x01(\x08\x1a\x31\n\x0fParametrosEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1a\x30\n\x0eResultadoEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"k\n\x0eHistoricoAluno\x12\x10\n\x08\x61luno_id\x18\x01 \x01(\t\x12\x38\n\toperacoes\x18\x02 \x03(\x0b\x32%.servidor_validacao.HistoricoOperacao\x12\r\n\x05total\x18\x03 \x01(\x05\x62\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'mensagens_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _COMANDOOPERACAO_PARAMETROSENTRY._options = None
+  _COMANDOOPERACAO_PARAMETROSENTRY._serialized_options = b'8\001'
+  _RESPOSTAOK_DADOSENTRY._options = None
+  _RESPOSTAOK_DADOSENTRY._serialized_options = b'8\001'
+  _RESPOSTAERRO_DETALHESENTRY._options = None
+  _RESPOSTAERRO_DETALHESENTRY._serialized_options = b'8\001'
+  _STATUSSERVIDOR_ESTATISTICASBANCOENTRY._options = None
+  _STATUSSERVIDOR_ESTATISTICASBANCOENTRY._serialized_options = b'8\001'
+  _STATUSSERVIDOR_SESSOESDETALHESENTRY._options = None
+  _STATUSSERVIDOR_SESSOESDETALHESENTRY._serialized_options = b'8\001'
+  _STATUSSERVIDOR_METRICASENTRY._options = None
+  _STATUSSERVIDOR_METRICASENTRY._serialized_options = b'8\001'
+  _HISTORICOOPERACAO_PARAMETROSENTRY._options = None
+  _HISTORICOOPERACAO_PARAMETROSENTRY._serialized_options = b'8\001'
+  _HISTORICOOPERACAO_RESULTADOENTRY._options = None
+  _HISTORICOOPERACAO_RESULTADOENTRY._serialized_options = b'8\001'
+  _REQUISICAO._serialized_start=40
+  _REQUISICAO._serialized_end=317
+  _RESPOSTA._serialized_start=320
+  _RESPOSTA._serialized_end=484
+  _COMANDOAUTH._serialized_start=486
+  _COMANDOAUTH._serialized_end=544
+  _COMANDOOPERACAO._serialized_start=547
+  _COMANDOOPERACAO._serialized_end=754
+  _COMANDOOPERACAO_PARAMETROSENTRY._serialized_start=705
+  _COMANDOOPERACAO_PARAMETROSENTRY._serialized_end=754
+  _COMANDOLOTE._serialized_start=756
+  _COMANDOLOTE._serialized_end=840
+  _COMANDOINFO._serialized_start=842
+  _COMANDOINFO._serialized_end=869
+  _COMANDOLOGOUT._serialized_start=871
+  _COMANDOLOGOUT._serialized_end=901
+  _RESPOSTAOK._serialized_start=904
+  _RESPOSTAOK._serialized_end=1353
+  _RESPOSTAOK_DADOSENTRY._serialized_start=1296
+  _RESPOSTAOK_DADOSENTRY._serialized_end=1340
+  _RESPOSTALOTE._serialized_start=1355
+  _RESPOSTALOTE._serialized_end=1418
+  _RESPOSTAERRO._serialized_start=1421
+  _RESPOSTAERRO._serialized_end=1604
+  _RESPOSTAERRO_DETALHESENTRY._serialized_start=1557
+  _RESPOSTAERRO_DETALHESENTRY._serialized_end=1604
+  _DADOSAUTH._serialized_start=1606
+  _DADOSAUTH._serialized_end=1710
+  _RESULTADOECHO._serialized_start=1713
+  _RESULTADOECHO._serialized_end=1849
+  _RESULTADOSOMA._serialized_start=1852
+  _RESULTADOSOMA._serialized_end=2002
+  _RESULTADOTIMESTAMP._serialized_start=2005
+  _RESULTADOTIMESTAMP._serialized_end=2209
+  _STATUSSERVIDOR._serialized_start=2212
+  _STATUSSERVIDOR._serialized_end=2737
+  _STATUSSERVIDOR_ESTATISTICASBANCOENTRY._serialized_start=2576
+  _STATUSSERVIDOR_ESTATISTICASBANCOENTRY._serialized_end=2632
+  _STATUSSERVIDOR_SESSOESDETALHESENTRY._serialized_start=2634
+  _STATUSSERVIDOR_SESSOESDETALHESENTRY._serialized_end=2688
+  _STATUSSERVIDOR_METRICASENTRY._serialized_start=2690
+  _STATUSSERVIDOR_METRICASENTRY._serialized_end=2737
+  _INFOSERVIDOR._serialized_start=2740
+  _INFOSERVIDOR._serialized_end=2904
+  _HISTORICOOPERACAO._serialized_start=2907
+  _HISTORICOOPERACAO._serialized_end=3229
+  _HISTORICOOPERACAO_PARAMETROSENTRY._serialized_start=705
+  _HISTORICOOPERACAO_PARAMETROSENTRY._serialized_end=754
+  _HISTORICOOPERACAO_RESULTADOENTRY._serialized_start=3181
+  _HISTORICOOPERACAO_RESULTADOENTRY._serialized_end=3229
+  _HISTORICOALUNO._serialized_start=3231
+  _HISTORICOALUNO._serialized_end=3338
 # @@protoc_insertion_point(module_scope)
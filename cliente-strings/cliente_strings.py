@@ -1,168 +1,117 @@
-import socket
+import os
+import sys
 from datetime import datetime
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from comum.enquadramento import DecodificadorLinhas, LeitorLinhas
+from comum.modelos import Modelos
+from comum.nucleo import ClienteBase, Codec
+from comum.rastreio import RastreioTerminal
+from comum.texto import analisar, campos, literal, montar
+from comum.vetores import texto_numeros
 
-class ClienteStrings:
-    
-    def __init__(self, host: str, port: int = 8080, timeout: int = 30):
-        self.host = host
-        self.port = port
-        self.timeout = timeout
-        self.socket = None
-        self.token = None
-        
-    def conectar(self):
-        """Estabelece conexão TCP"""
-        self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.socket.settimeout(self.timeout)
-        self.socket.connect((self.host, self.port))
-        print(f"Conectado a {self.host}:{self.port}")
-    
-    def desconectar(self):
-        """Fecha conexão"""
-        if self.socket:
-            self.socket.close()
-            print("Desconectado")
-    
-    def enviar(self, mensagem):
-        """Envia mensagem ao servidor"""
+
+class CodecStrings(Codec):
+    """Protocolo de strings: TIPO|chave=valor|...|FIM, uma mensagem por linha"""
+    
+    Leitor = LeitorLinhas
+    Decodificador = DecodificadorLinhas
+    
+    def __init__(self, escapes=False):
+        self.usar_modelos = True
+        self.pedir_escapes = escapes
+        self.escapes = False  # só depois que o servidor aceitar no AUTH
+        self.modelos = Modelos(self.prefixo_operacao)
+    
+    def codificar(self, mensagem):
+        """Mensagem em bytes, terminada em '\\n'"""
+        if isinstance(mensagem, bytes):
+            return mensagem  # já montada a partir do modelo
         if not mensagem.endswith('\n'):
             mensagem += '\n'
-        self.socket.sendall(mensagem.encode('utf-8'))
-        print(f"\n{'─'*60}")
-        print(f"📤 ENVIANDO:")
-        print(f"{mensagem.strip()}")
-        print('─'*60)
+        return mensagem.encode('utf-8')
     
-    def receber(self):
-        """Recebe resposta do servidor"""
-        dados = b''
-        self.socket.settimeout(2)
-        tentativas = 0
-        
-        while tentativas < 20:
-            try:
-                chunk = self.socket.recv(4096)
-                if not chunk:
-                    break
-                dados += chunk
-                if b'\n' in dados:
-                    break
-                tentativas += 1
-            except socket.timeout:
-                if dados:
-                    break
-                tentativas += 1
-        
-        resposta = dados.decode('utf-8').strip()
-        return resposta
+    def decodificar(self, dados):
+        """Linha recebida (sem o '\\n') em texto"""
+        return dados.decode('utf-8').strip()
     
     def parsear(self, resposta):
-        """Faz parsing da resposta e exibe formatado"""
-        if resposta.endswith('|FIM'):
-            resposta = resposta[:-4]
-        
-        resultado = {}
-        partes = resposta.split('|')
-        
-        if partes:
-            resultado['tipo'] = partes[0]
-        
-        for parte in partes[1:]:
-            if '=' in parte:
-                chave, valor = parte.split('=', 1)
-                resultado[chave] = valor
-
-        """print(f"\n{'─'*60}")
-        print(f"📥 RESPOSTA:")
-        print(f"Tipo: {resultado.get('tipo', 'N/A')}")
-        
-        if resultado.get('tipo') == 'OK':
-            for chave, valor in resultado.items():
-                if chave != 'tipo' and len(valor) < 100:
-                    print(f"{chave}: {valor}")
-        elif resultado.get('tipo') == 'ERROR':
-            print(f"Erro: {resultado.get('msg', 'Erro desconhecido')}")
-        
-        print('─'*60)"""
-        
-        return resultado
+        """Faz parsing da resposta (com escapes se combinados no AUTH)"""
+        return analisar(resposta, self.escapes)
     
-    def autenticar(self, aluno_id):
-        """Autentica no servidor"""
+    def mensagem_auth(self, aluno_id):
+        """Monta a mensagem AUTH"""
         timestamp = datetime.now().isoformat()
-        mensagem = f"AUTH|aluno_id={aluno_id}|timestamp={timestamp}|FIM"
-        
-        self.enviar(mensagem)
-        resposta = self.receber()
-        dados = self.parsear(resposta)
+        campos = {"aluno_id": aluno_id, "timestamp": timestamp}
+        if self.pedir_escapes:
+            campos["escapes"] = "1"
+        return montar("AUTH", campos)
+    
+    def interpretar_auth(self, resposta):
+        """Token da sessão se a autenticação deu certo"""
+        dados = analisar(resposta)  # a resposta do AUTH nunca vem escapada
         
         if dados.get('tipo') == 'OK':
-            self.token = dados.get('token')
+            # Servidor que não conhece o campo ignora o pedido: segue sem escapes
+            self.escapes = self.pedir_escapes and dados.get('escapes') == '1'
             print(f"\nAutenticado como {dados.get('nome')}")
-            return True
+            return dados.get('token')
         print(f"✗ Erro: {dados.get('msg', 'Erro desconhecido')}")
-        return False
+        return None
     
-    def operacao(self, nome, **params):
-        """Executa uma operação genérica"""
-        if not self.token:
-            print("Não autenticado")
-            return None
-        
-        msg = f"OP|token={self.token}|operacao={nome}"
-        for k, v in params.items():
-            msg += f"|{k}={v}"
-        msg += "|FIM"
-        
-        self.enviar(msg)
-        resposta = self.receber()
+    def mensagem_operacao(self, token, nome, parametros):
+        """Monta a mensagem OP: prefixo pré-codificado da sessão + campos variáveis"""
+        if not self.usar_modelos:
+            return montar("OP", {"token": token, "operacao": nome, **parametros}, self.escapes)
+        prefixo = self.modelos.prefixo(token, nome)
+        return prefixo + f"{campos(parametros, self.escapes)}|FIM\n".encode('utf-8')
+    
+    def prefixo_operacao(self, token, nome):
+        """Início fixo da mensagem OP de uma operação"""
+        return f"OP{campos({'token': token, 'operacao': nome}, self.escapes)}".encode('utf-8')
+    
+    def interpretar_operacao(self, resposta):
+        """Converte a resposta de uma operação no resultado"""
         dados = self.parsear(resposta)
         
         if dados.get('tipo') == 'OK':
             return dados
-        print(f"Erro: {dados.get('msg', 'Erro desconhecido')}")
+        self.ultimo_erro = dados.get('msg', 'Erro desconhecido')
+        print(f"Erro: {self.ultimo_erro}")
         return None
     
-    def echo(self, mensagem):
-        """Operação ECHO"""
-        return self.operacao("echo", mensagem=mensagem)
+    def mensagem_logout(self, token):
+        """Monta a mensagem LOGOUT"""
+        return montar("LOGOUT", {"token": token}, self.escapes)
     
-    def soma(self, numeros):
-        """Operação SOMA"""
-        # Tenta formato de lista Python
-        numeros_str = str(numeros)
-        return self.operacao("soma", nums=numeros_str)
-    
-    def timestamp(self):
-        """Operação TIMESTAMP"""
-        return self.operacao("timestamp")
-    
-    def status(self, detalhado=False):
-        """Operação STATUS"""
-        if detalhado:
-            return self.operacao("status", detalhado="true")
-        return self.operacao("status")
-    
-    def historico(self, limite=10):
-        """Operação HISTÓRICO"""
-        return self.operacao("historico", limite=str(limite))
-    
-    def logout(self):
-        """Encerra sessão"""
-        if not self.token:
-            return False
-        
-        msg = f"LOGOUT|token={self.token}|FIM"
-        self.enviar(msg)
-        resposta = self.receber()
-        dados = self.parsear(resposta)
-        
-        if dados.get('tipo') == 'OK':
+    def interpretar_logout(self, resposta):
+        """True se o logout deu certo"""
+        if self.parsear(resposta).get('tipo') == 'OK':
             print("Logout realizado")
-            self.token = None
             return True
         return False
+    
+    def parametros(self, nome, valores):
+        """Campos do protocolo: nums em formato de lista Python, status só com detalhado=true"""
+        if nome == 'soma':
+            # Montado numa passada
+            return {'nums': f"[{texto_numeros(valores['numeros'], ', ')}]"}
+        if nome == 'status':
+            return {'detalhado': 'true'} if valores['detalhado'] else {}
+        if nome == 'historico':
+            return {'limite': str(valores['limite'])}
+        return valores
+
+
+class ClienteStrings(ClienteBase):
+    
+    def __init__(self, host: str, port: int = 8080, timeout: int = 30, rastreio=None,
+                 perfil=None, escapes=False):
+        super().__init__(host, port, timeout, rastreio, CodecStrings(escapes), perfil)
+    
+    def parsear(self, resposta):
+        """Faz parsing da resposta"""
+        return self.codec.parsear(resposta)
 
 
 def main():
@@ -171,10 +120,10 @@ def main():
     print("CLIENTE PROTOCOLO STRINGS")
     print("="*50)
     
-    host = "3.88.99.255"
+    host = os.environ.get("SERVIDORES", "3.88.99.255")  # réplicas: "h1:porta,h2:porta"
     aluno_id = input("Matrícula: ").strip()
     
-    cliente = ClienteStrings(host)
+    cliente = ClienteStrings(host, rastreio=RastreioTerminal())
     
     try:
         cliente.conectar()
@@ -196,7 +145,11 @@ def main():
                     
             elif opcao == "2":
                 nums = input("Números (separados por vírgula): ")
-                resultado = cliente.soma(nums)
+                try:
+                    resultado = cliente.soma(nums)
+                except ValueError:  # texto que não é lista de números: avisa e segue no menu
+                    print(f"Erro: números inválidos: {nums}")
+                    continue
                 if resultado and resultado.get('tipo') == 'OK':
                     print(f"\nSoma: {resultado.get('soma')}")
                     print(f"Média: {resultado.get('media')}")
@@ -224,15 +177,14 @@ def main():
                         # Extrai nomes dos alunos ativos
                         sessoes = resultado.get('sessoes_detalhes', '')
                         if sessoes and '{' in sessoes:
-                            import ast
                             try:
-                                sessoes_dict = ast.literal_eval(sessoes)
+                                sessoes_dict = literal(sessoes)
                                 print(f"\nAlunos ativos:")
                                 for matricula, dados in sessoes_dict.items():
                                     nome = dados.get('nome', 'N/A')
                                     ip = dados.get('ip_cliente', 'N/A')
                                     print(f"    • {nome} (Mat: {matricula})")
-                            except:
+                            except ValueError:
                                 pass
                     
             elif opcao == "5":
@@ -250,8 +202,7 @@ def main():
                     estat = resultado.get('estatisticas')
                     if estat:
                         try:
-                            import ast
-                            estat = ast.literal_eval(estat)
+                            estat = literal(estat)
                             print("Estatísticas:")
                             print(f"Total de operações: {estat.get('total_operacoes', 'N/A')}")
                             print(f"Sucesso: {estat.get('operacoes_sucesso', 'N/A')}")
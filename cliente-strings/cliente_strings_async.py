@@ -0,0 +1,11 @@
+import os
+import sys
+
+from cliente_strings import ClienteStrings
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from comum.assincrono import ClienteAsync
+
+
+class ClienteStringsAsync(ClienteAsync, ClienteStrings):
+    """ClienteStrings sobre asyncio: mesmas operações, todas aguardáveis"""
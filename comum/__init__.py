@@ -0,0 +1,19 @@
+"""
+Código compartilhado pelos três clientes (strings, JSON e Protocol Buffers)
+"""
+
+import os
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Os diretórios dos clientes têm hífen no nome e não são pacotes
+DIRETORIOS_CLIENTES = ('cliente-strings', 'cliente-json', 'cliente-protobuf')
+
+
+def registrar_clientes():
+    """Torna os módulos dos três clientes importáveis"""
+    for diretorio in DIRETORIOS_CLIENTES:
+        caminho = os.path.join(RAIZ, diretorio)
+        if caminho not in sys.path:
+            sys.path.insert(0, caminho)
@@ -0,0 +1,201 @@
+"""
+Base asyncio dos clientes
+
+ClienteAsync é combinado com a classe síncrona de cada protocolo (o núcleo
+ClienteBase com o codec do protocolo), que continua dona da montagem, da
+serialização e da interpretação das mensagens. Daqui vêm só o transporte e o
+casamento das respostas, na ordem de envio.
+
+Os bytes recebidos caem direto no BufferRecepcao do decodificador de
+enquadramento (asyncio.BufferedProtocol), o mesmo usado pelos clientes
+síncronos. Várias operações podem ser aguardadas ao mesmo tempo na mesma
+conexão (asyncio.gather): cada uma ocupa uma posição na fila de respostas.
+"""
+
+import asyncio
+import time
+from collections import deque
+
+from comum.captura import ENVIO, RECEBIMENTO
+from comum.metricas import Medicao
+from comum.nucleo import itens_lote
+from comum.rastreio import ENVIADO, RECEBIDO
+
+
+class ProtocoloCliente(asyncio.BufferedProtocol):
+    """Recebe bytes no buffer do decodificador e entrega cada mensagem completa"""
+
+    def __init__(self, decodificador, ao_receber, ao_fechar):
+        self.decodificador = decodificador
+        self.ao_receber = ao_receber
+        self.ao_fechar = ao_fechar
+        self.primeiro_byte = None  # instante em que chegou o início do quadro em curso
+
+    def get_buffer(self, sizehint):
+        return self.decodificador.buffer.livre(max(sizehint, 4096))
+
+    def buffer_updated(self, nbytes):
+        agora = time.perf_counter()
+        if self.primeiro_byte is None:
+            self.primeiro_byte = agora
+        self.decodificador.buffer.confirmar(nbytes)
+        quadro = self.decodificador.extrair()
+        while quadro is not None:
+            self.ao_receber(quadro, self.primeiro_byte, agora)
+            # Os quadros seguintes deste segmento começaram a chegar agora
+            self.primeiro_byte = agora
+            quadro = self.decodificador.extrair()
+        if not len(self.decodificador.buffer):
+            self.primeiro_byte = None
+
+    def connection_lost(self, exc):
+        self.ao_fechar(exc)
+
+
+class ClienteAsync:
+    """Transporte asyncio para os clientes; vem antes da classe síncrona na herança"""
+
+    transporte = None
+
+    async def conectar(self):
+        """Estabelece conexão TCP (com várias réplicas, com a primeira que responder)"""
+        loop = asyncio.get_running_loop()
+        self.pendentes = deque()
+        # Opções aplicadas antes do connect, como no cliente síncrono (o
+        # transporte do asyncio liga TCP_NODELAY de qualquer forma)
+        sock, self.endpoint = await self.balanceador.conectar_async(
+            self.perfil, self.perfil.prazo_conexao(self.timeout))
+        self.host, self.port = self.endpoint
+        if self.captura is not None:
+            self.conexao_captura = self.captura.nova_conexao()
+        try:
+            self.transporte, _ = await loop.create_connection(
+                lambda: ProtocoloCliente(self.codec.Decodificador(), self._entregar, self._conexao_perdida),
+                sock=sock)
+        except BaseException:
+            sock.close()
+            raise
+
+    async def desconectar(self):
+        """Fecha conexão"""
+        if self.transporte:
+            self.transporte.close()
+            self.transporte = None
+        if self.endpoint:
+            self.balanceador.desconectou(self.endpoint)
+            self.endpoint = None
+
+    async def requisitar(self, mensagem, medicao=None):
+        """Envia uma mensagem e aguarda a resposta correspondente"""
+        if self.transporte is None or self.transporte.is_closing():
+            raise ConnectionError("Conexão fechada")
+        futuro = asyncio.get_running_loop().create_future()
+        self.pendentes.append((futuro, medicao))
+        dados = self.codificar(mensagem)
+        if medicao:
+            medicao.serializado = time.perf_counter()
+        self.transporte.write(dados)
+        if medicao:
+            medicao.enviado = time.perf_counter()
+        if self.captura is not None:
+            self.captura.registrar(self.conexao_captura, ENVIO, dados)
+        if self.rastreio.ativo:
+            self.rastreio.registrar(ENVIADO, mensagem)
+        enviado = time.perf_counter()
+        # Se o tempo esgotar o futuro fica na fila e absorve a própria resposta
+        resposta = await asyncio.wait_for(futuro, self.perfil.prazo_leitura(self.timeout))
+        self.balanceador.registrar(self.endpoint, time.perf_counter() - enviado)
+        return resposta
+
+    async def requisitar_varias(self, mensagens, medicao=None):
+        """Envia várias mensagens numa escrita só e aguarda todas as respostas"""
+        if self.transporte is None or self.transporte.is_closing():
+            raise ConnectionError("Conexão fechada")
+        loop = asyncio.get_running_loop()
+        futuros = [loop.create_future() for _ in mensagens]
+        # A mesma medição nas respostas: primeiro byte da primeira, último da última
+        self.pendentes.extend([(futuro, medicao) for futuro in futuros])
+        dados = b''.join([self.codificar(mensagem) for mensagem in mensagens])
+        if medicao:
+            medicao.serializado = time.perf_counter()
+        self.transporte.write(dados)
+        if medicao:
+            medicao.enviado = time.perf_counter()
+        if self.captura is not None:
+            self.captura.registrar(self.conexao_captura, ENVIO, dados)
+        if self.rastreio.ativo:
+            for mensagem in mensagens:
+                self.rastreio.registrar(ENVIADO, mensagem)
+        return await asyncio.wait_for(asyncio.gather(*futuros), self.perfil.prazo_leitura(self.timeout))
+
+    def _entregar(self, quadro, primeiro_byte, ultimo_byte):
+        if self.captura is not None:
+            self.captura.registrar(self.conexao_captura, RECEBIMENTO, self.codec.Decodificador.enquadrar(quadro))
+        resposta = self.decodificar(quadro)
+        if self.rastreio.ativo:
+            self.rastreio.registrar(RECEBIDO, resposta)
+        if not self.pendentes:
+            return  # mensagem que ninguém pediu
+        futuro, medicao = self.pendentes.popleft()
+        if medicao:
+            if medicao.primeiro_byte is None:
+                medicao.primeiro_byte = primeiro_byte
+            medicao.ultimo_byte = ultimo_byte
+        if not futuro.done():
+            futuro.set_result(resposta)
+
+    def _conexao_perdida(self, exc):
+        erro = exc or ConnectionError("Conexão fechada pelo servidor")
+        while self.pendentes:
+            futuro, _ = self.pendentes.popleft()
+            if not futuro.done():
+                futuro.set_exception(erro)
+
+    async def autenticar(self, aluno_id):
+        """Autentica no servidor"""
+        return self.interpretar_auth(await self.requisitar(self.mensagem_auth(aluno_id)))
+
+    async def operacao(self, nome, parametros=None, **params):
+        """Executa uma operação genérica (parâmetros em dict ou nomeados)"""
+        if not self.token:
+            print("Não autenticado")
+            return None
+        if params:
+            parametros = {**(parametros or {}), **params}
+        medicao = Medicao(nome)
+        mensagem = self.mensagem_operacao(nome, parametros)
+        resultado = self.interpretar_operacao(await self.requisitar(mensagem, medicao))
+        self.metricas.registrar(medicao.concluir())
+        return resultado
+
+    async def batch(self, operacoes):
+        """Várias operações numa ida e volta; resultados na ordem"""
+        if not self.token:
+            print("Não autenticado")
+            return None
+        itens = itens_lote(self.codec, operacoes)
+        if not itens:
+            return []
+        medicao = Medicao("batch")
+        if self.codec.usar_lote():
+            resultados = self.codec.interpretar_lote(
+                await self.requisitar(self.codec.mensagem_lote(self.token, itens), medicao))
+            if resultados is not None:
+                self.metricas.registrar(medicao.concluir())
+                return resultados
+            # Servidor sem quadro de lote: repete com as requisições avulsas
+            medicao = Medicao("batch")
+        respostas = await self.requisitar_varias(
+            [self.mensagem_operacao(nome, parametros) for nome, parametros in itens], medicao)
+        resultados = [self.interpretar_operacao(resposta) for resposta in respostas]
+        self.metricas.registrar(medicao.concluir())
+        return resultados
+
+    async def logout(self):
+        """Encerra sessão"""
+        if not self.token:
+            return False
+        return self.interpretar_logout(await self.requisitar(self.mensagem_logout()))
+
+    def pipeline(self, profundidade=16):
+        raise TypeError("No cliente asyncio use asyncio.gather para manter várias operações em voo")
@@ -0,0 +1,255 @@
+"""
+Cache de STATUS com TTL e relógio do servidor estimado para TIMESTAMP
+
+Painéis que consultam status() e timestamp() o tempo todo pagam uma ida e
+volta por consulta. ClienteCache envolve um cliente (síncrono ou asyncio):
+
+- status (básico e detalhado) fica em cache por `ttl` segundos; depois
+  disso, durante `janela_obsoleta`, o valor antigo é devolvido na hora e
+  atualizado em segundo plano (stale-while-revalidate);
+- timestamp() é respondido localmente a partir do deslocamento entre o
+  relógio monotônico local e o do servidor, estimado como no NTP com os
+  instantes de envio e recepção, e ressincronizado a cada `ressincronizar`
+  segundos.
+
+    cliente = ClienteCache(ClienteJSON(host), ttl=2, janela_obsoleta=10)
+"""
+
+import asyncio
+import functools
+import inspect
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta, timezone
+
+
+class RelogioServidor:
+    """Relógio do servidor estimado a partir de idas e voltas do TIMESTAMP
+
+    Para cada amostra, com envio e recepção no relógio monotônico local:
+    deslocamento = t_servidor - (envio + recepção) / 2, com erro de no
+    máximo (recepção - envio) / 2. Vale a amostra de menor atraso entre as
+    últimas, como no filtro de relógio do NTP.
+    """
+
+    def __init__(self, amostras: int = 8):
+        self.amostras = deque(maxlen=amostras)
+        self.fuso = timedelta(0)
+        self.nome_fuso = ''
+        self.sincronizado_em = None
+
+    def registrar(self, resultado, envio, recepcao):
+        """Guarda uma amostra; False se o resultado não traz timestamp_unix"""
+        try:
+            servidor = float(resultado['timestamp_unix'])
+        except (KeyError, TypeError, ValueError):
+            return False
+        self.amostras.append((recepcao - envio, servidor - (envio + recepcao) / 2))
+        self.sincronizado_em = recepcao
+        # Fuso do servidor: hora local dele (timestamp_iso) menos o UTC do mesmo instante
+        try:
+            local = datetime.fromisoformat(str(resultado['timestamp_iso'])).replace(tzinfo=None)
+            utc = datetime.fromtimestamp(servidor, timezone.utc).replace(tzinfo=None)
+            self.fuso = timedelta(minutes=round((local - utc).total_seconds() / 60))
+        except (KeyError, ValueError):
+            pass
+        self.nome_fuso = str(resultado.get('timezone', self.nome_fuso))
+        return True
+
+    @property
+    def sincronizado(self):
+        return bool(self.amostras)
+
+    @property
+    def deslocamento(self):
+        """Segundos a somar ao time.monotonic() local para obter o relógio do servidor"""
+        return min(self.amostras)[1]
+
+    @property
+    def incerteza(self):
+        """Meio atraso da melhor amostra: limite do erro da estimativa, em segundos"""
+        return min(self.amostras)[0] / 2
+
+    def desvio_local(self):
+        """Relógio do servidor menos o relógio de parede local, em segundos"""
+        return self.agora() - time.time()
+
+    def agora(self):
+        return time.monotonic() + self.deslocamento
+
+    def resultado(self):
+        """Mesmos campos da operação TIMESTAMP, calculados localmente"""
+        instante = self.agora()
+        local = datetime.fromtimestamp(instante, timezone.utc).replace(tzinfo=None) + self.fuso
+        return {
+            'timestamp_unix': instante,
+            'timestamp_iso': local.isoformat(),
+            'timestamp_formatado': local.strftime('%d/%m/%Y %H:%M:%S'),
+            'timezone': self.nome_fuso,
+            'ano': local.year,
+            'mes': local.month,
+            'dia': local.day,
+            'hora': local.hour,
+            'minuto': local.minute,
+            'segundo': local.second,
+            'microsegundo': local.microsecond,
+            'estimado': True,
+            'incerteza_ms': self.incerteza * 1000,
+        }
+
+
+class ClienteCache:
+    """Envolve um cliente com cache de status e relógio local para timestamp
+
+    Num cliente síncrono as chamadas feitas através do envoltório são
+    serializadas por uma trava, para a atualização em segundo plano (numa
+    thread) não se misturar com elas; dentro de um pipeline ela é adiada.
+    """
+
+    def __init__(self, cliente, ttl: float = 5.0, janela_obsoleta: float = 30.0,
+                 ressincronizar: float = 300.0, rajada: int = 3):
+        self.cliente = cliente
+        self.ttl = ttl
+        self.janela_obsoleta = janela_obsoleta
+        self.ressincronizar = ressincronizar
+        self.rajada = rajada  # amostras na primeira sincronização
+        self.relogio = RelogioServidor()
+        self.assincrono = inspect.iscoroutinefunction(cliente.operacao)
+        self.trava = threading.RLock()
+        self.entradas = {}        # detalhado -> (resultado, instante monotônico)
+        self.atualizando = set()
+        self.contadores = {'acertos': 0, 'obsoletos': 0, 'faltas': 0,
+                           'timestamp_local': 0, 'sincronizacoes': 0}
+
+    def __getattr__(self, nome):
+        atributo = getattr(self.cliente, nome)
+        if self.assincrono or not callable(atributo):
+            return atributo
+
+        @functools.wraps(atributo)
+        def travado(*args, **kwargs):
+            with self.trava:
+                return atributo(*args, **kwargs)
+        return travado
+
+    # STATUS
+
+    def status(self, detalhado=False):
+        """Operação STATUS através do cache"""
+        detalhado = bool(detalhado)
+        entrada = self.entradas.get(detalhado)
+        if entrada is not None:
+            idade = time.monotonic() - entrada[1]
+            if idade < self.ttl:
+                self.contadores['acertos'] += 1
+                return self._pronto(entrada[0])
+            if idade < self.ttl + self.janela_obsoleta:
+                self.contadores['obsoletos'] += 1
+                self._revalidar(detalhado)
+                return self._pronto(entrada[0])
+        self.contadores['faltas'] += 1
+        if self.assincrono:
+            return self._buscar_status_async(detalhado)
+        with self.trava:
+            return self._guardar(detalhado, self.cliente.status(detalhado))
+
+    def invalidar(self):
+        """Descarta os status em cache"""
+        self.entradas.clear()
+
+    def _guardar(self, detalhado, resultado):
+        if isinstance(resultado, dict):
+            self.entradas[detalhado] = (resultado, time.monotonic())
+        return resultado
+
+    async def _buscar_status_async(self, detalhado):
+        return self._guardar(detalhado, await self.cliente.status(detalhado))
+
+    def _revalidar(self, detalhado):
+        """Atualiza em segundo plano uma entrada vencida (uma por vez)"""
+        if detalhado in self.atualizando:
+            return
+        self.atualizando.add(detalhado)
+        if self.assincrono:
+            asyncio.ensure_future(self._revalidar_async(detalhado))
+        else:
+            threading.Thread(target=self._revalidar_thread, args=(detalhado,), daemon=True).start()
+
+    async def _revalidar_async(self, detalhado):
+        try:
+            await self._buscar_status_async(detalhado)
+        except (OSError, asyncio.TimeoutError):
+            pass  # continua servindo o valor antigo até a janela acabar
+        finally:
+            self.atualizando.discard(detalhado)
+
+    def _revalidar_thread(self, detalhado):
+        try:
+            # Ocupado ou em pipeline: tenta de novo na próxima consulta obsoleta
+            if not self.trava.acquire(blocking=False):
+                return
+            try:
+                if self.cliente.pipeline_ativo is None:
+                    self._guardar(detalhado, self.cliente.status(detalhado))
+            finally:
+                self.trava.release()
+        except (OSError, ValueError):
+            pass
+        finally:
+            self.atualizando.discard(detalhado)
+
+    # TIMESTAMP
+
+    def timestamp(self):
+        """Operação TIMESTAMP: relógio estimado, ressincronizado periodicamente"""
+        if self._precisa_sincronizar():
+            if self.assincrono:
+                return self._sincronizar_async()
+            with self.trava:
+                return self._sincronizar()
+        self.contadores['timestamp_local'] += 1
+        return self._pronto(self.relogio.resultado())
+
+    def _precisa_sincronizar(self):
+        return (not self.relogio.sincronizado
+                or time.monotonic() - self.relogio.sincronizado_em >= self.ressincronizar)
+
+    def _sincronizar(self):
+        """Amostra o relógio do servidor (rajada na primeira vez); devolve a resposta real"""
+        vezes = 1 if self.relogio.sincronizado else self.rajada
+        resultado = None
+        for _ in range(vezes):
+            envio = time.monotonic()
+            resultado = self.cliente.timestamp()
+            if not isinstance(resultado, dict) or not self.relogio.registrar(resultado, envio, time.monotonic()):
+                return resultado  # erro, pipeline ou servidor sem timestamp_unix
+        self.contadores['sincronizacoes'] += 1
+        return resultado
+
+    async def _sincronizar_async(self):
+        vezes = 1 if self.relogio.sincronizado else self.rajada
+        resultado = None
+        for _ in range(vezes):
+            envio = time.monotonic()
+            resultado = await self.cliente.timestamp()
+            if not isinstance(resultado, dict) or not self.relogio.registrar(resultado, envio, time.monotonic()):
+                return resultado
+        self.contadores['sincronizacoes'] += 1
+        return resultado
+
+    def metricas_cache(self):
+        """Contadores do cache e estado do relógio estimado"""
+        metricas = dict(self.contadores)
+        if self.relogio.sincronizado:
+            metricas['desvio_local_ms'] = self.relogio.desvio_local() * 1000
+            metricas['incerteza_ms'] = self.relogio.incerteza * 1000
+        return metricas
+
+    def _pronto(self, valor):
+        if not self.assincrono:
+            return valor
+
+        async def pronto():
+            return valor
+        return pronto()
@@ -0,0 +1,129 @@
+"""
+Captura do tráfego dos clientes: bytes enquadrados, com instante, por conexão
+
+Grava exatamente o que enviar() mandou e receber() leu (respostas
+enquadradas de novo, como vieram no fio) num arquivo binário compacto, para
+medir depois o parser e o codec contra tráfego real ou reproduzir a sessão
+no servidor local.
+
+    with Gravador("producao.cap.gz", "json") as gravador:
+        cliente = gravador.anexar(ClienteJSON(host))
+        ...
+
+Formato: cabeçalho (MAGICA, versão, instante Unix do início, nome do
+protocolo) e, por mensagem, [direção 1 B][conexão 4 B][µs desde o início
+8 B][tamanho 4 B][bytes]. Com ".gz" no nome o arquivo sai comprimido.
+
+`python benchmark/reproducao.py` lê, decodifica e reproduz as capturas.
+"""
+
+import gzip
+import struct
+import threading
+import time
+from collections import namedtuple
+
+MAGICA = b'CAPT'
+VERSAO = 1
+CABECALHO = struct.Struct('!4sBdB')  # mágica, versão, início, tamanho do nome do protocolo
+REGISTRO = struct.Struct('!BIQI')   # direção, conexão, µs desde o início, tamanho
+
+ENVIO = 0
+RECEBIMENTO = 1
+
+Registro = namedtuple('Registro', 'direcao conexao instante dados')  # instante em segundos
+
+
+def _abrir(caminho, modo):
+    # Nível 1: comprime bem o texto repetitivo dos protocolos sem pesar na gravação
+    if caminho.endswith('.gz'):
+        return gzip.open(caminho, modo, compresslevel=1) if 'w' in modo else gzip.open(caminho, modo)
+    return open(caminho, modo)
+
+
+class Gravador:
+    """Grava as mensagens de um ou mais clientes do mesmo protocolo
+
+    Cada conexão (inclusive as reconexões) recebe um número próprio. Pode ser
+    compartilhado entre threads.
+    """
+
+    def __init__(self, caminho: str, protocolo: str):
+        self.caminho = caminho
+        self.protocolo = protocolo
+        self.arquivo = _abrir(caminho, 'wb')
+        self.inicio = time.monotonic()
+        nome = protocolo.encode('utf-8')
+        self.arquivo.write(CABECALHO.pack(MAGICA, VERSAO, time.time(), len(nome)) + nome)
+        self.conexoes = 0
+        self.registros = 0
+        self.trava = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+        return False
+
+    def anexar(self, cliente):
+        """Passa a gravar o tráfego do cliente a partir da próxima conexão"""
+        cliente.captura = self
+        return cliente
+
+    def nova_conexao(self):
+        with self.trava:
+            self.conexoes += 1
+            return self.conexoes
+
+    def registrar(self, conexao, direcao, dados):
+        instante = int((time.monotonic() - self.inicio) * 1e6)
+        with self.trava:
+            self.arquivo.write(REGISTRO.pack(direcao, conexao, instante, len(dados)))
+            self.arquivo.write(dados)
+            self.registros += 1
+
+    def fechar(self):
+        with self.trava:
+            self.arquivo.close()
+
+
+class LeitorCaptura:
+    """Percorre os registros de uma captura, na ordem em que foram gravados"""
+
+    def __init__(self, caminho: str):
+        self.caminho = caminho
+        with _abrir(caminho, 'rb') as arquivo:
+            self.protocolo, self.inicio, self.tamanho_cabecalho = _ler_cabecalho(arquivo)
+
+    def __iter__(self):
+        with _abrir(self.caminho, 'rb') as arquivo:
+            arquivo.read(self.tamanho_cabecalho)
+            while cabecalho := arquivo.read(REGISTRO.size):
+                if len(cabecalho) < REGISTRO.size:
+                    return  # gravação interrompida no meio de um registro
+                direcao, conexao, instante, tamanho = REGISTRO.unpack(cabecalho)
+                dados = arquivo.read(tamanho)
+                if len(dados) < tamanho:
+                    return
+                yield Registro(direcao, conexao, instante / 1e6, dados)
+
+    def por_conexao(self):
+        """{conexão: [registros]} (carrega a captura inteira na memória)"""
+        conexoes = {}
+        for registro in self:
+            conexoes.setdefault(registro.conexao, []).append(registro)
+        return conexoes
+
+
+def _ler_cabecalho(arquivo):
+    fixo = arquivo.read(CABECALHO.size)
+    if len(fixo) < CABECALHO.size:
+        raise ValueError("Arquivo de captura vazio ou truncado")
+    magica, versao, inicio, tamanho_nome = CABECALHO.unpack(fixo)
+    if magica != MAGICA:
+        raise ValueError("Não é um arquivo de captura")
+    if versao != VERSAO:
+        raise ValueError(f"Versão de captura não suportada: {versao}")
+    protocolo = arquivo.read(tamanho_nome).decode('utf-8')
+    return protocolo, inicio, CABECALHO.size + tamanho_nome
@@ -0,0 +1,236 @@
+"""
+Codecs JSON intercambiáveis para o cliente JSON
+
+orjson (opcional, em Rust) quando instalado; senão o json da biblioteca
+padrão. Os dois codificam para bytes UTF-8 e decodificam bytes. O orjson
+recorre ao json padrão nos casos que não aceita (inteiros acima de 64 bits
+na saída, NaN/Infinity na entrada) e quando o objeto tem NaN/Infinity, que
+ele gravaria como null.
+
+Conferência de conformidade (ida e volta e equivalência com o json padrão)
+sobre o tráfego real do servidor local, ou de uma captura, e casos-limite:
+
+    python -m comum.codec_json
+    python -m comum.codec_json --captura producao.cap.gz
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+
+try:
+    import orjson
+except ImportError:  # orjson é opcional
+    orjson = None
+
+
+class CodecStdlib:
+    """json da biblioteca padrão"""
+
+    nome = 'json'
+
+    def codificar(self, objeto):
+        return json.dumps(objeto, ensure_ascii=False).encode('utf-8')
+
+    def decodificar(self, dados):
+        return json.loads(dados)
+
+
+class CodecOrjson:
+    """orjson, com o json padrão de reserva"""
+
+    nome = 'orjson'
+
+    def codificar(self, objeto):
+        try:
+            dados = orjson.dumps(objeto, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            return json.dumps(objeto, ensure_ascii=False).encode('utf-8')
+        # NaN/Infinity viram null no orjson: só com null na saída vale percorrer o objeto
+        if b'null' in dados and _nao_finito(objeto):
+            return json.dumps(objeto, ensure_ascii=False).encode('utf-8')
+        return dados
+
+    def decodificar(self, dados):
+        try:
+            return orjson.loads(dados)
+        except orjson.JSONDecodeError:
+            return json.loads(bytes(dados) if isinstance(dados, memoryview) else dados)
+
+
+def _nao_finito(objeto):
+    """True se houver NaN ou Infinity em algum ponto do objeto"""
+    if isinstance(objeto, float):
+        return not math.isfinite(objeto)
+    if isinstance(objeto, dict):
+        return any(_nao_finito(valor) for valor in objeto.values())
+    if isinstance(objeto, (list, tuple)):
+        return any(_nao_finito(valor) for valor in objeto)
+    return False
+
+
+CODECS = {'json': CodecStdlib}
+if orjson is not None:
+    CODECS['orjson'] = CodecOrjson
+
+
+def obter_codec(codec=None):
+    """Nome ('json', 'orjson'), instância pronta ou None para o mais rápido instalado"""
+    if codec is None:
+        return CodecOrjson() if orjson is not None else CodecStdlib()
+    if isinstance(codec, str):
+        if codec not in CODECS:
+            raise ValueError(f"Codec JSON indisponível: {codec} (instalados: {', '.join(CODECS)})")
+        return CODECS[codec]()
+    return codec
+
+
+# Conformidade
+
+# Casos-limite que o tráfego normal raramente traz
+CASOS = [
+    {"tipo": "autenticar", "aluno_id": "554576", "timestamp": "2025-11-12T14:22:00"},
+    {"tipo": "operacao", "token": "abc123", "operacao": "echo",
+     "parametros": {"mensagem": "olá, 世界 \"aspas\" \\ barra\nlinha \u0001 🎉"}},
+    {"tipo": "operacao", "operacao": "soma",
+     "parametros": {"numeros": [0.1, -2.5, 1e-300, 1.7976931348623157e308, 3, -0, 2 ** 53 + 1]}},
+    {"sucesso": True, "resultado": {"media": 0.30000000000000004, "vazio": {}, "lista": [],
+                                    "nulo": None, "falso": False}},
+    {"sucesso": False, "erro": "Token inválido", "detalhes": [[1, [2, [3, [4]]]]]},
+    {"chave_int": {1: "um"}},
+    {"numeros": [float('nan'), float('inf'), -float('inf')]},
+    [],
+    "texto",
+]
+
+# Diferença aceita: inteiros acima de 64 bits o orjson lê como float
+DIFERENCAS_CONHECIDAS = [
+    {"grande": 2 ** 70},
+]
+
+# Requisições mandadas ao servidor local: todas as operações, lote, erros e logout
+ALUNO = "554576"
+REQUISICOES = [
+    {"tipo": "operacao", "token": "invalido", "operacao": "echo", "parametros": {"mensagem": "oi"}},
+    {"tipo": "autenticar", "aluno_id": ALUNO, "timestamp": "2025-11-12T14:22:00"},
+    {"tipo": "operacao", "operacao": "echo",
+     "parametros": {"mensagem": "olá, 世界 \"aspas\" \\ barra\nlinha \u0001 🎉"}},
+    {"tipo": "operacao", "operacao": "soma", "parametros": {"numeros": [0.1, 0.2, -2.5, 1e-300, 3]}},
+    {"tipo": "operacao", "operacao": "soma", "parametros": {"numeros": [1.7976931348623157e308] * 2}},
+    {"tipo": "operacao", "operacao": "soma", "parametros": {"numeros": []}},
+    {"tipo": "operacao", "operacao": "timestamp", "parametros": {}},
+    {"tipo": "operacao", "operacao": "status", "parametros": {"detalhado": True}},
+    {"tipo": "operacao", "operacao": "historico", "parametros": {"limite": 10}},
+    {"tipo": "operacao", "operacao": "inexistente", "parametros": {}},
+    {"tipo": "lote", "operacoes": [{"operacao": "echo", "parametros": {"mensagem": "a"}},
+                                   {"operacao": "soma", "parametros": {"numeros": [1, 2]}}]},
+    {"tipo": "logout"},
+]
+
+
+def trafego_local():
+    """Linhas reais (requisições e respostas) do protocolo JSON do servidor local, sem rede"""
+    from comum import RAIZ
+    caminho = os.path.join(RAIZ, 'servidor-local')
+    if caminho not in sys.path:
+        sys.path.insert(0, caminho)
+    from servidor_local import Estado, ProtocoloJSON
+
+    estado, protocolo = Estado(), ProtocoloJSON()
+    # JSON inválido: só a resposta de erro do servidor entra
+    mensagens = [protocolo.responder(estado, b'{"tipo": "operacao"', '127.0.0.1').rstrip(b'\n')]
+    token = None
+    for requisicao in REQUISICOES:
+        if token and requisicao['tipo'] != 'autenticar':
+            requisicao = {**requisicao, "token": token}
+        linha = json.dumps(requisicao, ensure_ascii=False).encode('utf-8')
+        resposta = protocolo.responder(estado, linha, '127.0.0.1').rstrip(b'\n')
+        token = token or json.loads(resposta).get('token')
+        mensagens += [linha, resposta]
+    return mensagens
+
+
+def trafego_captura(caminho):
+    """Linhas JSON de uma captura (comum/captura.py), nas duas direções"""
+    from comum.captura import LeitorCaptura
+    leitor = LeitorCaptura(caminho)
+    if leitor.protocolo != 'json':
+        raise ValueError(f"Captura do protocolo {leitor.protocolo}, não json")
+    return [linha for registro in leitor for linha in registro.dados.split(b'\n') if linha.strip()]
+
+
+def _equivalentes(a, b):
+    if isinstance(a, float) and isinstance(b, float):
+        return a == b or (math.isnan(a) and math.isnan(b))
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(_equivalentes(a[k], b[k]) for k in a)
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(_equivalentes(x, y) for x, y in zip(a, b))
+    return a == b and type(a) is type(b)
+
+
+def conferir(codec, referencia=None, casos=CASOS, mensagens=()):
+    """Falhas de conformidade do codec em relação ao json padrão (lista vazia: ok)
+
+    `mensagens` são linhas JSON como vieram no fio: o codec precisa lê-las
+    como o json padrão e depois passar nas mesmas checagens dos casos.
+    """
+    referencia = referencia or CodecStdlib()
+    falhas = []
+    for mensagem in mensagens:
+        esperado = referencia.decodificar(mensagem)
+        if not _equivalentes(codec.decodificar(mensagem), esperado):
+            falhas.append((mensagem, "lê a mensagem do fio"))
+        else:
+            falhas += [(mensagem, descricao) for _, descricao in _conferir_objeto(codec, referencia, esperado)]
+    for caso in casos:
+        falhas += _conferir_objeto(codec, referencia, caso)
+    return falhas
+
+
+def _conferir_objeto(codec, referencia, caso):
+    esperado = referencia.decodificar(referencia.codificar(caso))
+    codificado = codec.codificar(caso)
+    if not isinstance(codificado, bytes):
+        return [(caso, "codificar não devolveu bytes")]
+    checagens = [
+        ("ida e volta", codec.decodificar(codificado)),
+        ("lido pelo json padrão", referencia.decodificar(codificado)),
+        ("lê o json padrão", codec.decodificar(referencia.codificar(caso))),
+        ("lê memoryview", codec.decodificar(memoryview(codificado))
+         if codec.nome != 'json' else esperado),
+    ]
+    return [(caso, descricao) for descricao, obtido in checagens if not _equivalentes(obtido, esperado)]
+
+
+def main():
+    """Confere todos os codecs instalados"""
+    parser = argparse.ArgumentParser(description="Conformidade dos codecs JSON")
+    parser.add_argument('--captura', help="confere o tráfego de uma captura json em vez do servidor local")
+    args = parser.parse_args()
+    mensagens = trafego_captura(args.captura) if args.captura else trafego_local()
+    origem = args.captura or "servidor local"
+
+    ok = True
+    total = len(mensagens) + len(CASOS)
+    for nome, classe in CODECS.items():
+        falhas = conferir(classe(), mensagens=mensagens)
+        erradas = len({id(c) for c, _ in falhas})
+        print(f"{'✓' if not falhas else '✗'} {nome}: {total - erradas}/{total} "
+              f"({len(mensagens)} mensagens de {origem}, {len(CASOS)} casos-limite)")
+        for caso, descricao in falhas:
+            print(f"    {descricao}: {str(caso)[:70]}")
+        ok = ok and not falhas
+    if 'orjson' not in CODECS:
+        print("  orjson não instalado: o cliente usa o json padrão")
+    for caso in DIFERENCAS_CONHECIDAS:
+        for nome, classe in CODECS.items():
+            codec = classe()
+            print(f"  (conhecido) {nome}: {caso} -> {codec.decodificar(codec.codificar(caso))}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,262 @@
+"""
+Vários endpoints por cliente: happy eyeballs, failover e balanceamento
+
+Com réplicas do servidor, o cliente recebe uma lista de endpoints em vez de
+um host só. A conexão segue a ideia do happy eyeballs (RFC 8305): tenta o
+endpoint preferido e, se ele não completar o handshake em ATRASO_TENTATIVA
+(ou recusar antes disso), dispara o próximo em paralelo; fica com o primeiro
+que responder e fecha os outros.
+
+A preferência vem do Balanceador: réplicas que falharam há pouco ficam em
+quarentena no fim da fila; entre as saudáveis ganha a de menor latência
+recente (média móvel das operações) ponderada pelas sessões já abertas nela.
+Clientes que compartilham o mesmo Balanceador se espalham pelas réplicas.
+
+    cliente = ClienteJSON("10.0.0.1:8081,10.0.0.2:8081")
+    cliente = ClienteJSON(["10.0.0.1", ("10.0.0.2", 9081)])     # porta padrão do cliente
+    replicas = Balanceador(["10.0.0.1:8081", "10.0.0.2:8081"])
+    pool = PoolSessoes(lambda: ClienteJSON(replicas), aluno_id)   # pool balanceado
+
+`python carga/failover.py` sobe réplicas locais, derruba a que está em uso e
+mede o tempo de failover.
+"""
+
+import asyncio
+import errno
+import math
+import selectors
+import socket
+import threading
+import time
+from collections import Counter
+
+ATRASO_TENTATIVA = 0.25  # RFC 8305: próxima tentativa se a anterior não respondeu
+QUARENTENA = 5.0         # segundos no fim da fila depois de uma falha
+PESO_LATENCIA = 0.2      # peso da amostra nova na média móvel
+
+# connect() em socket não bloqueante: em andamento, não é erro
+EM_ANDAMENTO = {errno.EINPROGRESS, errno.EWOULDBLOCK, getattr(errno, 'WSAEWOULDBLOCK', None)}
+
+
+def analisar_endpoints(endpoints, port=None):
+    """"h1:p1,h2" / ["h1:p1", ("h2", p2), "h3"] -> [(host, porta)]"""
+    if isinstance(endpoints, str):
+        endpoints = [parte.strip() for parte in endpoints.split(',') if parte.strip()]
+    resultado = []
+    for endpoint in endpoints:
+        if isinstance(endpoint, str):
+            host, porta = _separar_porta(endpoint)
+        else:
+            host, porta = endpoint
+        porta = porta if porta is not None else port
+        if porta is None:
+            raise ValueError(f"Endpoint sem porta: {host}")
+        resultado.append((host, int(porta)))
+    if not resultado:
+        raise ValueError("Nenhum endpoint informado")
+    return resultado
+
+
+def _separar_porta(texto):
+    """'host:porta', '[::1]:porta', '::1' ou 'host' -> (host, porta ou None)"""
+    if texto.startswith('['):
+        host, _, resto = texto[1:].partition(']')
+        return host, resto[1:] or None
+    if texto.count(':') == 1:
+        host, porta = texto.split(':')
+        return host, porta
+    return texto, None
+
+
+def rotulo(endpoint):
+    host, porta = endpoint
+    return f"[{host}]:{porta}" if ':' in host else f"{host}:{porta}"
+
+
+class Balanceador:
+    """Endpoints de um serviço com saúde, latência recente e sessões abertas
+
+    Pode ser compartilhado por vários clientes (e threads); é ele que ordena
+    as tentativas de conexão.
+    """
+
+    def __init__(self, endpoints, port: int = None, atraso: float = ATRASO_TENTATIVA,
+                 quarentena: float = QUARENTENA, peso: float = PESO_LATENCIA):
+        self.endpoints = analisar_endpoints(endpoints, port)
+        self.atraso = atraso
+        self.quarentena = quarentena
+        self.peso = peso
+        self.latencia = {}     # endpoint -> média móvel, em segundos
+        self.sessoes = Counter()
+        self.falhas = {}       # endpoint -> instante (monotônico) da última falha
+        self.trava = threading.Lock()
+
+    @classmethod
+    def de(cls, host, port=None):
+        """Balanceador pronto, ou um novo a partir de host/lista de endpoints"""
+        return host if isinstance(host, Balanceador) else cls(host, port)
+
+    def ordem(self):
+        """Endpoints na ordem de preferência para a próxima conexão"""
+        agora = time.monotonic()
+        with self.trava:
+            def chave(endpoint):
+                em_quarentena = agora - self.falhas.get(endpoint, -math.inf) < self.quarentena
+                sessoes = self.sessoes[endpoint]
+                # Sem medição ainda: 0, para que toda réplica seja experimentada
+                return em_quarentena, self.latencia.get(endpoint, 0.0) * (1 + sessoes), sessoes
+            return sorted(self.endpoints, key=chave)
+
+    def registrar(self, endpoint, segundos):
+        """Amostra de latência de uma operação concluída"""
+        with self.trava:
+            anterior = self.latencia.get(endpoint)
+            self.latencia[endpoint] = segundos if anterior is None else \
+                anterior + self.peso * (segundos - anterior)
+
+    def conectou(self, endpoint, segundos):
+        with self.trava:
+            self.sessoes[endpoint] += 1
+            self.falhas.pop(endpoint, None)
+            # O handshake só serve de estimativa até chegar a primeira operação
+            self.latencia.setdefault(endpoint, segundos)
+
+    def desconectou(self, endpoint):
+        with self.trava:
+            if self.sessoes[endpoint] > 0:
+                self.sessoes[endpoint] -= 1
+
+    def falhou(self, endpoint):
+        """Manda o endpoint para a quarentena"""
+        with self.trava:
+            self.falhas[endpoint] = time.monotonic()
+
+    def resumo(self):
+        """{endpoint: latência (ms), sessões abertas e saúde}"""
+        agora = time.monotonic()
+        with self.trava:
+            return {rotulo(e): {
+                'latencia_ms': self.latencia[e] * 1000 if e in self.latencia else None,
+                'sessoes': self.sessoes[e],
+                'saudavel': agora - self.falhas.get(e, -math.inf) >= self.quarentena,
+            } for e in self.endpoints}
+
+    # Conexão
+
+    def _tentativas(self):
+        """[(endpoint, família, endereço)] na ordem de preferência"""
+        tentativas, erros = [], []
+        for endpoint in self.ordem():
+            try:
+                enderecos = socket.getaddrinfo(*endpoint, type=socket.SOCK_STREAM)
+            except OSError as erro:
+                self.falhou(endpoint)
+                erros.append((endpoint, erro))
+                continue
+            tentativas += [(endpoint, familia, endereco) for familia, _, _, _, endereco in enderecos]
+        return tentativas, erros
+
+    def conectar(self, perfil, prazo):
+        """Socket conectado ao primeiro endpoint que responder: (socket, endpoint)"""
+        tentativas, erros = self._tentativas()
+        seletor = selectors.DefaultSelector()
+        limite = time.monotonic() + prazo
+        proxima = 0.0
+        try:
+            while tentativas or seletor.get_map():
+                agora = time.monotonic()
+                if agora >= limite:
+                    raise socket.timeout(f"Nenhum endpoint respondeu em {prazo:g} s")
+                if tentativas and (agora >= proxima or not seletor.get_map()):
+                    endpoint, familia, endereco = tentativas.pop(0)
+                    sock = socket.socket(familia, socket.SOCK_STREAM)
+                    try:
+                        perfil.aplicar(sock)
+                        sock.setblocking(False)
+                        codigo = sock.connect_ex(endereco)
+                        if codigo and codigo not in EM_ANDAMENTO:
+                            raise OSError(codigo, f"{errno.errorcode.get(codigo, codigo)} em {rotulo(endpoint)}")
+                    except OSError as erro:
+                        sock.close()
+                        self.falhou(endpoint)
+                        erros.append((endpoint, erro))
+                        continue
+                    seletor.register(sock, selectors.EVENT_WRITE, (endpoint, agora))
+                    proxima = agora + self.atraso
+                    continue
+
+                espera = limite - agora
+                if tentativas:
+                    espera = min(espera, proxima - agora)
+                for chave, _ in seletor.select(max(espera, 0)):
+                    sock, (endpoint, inicio) = chave.fileobj, chave.data
+                    seletor.unregister(sock)
+                    codigo = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                    if codigo:
+                        sock.close()
+                        self.falhou(endpoint)
+                        erros.append((endpoint, ConnectionRefusedError(codigo, f"{rotulo(endpoint)} recusou")
+                                      if codigo == errno.ECONNREFUSED else OSError(codigo, rotulo(endpoint))))
+                        proxima = 0.0  # falhou antes do atraso: a próxima sai já
+                        continue
+                    self.conectou(endpoint, time.monotonic() - inicio)
+                    sock.setblocking(True)
+                    return sock, endpoint
+        finally:
+            for chave in list(seletor.get_map().values()):
+                chave.fileobj.close()
+            seletor.close()
+        raise _erro_final(erros)
+
+    async def conectar_async(self, perfil, prazo):
+        """Como conectar(), com tarefas asyncio; o socket volta não bloqueante"""
+        return await asyncio.wait_for(self._corrida(perfil), prazo)
+
+    async def _corrida(self, perfil):
+        loop = asyncio.get_running_loop()
+        tentativas, erros = self._tentativas()
+        tarefas = {}
+
+        async def tentar(familia, endereco):
+            sock = socket.socket(familia, socket.SOCK_STREAM)
+            try:
+                perfil.aplicar(sock)
+                sock.setblocking(False)
+                await loop.sock_connect(sock, endereco)
+            except BaseException:
+                sock.close()
+                raise
+            return sock
+
+        try:
+            while tentativas or tarefas:
+                if tentativas:
+                    endpoint, familia, endereco = tentativas.pop(0)
+                    tarefa = asyncio.ensure_future(tentar(familia, endereco))
+                    tarefas[tarefa] = (endpoint, time.monotonic())
+                prontas, _ = await asyncio.wait(tarefas, timeout=self.atraso if tentativas else None,
+                                                return_when=asyncio.FIRST_COMPLETED)
+                for tarefa in prontas:
+                    endpoint, inicio = tarefas.pop(tarefa)
+                    if tarefa.exception() is not None:
+                        self.falhou(endpoint)
+                        erros.append((endpoint, tarefa.exception()))
+                        continue
+                    self.conectou(endpoint, time.monotonic() - inicio)
+                    return tarefa.result(), endpoint
+        finally:
+            # Perdedoras: cancela e fecha o que conectou no meio do caminho
+            for tarefa in tarefas:
+                tarefa.cancel()
+            for resultado in await asyncio.gather(*tarefas, return_exceptions=True):
+                if isinstance(resultado, socket.socket):
+                    resultado.close()
+        raise _erro_final(erros)
+
+
+def _erro_final(erros):
+    """O erro do único endpoint, ou um ConnectionError resumindo todos"""
+    if len(erros) == 1:
+        return erros[0][1]
+    detalhes = '; '.join(f"{rotulo(endpoint)}: {erro}" for endpoint, erro in erros)
+    return ConnectionError(f"Nenhum endpoint respondeu ({detalhes or 'lista vazia'})")
@@ -0,0 +1,184 @@
+"""
+Enquadramento das mensagens recebidas
+
+- strings e JSON: uma mensagem por linha, terminada em '\n'
+- Protocol Buffers: [4 bytes tamanho][dados binários serializados]
+
+Um buffer por conexão, reaproveitado entre leituras: os bytes que chegam
+depois do fim de uma mensagem ficam guardados para a próxima.
+"""
+
+import struct
+import time
+
+TAMANHO_BLOCO = 65536
+CABECALHO = struct.Struct('!I')
+
+
+class BufferRecepcao:
+    """bytearray reutilizável com janela de leitura [inicio, fim)"""
+
+    def __init__(self, capacidade: int = TAMANHO_BLOCO):
+        self.dados = bytearray(capacidade)
+        self.inicio = 0
+        self.fim = 0
+
+    def __len__(self):
+        return self.fim - self.inicio
+
+    def livre(self, minimo: int = 1):
+        """Janela gravável no final do buffer, compactando ou crescendo se preciso"""
+        if len(self.dados) - self.fim < minimo:
+            pendente = self.fim - self.inicio
+            if len(self.dados) - pendente >= minimo:
+                self.dados[:pendente] = self.dados[self.inicio:self.fim]
+            else:
+                # Novo bytearray em vez de redimensionar: visões antigas continuam válidas
+                novo = bytearray(max(2 * len(self.dados), pendente + minimo))
+                novo[:pendente] = self.dados[self.inicio:self.fim]
+                self.dados = novo
+            self.inicio, self.fim = 0, pendente
+        return memoryview(self.dados)[self.fim:]
+
+    def confirmar(self, n: int):
+        """Marca n bytes gravados na janela devolvida por livre()"""
+        self.fim += n
+
+    def alimentar(self, dados):
+        """Copia bytes já recebidos para o buffer"""
+        n = len(dados)
+        with self.livre(n) as janela:
+            janela[:n] = dados
+        self.fim += n
+
+    def consumir(self, n: int):
+        """Avança n bytes; quando esvazia, volta ao início do buffer"""
+        self.inicio += n
+        if self.inicio == self.fim:
+            self.inicio = self.fim = 0
+
+
+class DecodificadorLinhas:
+    """Separa mensagens terminadas em '\\n' (protocolos strings e JSON)"""
+
+    def __init__(self, capacidade: int = TAMANHO_BLOCO):
+        self.buffer = BufferRecepcao(capacidade)
+        self._varrido = 0  # bytes pendentes já procurados sem achar '\n'
+
+    @staticmethod
+    def enquadrar(corpo):
+        """Inverso de extrair(): a linha com o '\\n'"""
+        return bytes(corpo) + b'\n'
+
+    def extrair(self):
+        """Próxima linha completa (sem o '\\n'), ou None se ainda faltam bytes"""
+        b = self.buffer
+        pos = b.dados.find(b'\n', b.inicio + self._varrido, b.fim)
+        if pos < 0:
+            self._varrido = b.fim - b.inicio
+            return None
+        with memoryview(b.dados) as visao:
+            linha = bytes(visao[b.inicio:pos])
+        b.consumir(pos + 1 - b.inicio)
+        self._varrido = 0
+        return linha
+
+
+def ler_socket(sock, buffer: BufferRecepcao, minimo: int = 4096):
+    """Uma chamada recv_into direto no buffer; falha se o servidor fechou"""
+    with buffer.livre(minimo) as janela:
+        n = sock.recv_into(janela)
+    if not n:
+        raise ConnectionError("Conexão fechada pelo servidor")
+    buffer.confirmar(n)
+    return n
+
+
+class LeitorLinhas:
+    """Lê linhas de um socket bloqueante, respeitando o timeout do socket"""
+
+    def __init__(self, sock, capacidade: int = TAMANHO_BLOCO):
+        self.socket = sock
+        self.decodificador = DecodificadorLinhas(capacidade)
+        # Instantes (perf_counter) do primeiro e do último byte da última leitura
+        self.primeiro_byte = self.ultimo_byte = None
+
+    def ler(self):
+        linha = self.decodificador.extrair()
+        if linha is not None:
+            self.primeiro_byte = self.ultimo_byte = time.perf_counter()
+            return linha
+        ler_socket(self.socket, self.decodificador.buffer)
+        self.primeiro_byte = time.perf_counter()
+        linha = self.decodificador.extrair()
+        while linha is None:
+            ler_socket(self.socket, self.decodificador.buffer)
+            linha = self.decodificador.extrair()
+        self.ultimo_byte = time.perf_counter()
+        return linha
+
+
+class DecodificadorFrames:
+    """Separa mensagens com cabeçalho de 4 bytes de tamanho (Protocol Buffers)"""
+
+    def __init__(self, capacidade: int = TAMANHO_BLOCO):
+        self.buffer = BufferRecepcao(capacidade)
+
+    @staticmethod
+    def enquadrar(corpo):
+        """Inverso de extrair(): cabeçalho de tamanho + corpo"""
+        return CABECALHO.pack(len(corpo)) + bytes(corpo)
+
+    def faltando(self):
+        """Quantos bytes ainda faltam para completar o próximo frame"""
+        pendente = len(self.buffer)
+        if pendente < 4:
+            return 4 - pendente
+        tamanho = CABECALHO.unpack_from(self.buffer.dados, self.buffer.inicio)[0]
+        return max(0, 4 + tamanho - pendente)
+
+    def extrair(self):
+        """Corpo do próximo frame como memoryview, ou None se ainda faltam bytes
+
+        A visão aponta para o buffer interno e só vale até a próxima leitura.
+        """
+        b = self.buffer
+        pendente = b.fim - b.inicio
+        if pendente < 4:
+            return None
+        tamanho = CABECALHO.unpack_from(b.dados, b.inicio)[0]
+        if pendente < 4 + tamanho:
+            return None
+        inicio = b.inicio + 4
+        corpo = memoryview(b.dados)[inicio:inicio + tamanho]
+        b.consumir(4 + tamanho)
+        return corpo
+
+
+class LeitorFrames:
+    """Lê frames de um socket bloqueante; vários frames num segmento TCP saem sem novo recv"""
+
+    def __init__(self, sock, capacidade: int = TAMANHO_BLOCO):
+        self.socket = sock
+        self.decodificador = DecodificadorFrames(capacidade)
+        # Instantes (perf_counter) do primeiro e do último byte da última leitura
+        self.primeiro_byte = self.ultimo_byte = None
+
+    def ler(self):
+        corpo = self.decodificador.extrair()
+        if corpo is not None:
+            self.primeiro_byte = self.ultimo_byte = time.perf_counter()
+            return corpo
+        self._ler_socket()
+        self.primeiro_byte = time.perf_counter()
+        corpo = self.decodificador.extrair()
+        while corpo is None:
+            self._ler_socket()
+            corpo = self.decodificador.extrair()
+        self.ultimo_byte = time.perf_counter()
+        return corpo
+
+    def _ler_socket(self):
+        # Pede espaço para o frame inteiro: um frame grande chega com menos recv
+        ler_socket(self.socket, self.decodificador.buffer,
+                   max(4096, self.decodificador.faltando()))
@@ -0,0 +1,208 @@
+"""
+Histórico local: HISTÓRICO incremental sobre um armazenamento só de acréscimo
+
+O servidor só oferece `historico(limite)`, que devolve as últimas operações
+e o total. HistoricoLocal guarda em SQLite o que já foi visto, por aluno_id,
+e em cada sincronização busca só o que entrou depois: uma sondagem com
+limite 1 traz o total do servidor, e o total menos o já visto diz quantas
+operações novas pedir na segunda consulta (que só sai se houver mais de uma).
+Se o total do servidor voltar para trás (reinício, limpeza), começa uma nova
+época, numerada depois da anterior. Total, sucesso, erro e taxa de sucesso
+são agregados localmente.
+
+    historico = HistoricoLocal('historico.db')
+    resumo = historico.sincronizar(cliente)
+    resumo['estatisticas'], resumo['operacoes'][-5:]
+"""
+
+import json
+import sqlite3
+
+from comum.texto import literal
+
+JANELA = 1             # limite da sondagem de cada sincronização
+LIMITE_BUSCA = 1000    # maior limite pedido numa consulta só
+
+
+def como_estrutura(valor):
+    """Campo aninhado -> objeto Python (strings e protobuf com map mandam texto)"""
+    return literal(valor)
+
+
+def total_servidor(resultado):
+    """Total de operações do aluno no servidor, segundo a resposta do HISTÓRICO"""
+    estatisticas = como_estrutura(resultado.get('estatisticas')) or {}
+    total = estatisticas.get('total_operacoes', resultado.get('total'))
+    return int(float(total)) if total is not None else None
+
+
+def operacoes_de(resultado):
+    """Lista de operações da resposta, da mais antiga para a mais recente"""
+    operacoes = como_estrutura(resultado.get('operacoes')) or []
+    return [
+        {
+            'operacao': str(op.get('operacao', '')),
+            'parametros': como_estrutura(op.get('parametros')) or {},
+            'timestamp': str(op.get('timestamp', '')),
+            'sucesso': op.get('sucesso') in (True, 'True', 'true', 1, '1'),
+        }
+        for op in operacoes
+    ]
+
+
+class HistoricoLocal:
+    """Operações vistas de cada aluno, numeradas na ordem do servidor"""
+
+    def __init__(self, caminho: str = ':memory:', janela: int = JANELA,
+                 limite_busca: int = LIMITE_BUSCA):
+        self.janela = janela
+        self.limite_busca = limite_busca
+        self.conexao = sqlite3.connect(caminho, check_same_thread=False)
+        self.conexao.executescript("""
+            CREATE TABLE IF NOT EXISTS operacoes (
+                aluno_id TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                operacao TEXT NOT NULL,
+                parametros TEXT NOT NULL,
+                timestamp TEXT NOT NULL,
+                sucesso INTEGER NOT NULL,
+                PRIMARY KEY (aluno_id, seq)
+            );
+            CREATE TABLE IF NOT EXISTS alunos (
+                aluno_id TEXT PRIMARY KEY,
+                total_visto INTEGER NOT NULL,
+                lacunas INTEGER NOT NULL DEFAULT 0,
+                base INTEGER NOT NULL DEFAULT 0
+            );
+        """)
+        colunas = {linha[1] for linha in self.conexao.execute("PRAGMA table_info(alunos)")}
+        if 'base' not in colunas:  # arquivo de antes das épocas
+            self.conexao.execute("ALTER TABLE alunos ADD COLUMN base INTEGER NOT NULL DEFAULT 0")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+        return False
+
+    def fechar(self):
+        self.conexao.close()
+
+    def total_visto(self, aluno_id):
+        """Total do servidor na última sincronização (na época atual)"""
+        return self._posicao(aluno_id)[0]
+
+    def _posicao(self, aluno_id):
+        """(total visto na época atual, seq local onde a época começa)"""
+        linha = self.conexao.execute(
+            "SELECT total_visto, base FROM alunos WHERE aluno_id = ?", (aluno_id,)).fetchone()
+        return linha if linha else (0, 0)
+
+    def pendentes(self, aluno_id, total):
+        """Operações do servidor ainda não vistas, dado o total informado por ele"""
+        visto = self.total_visto(aluno_id)
+        return total - visto if total >= visto else total  # total menor: nova época
+
+    def acrescentar(self, aluno_id, total, operacoes):
+        """Grava as operações novas; as últimas de `operacoes` terminam na posição total"""
+        visto, base = self._posicao(aluno_id)
+        if total < visto:
+            # O servidor perdeu o histórico (reinício, limpeza): nova época, depois da anterior
+            base, visto = base + visto, 0
+        faltam = total - visto
+        novas = operacoes[len(operacoes) - faltam:] if faltam < len(operacoes) else operacoes
+        primeira = total - len(novas)
+        with self.conexao:
+            self.conexao.executemany(
+                "INSERT OR IGNORE INTO operacoes VALUES (?, ?, ?, ?, ?, ?)",
+                [(aluno_id, base + primeira + i, op['operacao'],
+                  json.dumps(op['parametros'], ensure_ascii=False), op['timestamp'], int(op['sucesso']))
+                 for i, op in enumerate(novas)])
+            # Lacuna: o servidor devolveu menos operações do que as que entraram
+            self.conexao.execute(
+                "INSERT INTO alunos VALUES (?, ?, ?, ?) ON CONFLICT(aluno_id) DO UPDATE SET "
+                "total_visto = excluded.total_visto, lacunas = lacunas + excluded.lacunas, "
+                "base = excluded.base",
+                (aluno_id, total, max(0, primeira - visto), base))
+        return len(novas)
+
+    def ultimas(self, aluno_id, limite=10):
+        """Últimas operações guardadas, da mais antiga para a mais recente"""
+        linhas = self.conexao.execute(
+            "SELECT operacao, parametros, timestamp, sucesso FROM operacoes "
+            "WHERE aluno_id = ? ORDER BY seq DESC LIMIT ?", (aluno_id, limite)).fetchall()
+        return [{'operacao': op, 'parametros': json.loads(parametros),
+                 'timestamp': timestamp, 'sucesso': bool(sucesso)}
+                for op, parametros, timestamp, sucesso in reversed(linhas)]
+
+    def estatisticas(self, aluno_id):
+        """Agregados das operações guardadas (mesmos nomes do servidor)"""
+        total, sucesso = self.conexao.execute(
+            "SELECT COUNT(*), COALESCE(SUM(sucesso), 0) FROM operacoes WHERE aluno_id = ?",
+            (aluno_id,)).fetchone()
+        lacunas = self.conexao.execute(
+            "SELECT lacunas FROM alunos WHERE aluno_id = ?", (aluno_id,)).fetchone()
+        return {
+            'total_operacoes': total,
+            'operacoes_sucesso': sucesso,
+            'operacoes_erro': total - sucesso,
+            'taxa_sucesso': round(100 * sucesso / total, 2) if total else 0.0,
+            'nao_recuperadas': lacunas[0] if lacunas else 0,
+        }
+
+    # Sincronização
+
+    def sincronizar(self, cliente, aluno_id=None, limite=10):
+        """Busca só as operações novas no servidor e devolve o histórico local
+
+        Sonda com limite=1 (total do servidor e a última operação) e, se entraram
+        mais, pede exatamente as novas.
+        """
+        resultado = cliente.historico(limite=self.janela)
+        if not isinstance(resultado, dict):
+            return None
+        pedido = self._limite_complementar(resultado, aluno_id)
+        if pedido:
+            resultado = cliente.historico(limite=pedido)
+            if not isinstance(resultado, dict):
+                return None
+        return self._incorporar(resultado, aluno_id, limite)
+
+    async def sincronizar_async(self, cliente, aluno_id=None, limite=10):
+        """sincronizar() para os clientes asyncio"""
+        resultado = await cliente.historico(limite=self.janela)
+        if not isinstance(resultado, dict):
+            return None
+        pedido = self._limite_complementar(resultado, aluno_id)
+        if pedido:
+            resultado = await cliente.historico(limite=pedido)
+            if not isinstance(resultado, dict):
+                return None
+        return self._incorporar(resultado, aluno_id, limite)
+
+    def _limite_complementar(self, resultado, aluno_id):
+        """Limite da segunda consulta, se a sondagem não cobriu as operações novas"""
+        aluno_id = str(resultado.get('aluno_id') or aluno_id)
+        total = total_servidor(resultado)
+        if total is None:
+            return 0
+        novas = self.pendentes(aluno_id, total)
+        if novas <= len(operacoes_de(resultado)):
+            return 0
+        # +1: a própria sondagem entra no histórico antes da segunda consulta
+        return min(novas + 1, self.limite_busca)
+
+    def _incorporar(self, resultado, aluno_id, limite):
+        aluno_id = str(resultado.get('aluno_id') or aluno_id)
+        operacoes = operacoes_de(resultado)
+        total = total_servidor(resultado)
+        if total is None:
+            total = self.total_visto(aluno_id) + len(operacoes)  # sem total: confia na janela
+        novas = self.acrescentar(aluno_id, total, operacoes)
+        return {
+            'aluno_id': aluno_id,
+            'novas': novas,
+            'operacoes': self.ultimas(aluno_id, limite),
+            'estatisticas': self.estatisticas(aluno_id),
+        }
@@ -0,0 +1,174 @@
+"""
+Métricas de latência: percentis, histogramas e tempos por fase das operações
+"""
+
+import time
+
+
+def percentil(valores, p):
+    """Percentil p (0-100) por interpolação linear; valores não precisa estar ordenado"""
+    if not valores:
+        return None
+    ordenados = sorted(valores)
+    posicao = (len(ordenados) - 1) * p / 100
+    inferior = int(posicao)
+    superior = min(inferior + 1, len(ordenados) - 1)
+    fracao = posicao - inferior
+    return ordenados[inferior] + (ordenados[superior] - ordenados[inferior]) * fracao
+
+
+def resumo(valores, escala=1.0):
+    """p50/p90/p99/máx/média de uma lista de medidas, multiplicadas por escala"""
+    if not valores:
+        return {}
+    return {
+        'p50': percentil(valores, 50) * escala,
+        'p90': percentil(valores, 90) * escala,
+        'p99': percentil(valores, 99) * escala,
+        'max': max(valores) * escala,
+        'media': sum(valores) / len(valores) * escala,
+    }
+
+
+class Histograma:
+    """Histograma log-linear no estilo HDR: memória fixa e erro relativo limitado
+
+    Valores inteiros (ex.: microssegundos). Abaixo de 2**bits cada valor tem
+    o próprio balde; acima, cada potência de 2 é dividida em 2**bits baldes,
+    o que limita o erro relativo a 1/2**bits (~0,8% com bits=7).
+    """
+
+    def __init__(self, bits: int = 7):
+        self.bits = bits
+        self.sub = 1 << bits
+        self.baldes = {}
+        self.contagem = 0
+        self.total = 0
+        self.minimo = None
+        self.maximo = None
+
+    def _indice(self, valor):
+        expoente = max(0, valor.bit_length() - self.bits - 1)
+        return (expoente << self.bits) + (valor >> expoente)
+
+    def _valor(self, indice):
+        """Ponto médio do balde"""
+        expoente = max(0, (indice >> self.bits) - 1)
+        inicio = (indice - (expoente << self.bits)) << expoente
+        return inicio + ((1 << expoente) - 1) / 2
+
+    def registrar(self, valor):
+        valor = max(0, int(valor))
+        indice = self._indice(valor)
+        self.baldes[indice] = self.baldes.get(indice, 0) + 1
+        self.contagem += 1
+        self.total += valor
+        if self.minimo is None or valor < self.minimo:
+            self.minimo = valor
+        if self.maximo is None or valor > self.maximo:
+            self.maximo = valor
+
+    def mesclar(self, outro):
+        """Soma outro histograma (mesma precisão) a este"""
+        for indice, n in outro.baldes.items():
+            self.baldes[indice] = self.baldes.get(indice, 0) + n
+        self.contagem += outro.contagem
+        self.total += outro.total
+        for valor in (outro.minimo, outro.maximo):
+            if valor is not None:
+                self.minimo = valor if self.minimo is None else min(self.minimo, valor)
+                self.maximo = valor if self.maximo is None else max(self.maximo, valor)
+
+    def percentil(self, p):
+        if not self.contagem:
+            return None
+        alvo = max(1, -(-self.contagem * p // 100))
+        acumulado = 0
+        for indice in sorted(self.baldes):
+            acumulado += self.baldes[indice]
+            if acumulado >= alvo:
+                return min(max(self._valor(indice), self.minimo), self.maximo)
+        return self.maximo
+
+    def resumo(self):
+        if not self.contagem:
+            return {'contagem': 0}
+        return {
+            'contagem': self.contagem,
+            'p50': self.percentil(50),
+            'p90': self.percentil(90),
+            'p99': self.percentil(99),
+            'p999': self.percentil(99.9),
+            'min': self.minimo,
+            'max': self.maximo,
+            'media': self.total / self.contagem,
+        }
+
+
+FASES = ('serializar', 'enviar', 'esperar', 'receber', 'desserializar', 'total')
+
+
+class Medicao:
+    """Instantes (time.perf_counter) de uma chamada de operação"""
+
+    __slots__ = ('operacao', 'inicio', 'serializado', 'enviado',
+                 'primeiro_byte', 'ultimo_byte', 'desserializado')
+
+    def __init__(self, operacao):
+        self.operacao = operacao
+        self.inicio = time.perf_counter()
+        self.serializado = self.enviado = None
+        self.primeiro_byte = self.ultimo_byte = self.desserializado = None
+
+    def concluir(self):
+        self.desserializado = time.perf_counter()
+        return self
+
+    def fases(self):
+        """Duração de cada fase, em segundos"""
+        return {
+            'serializar': self.serializado - self.inicio,
+            'enviar': self.enviado - self.serializado,
+            'esperar': self.primeiro_byte - self.enviado,
+            'receber': self.ultimo_byte - self.primeiro_byte,
+            'desserializar': self.desserializado - self.ultimo_byte,
+            'total': self.desserializado - self.inicio,
+        }
+
+
+class Instrumentacao:
+    """Última medição e histogramas (em µs) por operação e fase, lidos pelo cliente"""
+
+    def __init__(self):
+        self.ultima = None
+        self.histogramas = {}
+
+    def registrar(self, medicao):
+        self.ultima = medicao
+        for fase, duracao in medicao.fases().items():
+            chave = (medicao.operacao, fase)
+            histograma = self.histogramas.get(chave)
+            if histograma is None:
+                histograma = self.histogramas[chave] = Histograma()
+            histograma.registrar(duracao * 1e6)
+
+    def histograma(self, fase, operacao=None):
+        """Histograma de uma fase; sem operacao, junta todas"""
+        if operacao is not None:
+            return self.histogramas.get((operacao, fase)) or Histograma()
+        agregado = Histograma()
+        for (_, f), histograma in self.histogramas.items():
+            if f == fase:
+                agregado.mesclar(histograma)
+        return agregado
+
+    def resumo(self):
+        """{operacao: {fase: percentis em µs}}"""
+        resultado = {}
+        for (operacao, fase), histograma in sorted(self.histogramas.items()):
+            resultado.setdefault(operacao, {})[fase] = histograma.resumo()
+        return resultado
+
+    def zerar(self):
+        self.ultima = None
+        self.histogramas.clear()
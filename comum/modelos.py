@@ -0,0 +1,26 @@
+"""
+Modelos de requisição pré-codificados por sessão
+
+Token e nome da operação não mudam entre chamadas da mesma sessão: o
+prefixo da requisição (ex.: b'OP|token=...|operacao=echo') é montado e
+codificado uma vez por operação e reaproveitado; a cada chamada só os
+campos variáveis são serializados. Trocar de token descarta os modelos.
+"""
+
+
+class Modelos:
+    """Prefixos em bytes por operação, válidos para o token atual"""
+
+    def __init__(self, montar_prefixo):
+        self.montar_prefixo = montar_prefixo  # (token, operacao) -> bytes
+        self.token = None
+        self.prefixos = {}
+
+    def prefixo(self, token, operacao):
+        if token != self.token:
+            self.prefixos.clear()
+            self.token = token
+        prefixo = self.prefixos.get(operacao)
+        if prefixo is None:
+            prefixo = self.prefixos[operacao] = self.montar_prefixo(token, operacao)
+        return prefixo
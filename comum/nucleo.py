@@ -0,0 +1,327 @@
+"""
+Núcleo dos clientes: transporte e sessão comuns, codec por protocolo
+
+ClienteBase cuida do que é igual nos três protocolos: socket e timeout,
+enquadramento, medições e rastreio, token da sessão, pipeline e as operações
+do servidor (echo, soma, timestamp, status, historico). O que muda de um
+protocolo para outro fica num Codec, que monta, serializa, desserializa e
+interpreta as mensagens. ClienteStrings, ClienteJSON e ClienteProtobuf são
+este núcleo com o codec do seu protocolo; ClienteAsync troca só o transporte.
+
+    cliente = ClienteBase(host, 8081, codec=CodecJSON())
+
+host também aceita vários endpoints ("h1:8081,h2:8081", lista ou um
+Balanceador compartilhado): veja comum/endpoints.py.
+"""
+
+import time
+
+from comum.captura import ENVIO, RECEBIMENTO
+from comum.endpoints import Balanceador
+from comum.metricas import Instrumentacao, Medicao
+from comum.perfil_socket import obter_perfil
+from comum.pipeline import Pipeline
+from comum.rastreio import ENVIADO, RECEBIDO, RastreioNulo
+from comum.vetores import TAMANHO_LOTE, como_vetor, somar_em_lotes
+
+# Valores canônicos omitidos numa operação do batch()
+PADROES = {'status': {'detalhado': False}, 'historico': {'limite': 10}}
+
+
+def itens_lote(codec, operacoes):
+    """[(nome, parametros do protocolo)] a partir de nomes ou (nome, {valores canônicos})"""
+    itens = []
+    for operacao in operacoes:
+        if isinstance(operacao, str):
+            nome, valores = operacao, {}
+        else:
+            nome, valores = operacao[0], dict(operacao[1]) if len(operacao) > 1 else {}
+        valores = {**PADROES.get(nome, {}), **valores}
+        if nome == 'soma':
+            valores['numeros'] = como_vetor(valores['numeros'])
+        itens.append((nome, codec.parametros(nome, valores)))
+    return itens
+
+
+class Codec:
+    """O que é próprio de um protocolo: mensagens, serialização e interpretação
+
+    Os interpretar_* imprimem os erros do servidor no estilo de cada cliente.
+    Parâmetros das operações chegam em forma canônica ({'mensagem': str},
+    {'numeros': vetor}, {'detalhado': bool}, {'limite': int}) e parametros()
+    os converte para o formato do protocolo.
+    """
+
+    # Enquadramento: leitor do socket bloqueante e decodificador (asyncio)
+    Leitor = None
+    Decodificador = None
+    # Texto do último erro de operação devolvido pelo servidor
+    ultimo_erro = None
+
+    def codificar(self, mensagem):
+        """Mensagem montada -> bytes prontos para o socket"""
+        raise NotImplementedError
+
+    def decodificar(self, quadro):
+        """Quadro recebido, sem o enquadramento -> resposta"""
+        raise NotImplementedError
+
+    def mensagem_auth(self, aluno_id):
+        raise NotImplementedError
+
+    def interpretar_auth(self, resposta):
+        """Token da sessão, ou None se a autenticação falhou"""
+        raise NotImplementedError
+
+    def mensagem_operacao(self, token, nome, parametros):
+        raise NotImplementedError
+
+    def interpretar_operacao(self, resposta):
+        """Resultado da operação, ou None se o servidor respondeu com erro"""
+        raise NotImplementedError
+
+    def mensagem_logout(self, token):
+        raise NotImplementedError
+
+    def interpretar_logout(self, resposta):
+        """True se o servidor encerrou a sessão"""
+        raise NotImplementedError
+
+    def parametros(self, nome, valores):
+        """Parâmetros canônicos de uma operação do servidor no formato do protocolo"""
+        return valores
+
+    def trocar_token(self, quadro, antigo, novo):
+        """Requisição enquadrada com outro token (reprodução de capturas)"""
+        return quadro.replace(antigo.encode('utf-8'), novo.encode('utf-8'))
+
+    # Quadro de lote (opcional): várias operações numa mensagem só
+
+    def usar_lote(self):
+        """Manda os lotes num quadro só, a menos que o servidor já tenha mostrado não suportar"""
+        return False
+
+    def mensagem_lote(self, token, itens):
+        """Mensagem com todas as operações [(nome, parametros), ...]"""
+        raise NotImplementedError
+
+    def interpretar_lote(self, resposta):
+        """Resultados na ordem das operações, ou None se o servidor não entendeu o lote"""
+        raise NotImplementedError
+
+
+class ClienteBase:
+    """Transporte, sessão e operações sobre um codec de protocolo"""
+
+    def __init__(self, host, port: int, timeout: int = 30, rastreio=None, codec=None,
+                 perfil=None):
+        # Réplicas do servidor; host/port passam a ser as da conexão atual
+        self.balanceador = Balanceador.de(host, port)
+        self.host, self.port = self.balanceador.endpoints[0]
+        self.endpoint = None
+        self.timeout = timeout
+        self.codec = codec
+        self.perfil = obter_perfil(perfil)  # opções do socket e prazos de conexão/leitura
+        self.socket = None
+        self.leitor = None
+        self.token = None
+        self.rastreio = rastreio or RastreioNulo()
+        self.pipeline_ativo = None
+        self.metricas = Instrumentacao()
+        self.tamanho_lote = TAMANHO_LOTE
+        self.captura = None  # Gravador de comum/captura.py
+        self.conexao_captura = None
+
+    # Transporte
+
+    def conectar(self):
+        """Estabelece conexão TCP (com várias réplicas, com a primeira que responder)"""
+        self.socket, self.endpoint = self.balanceador.conectar(
+            self.perfil, self.perfil.prazo_conexao(self.timeout))
+        self.host, self.port = self.endpoint
+        self.socket.settimeout(self.perfil.prazo_leitura(self.timeout))
+        self.leitor = self.codec.Leitor(self.socket)
+        if self.captura is not None:
+            self.conexao_captura = self.captura.nova_conexao()
+        print(f"Conectado a {self.host}:{self.port}")
+
+    def desconectar(self):
+        """Fecha conexão"""
+        if self.socket:
+            self.socket.close()
+            print("Desconectado")
+        if self.endpoint:
+            self.balanceador.desconectou(self.endpoint)
+            self.endpoint = None
+
+    def enviar(self, mensagem, medicao=None):
+        """Envia uma mensagem montada ao servidor"""
+        dados = self.codificar(mensagem)
+        if medicao:
+            medicao.serializado = time.perf_counter()
+        self.socket.sendall(dados)
+        if medicao:
+            medicao.enviado = time.perf_counter()
+        if self.captura is not None:
+            self.captura.registrar(self.conexao_captura, ENVIO, dados)
+        if self.rastreio.ativo:
+            self.rastreio.registrar(ENVIADO, mensagem, len(dados))
+
+    def enviar_varias(self, mensagens, medicao=None):
+        """Envia várias mensagens montadas numa escrita só"""
+        dados = b''.join([self.codificar(mensagem) for mensagem in mensagens])
+        if medicao:
+            medicao.serializado = time.perf_counter()
+        self.socket.sendall(dados)
+        if medicao:
+            medicao.enviado = time.perf_counter()
+        if self.captura is not None:
+            self.captura.registrar(self.conexao_captura, ENVIO, dados)
+        if self.rastreio.ativo:
+            for mensagem in mensagens:
+                self.rastreio.registrar(ENVIADO, mensagem)
+
+    def receber(self, medicao=None):
+        """Recebe a próxima resposta do servidor"""
+        dados = self.leitor.ler()
+        if medicao:
+            medicao.primeiro_byte = self.leitor.primeiro_byte
+            medicao.ultimo_byte = self.leitor.ultimo_byte
+        if self.captura is not None:
+            self.captura.registrar(self.conexao_captura, RECEBIMENTO, self.codec.Decodificador.enquadrar(dados))
+        resposta = self.decodificar(dados)
+        if self.rastreio.ativo:
+            self.rastreio.registrar(RECEBIDO, resposta, len(dados))
+        return resposta
+
+    def codificar(self, mensagem):
+        return self.codec.codificar(mensagem)
+
+    def decodificar(self, dados):
+        return self.codec.decodificar(dados)
+
+    # Sessão
+
+    def mensagem_auth(self, aluno_id):
+        return self.codec.mensagem_auth(aluno_id)
+
+    def interpretar_auth(self, resposta):
+        """Guarda o token se a autenticação deu certo"""
+        token = self.codec.interpretar_auth(resposta)
+        if token is None:
+            return False
+        self.token = token
+        return True
+
+    def mensagem_operacao(self, nome, parametros=None):
+        return self.codec.mensagem_operacao(self.token, nome, parametros or {})
+
+    def interpretar_operacao(self, resposta):
+        return self.codec.interpretar_operacao(resposta)
+
+    def mensagem_logout(self):
+        return self.codec.mensagem_logout(self.token)
+
+    def interpretar_logout(self, resposta):
+        """Descarta o token se o logout deu certo"""
+        if not self.codec.interpretar_logout(resposta):
+            return False
+        self.token = None
+        return True
+
+    def autenticar(self, aluno_id):
+        """Autentica no servidor"""
+        self.enviar(self.mensagem_auth(aluno_id))
+        return self.interpretar_auth(self.receber())
+
+    def operacao(self, nome, parametros=None, **params):
+        """Executa uma operação genérica (parâmetros em dict ou nomeados)"""
+        if not self.token:
+            print("Não autenticado")
+            return None
+        if params:
+            parametros = {**(parametros or {}), **params}
+
+        medicao = Medicao(nome)
+        mensagem = self.mensagem_operacao(nome, parametros)
+        if self.pipeline_ativo:
+            return self.pipeline_ativo.submeter(mensagem, medicao)
+        self.enviar(mensagem, medicao)
+        resultado = self.interpretar_operacao(self.receber(medicao))
+        self.metricas.registrar(medicao.concluir())
+        self.balanceador.registrar(self.endpoint, medicao.ultimo_byte - medicao.enviado)
+        return resultado
+
+    def pipeline(self, profundidade=16):
+        """Modo pipeline: as operações passam a devolver RespostaPendente"""
+        return Pipeline(self, profundidade)
+
+    def batch(self, operacoes):
+        """Várias operações numa ida e volta; resultados na ordem (None nas que falharam)
+
+        cliente.batch(["timestamp", ("echo", {"mensagem": "oi"}), ("soma", {"numeros": [1, 2]})])
+
+        Vai num quadro de lote quando o codec e o servidor suportam; senão as
+        requisições saem todas numa escrita só e as respostas são lidas em seguida.
+        """
+        if not self.token:
+            print("Não autenticado")
+            return None
+        if self.pipeline_ativo:
+            self.pipeline_ativo.concluir()
+        itens = itens_lote(self.codec, operacoes)
+        if not itens:
+            return []
+
+        medicao = Medicao("batch")
+        if self.codec.usar_lote():
+            self.enviar(self.codec.mensagem_lote(self.token, itens), medicao)
+            resultados = self.codec.interpretar_lote(self.receber(medicao))
+            if resultados is not None:
+                self.metricas.registrar(medicao.concluir())
+                return resultados
+            # Servidor sem quadro de lote: repete com as requisições avulsas
+            medicao = Medicao("batch")
+
+        self.enviar_varias([self.mensagem_operacao(nome, parametros) for nome, parametros in itens],
+                           medicao)
+        resultados = [self.interpretar_operacao(self.receber(medicao))]
+        resultados += [self.interpretar_operacao(self.receber()) for _ in itens[1:]]
+        medicao.ultimo_byte = self.leitor.ultimo_byte
+        self.metricas.registrar(medicao.concluir())
+        return resultados
+
+    def logout(self):
+        """Encerra sessão"""
+        if not self.token:
+            return False
+        if self.pipeline_ativo:
+            self.pipeline_ativo.concluir()
+
+        self.enviar(self.mensagem_logout())
+        return self.interpretar_logout(self.receber())
+
+    # Operações do servidor
+
+    def echo(self, mensagem):
+        """Operação ECHO"""
+        return self.operacao("echo", self.codec.parametros("echo", {"mensagem": mensagem}))
+
+    def soma(self, numeros):
+        """Operação SOMA (lista, array.array ou NumPy; entradas grandes vão em lotes)"""
+        numeros = como_vetor(numeros)
+        if len(numeros) > self.tamanho_lote:
+            return somar_em_lotes(self, numeros, self.tamanho_lote)
+        return self.operacao("soma", self.codec.parametros("soma", {"numeros": numeros}))
+
+    def timestamp(self):
+        """Operação TIMESTAMP"""
+        return self.operacao("timestamp", self.codec.parametros("timestamp", {}))
+
+    def status(self, detalhado=False):
+        """Operação STATUS"""
+        return self.operacao("status", self.codec.parametros("status", {"detalhado": detalhado}))
+
+    def historico(self, limite=10):
+        """Operação HISTÓRICO"""
+        return self.operacao("historico", self.codec.parametros("historico", {"limite": limite}))
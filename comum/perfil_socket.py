@@ -0,0 +1,107 @@
+"""
+Perfis de socket: TCP_NODELAY, keepalive, buffers e prazos de conexão/leitura
+
+Requisições pequenas seguidas (echo, timestamp, pipeline) sofrem com o
+algoritmo de Nagle combinado ao ACK atrasado, e conexões ociosas do pool
+morrem sem aviso quando algum equipamento no caminho esquece a conexão. O
+perfil é aplicado ao socket antes do connect (os tamanhos de buffer só
+valem por inteiro assim) e separa o prazo de conexão do de leitura.
+
+    cliente = ClienteJSON(host, perfil='padrao')
+    cliente = ClienteJSON(host, perfil=PerfilSocket(buffer_recepcao=1 << 20, timeout_conexao=3))
+
+`python benchmark/benchmark.py --perfis sistema,sem_nodelay,padrao` mede o
+efeito de cada perfil na latência.
+"""
+
+import socket
+import sys
+
+
+class PerfilSocket:
+    """Opções aplicadas a cada socket de um cliente (None: padrão do sistema)"""
+
+    def __init__(self, nodelay: bool = True, keepalive: bool = True,
+                 keepalive_ocioso: int = 60, keepalive_intervalo: int = 10,
+                 keepalive_tentativas: int = 5, buffer_recepcao: int = None,
+                 buffer_envio: int = None, timeout_conexao: float = None,
+                 timeout_leitura: float = None):
+        self.nodelay = nodelay
+        self.keepalive = keepalive
+        self.keepalive_ocioso = keepalive_ocioso          # segundos sem tráfego até a 1ª sonda
+        self.keepalive_intervalo = keepalive_intervalo    # segundos entre sondas
+        self.keepalive_tentativas = keepalive_tentativas  # sondas sem resposta até fechar
+        self.buffer_recepcao = buffer_recepcao
+        self.buffer_envio = buffer_envio
+        self.timeout_conexao = timeout_conexao  # None: o timeout do cliente
+        self.timeout_leitura = timeout_leitura
+
+    def aplicar(self, sock):
+        """Configura o socket (antes do connect)"""
+        if self.nodelay is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, int(self.nodelay))
+        if self.buffer_recepcao:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.buffer_recepcao)
+        if self.buffer_envio:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.buffer_envio)
+        if self.keepalive is not None:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, int(self.keepalive))
+            if self.keepalive:
+                self._intervalos_keepalive(sock)
+
+    def _intervalos_keepalive(self, sock):
+        if hasattr(socket, 'TCP_KEEPIDLE'):  # Linux
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, self.keepalive_ocioso)
+        elif hasattr(socket, 'TCP_KEEPALIVE'):  # macOS
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPALIVE, self.keepalive_ocioso)
+        elif sys.platform == 'win32':
+            sock.ioctl(socket.SIO_KEEPALIVE_VALS,
+                       (1, self.keepalive_ocioso * 1000, self.keepalive_intervalo * 1000))
+            return
+        if hasattr(socket, 'TCP_KEEPINTVL'):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, self.keepalive_intervalo)
+        if hasattr(socket, 'TCP_KEEPCNT'):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, self.keepalive_tentativas)
+
+    def prazo_conexao(self, padrao):
+        return self.timeout_conexao if self.timeout_conexao is not None else padrao
+
+    def prazo_leitura(self, padrao):
+        return self.timeout_leitura if self.timeout_leitura is not None else padrao
+
+
+def opcoes_efetivas(sock):
+    """Valores que o sistema de fato aplicou (o Linux dobra os buffers pedidos)"""
+    opcoes = {
+        'nodelay': bool(sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)),
+        'keepalive': bool(sock.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE)),
+        'buffer_recepcao': sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF),
+        'buffer_envio': sock.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF),
+    }
+    if hasattr(socket, 'TCP_KEEPIDLE'):
+        opcoes['keepalive_ocioso'] = sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE)
+    return opcoes
+
+
+PERFIS = {
+    # Padrão dos clientes: sem Nagle, keepalive para conexões ociosas do pool
+    'padrao': PerfilSocket(),
+    # Socket como o sistema entrega (comportamento anterior dos clientes)
+    'sistema': PerfilSocket(nodelay=None, keepalive=None),
+    'sem_nodelay': PerfilSocket(nodelay=False),
+    'buffers_4k': PerfilSocket(buffer_recepcao=4096, buffer_envio=4096),
+    'buffers_1m': PerfilSocket(buffer_recepcao=1 << 20, buffer_envio=1 << 20),
+    # Falha rápido: conexão em 2 s e resposta em 5 s
+    'prazos_curtos': PerfilSocket(timeout_conexao=2.0, timeout_leitura=5.0),
+}
+
+
+def obter_perfil(perfil=None):
+    """Nome de PERFIS, instância pronta ou None para o perfil padrão"""
+    if perfil is None:
+        return PERFIS['padrao']
+    if isinstance(perfil, str):
+        if perfil not in PERFIS:
+            raise ValueError(f"Perfil de socket desconhecido: {perfil} (disponíveis: {', '.join(PERFIS)})")
+        return PERFIS[perfil]
+    return perfil
@@ -0,0 +1,96 @@
+"""
+Pipeline de requisições numa única conexão
+
+Enquanto o pipeline está ativo, as operações dos clientes só enviam a
+requisição e devolvem uma RespostaPendente. As respostas chegam na mesma
+ordem dos envios, então basta uma fila para casá-las.
+
+    with cliente.pipeline(profundidade=16):
+        pendentes = [cliente.echo(f"msg {i}") for i in range(100)]
+    resultados = [p.resultado() for p in pendentes]
+"""
+
+import time
+from collections import deque
+
+
+class RespostaPendente:
+    """Resultado de uma operação enviada em pipeline"""
+
+    def __init__(self, pipeline, medicao=None):
+        self.pipeline = pipeline
+        self.medicao = medicao
+        self.pronta = False
+        self.valor = None
+        self.erro = None
+
+    def resolver(self, valor):
+        self.valor = valor
+        self.pronta = True
+
+    def falhar(self, erro):
+        self.erro = erro
+        self.pronta = True
+
+    def resultado(self):
+        """Bloqueia até a resposta chegar (lendo as anteriores, se preciso)"""
+        while not self.pronta:
+            self.pipeline.receber_proxima()
+        if self.erro is not None:
+            raise self.erro
+        return self.valor
+
+
+class Pipeline:
+    """Mantém até `profundidade` requisições em voo num cliente conectado"""
+
+    def __init__(self, cliente, profundidade: int = 16):
+        if profundidade < 1:
+            raise ValueError("profundidade deve ser pelo menos 1")
+        self.cliente = cliente
+        self.profundidade = profundidade
+        self.pendentes = deque()
+
+    def __enter__(self):
+        self.cliente.pipeline_ativo = self
+        return self
+
+    def __exit__(self, *exc):
+        try:
+            self.concluir()
+        finally:
+            self.cliente.pipeline_ativo = None
+        return False
+
+    def submeter(self, mensagem, medicao=None):
+        """Envia uma requisição já montada; lê respostas antigas se o pipeline encheu"""
+        if len(self.pendentes) >= self.profundidade:
+            while len(self.pendentes) >= self.profundidade:
+                self.receber_proxima()
+            if medicao:
+                medicao.inicio = time.perf_counter()  # a espera por vaga não conta como serializar
+        self.cliente.enviar(mensagem, medicao)
+        pendente = RespostaPendente(self, medicao)
+        self.pendentes.append(pendente)
+        return pendente
+
+    def receber_proxima(self):
+        """Lê uma resposta e entrega à requisição mais antiga em voo"""
+        pendente = self.pendentes.popleft()
+        try:
+            resposta = self.cliente.receber(pendente.medicao)
+        except (OSError, ValueError) as e:
+            # Conexão perdida ou resposta ilegível: o resto do pipeline não tem mais como casar
+            pendente.falhar(e)
+            while self.pendentes:
+                self.pendentes.popleft().falhar(e)
+            raise
+        pendente.resolver(self.cliente.interpretar_operacao(resposta))
+        if pendente.medicao:
+            # Esperar inclui a fila atrás das respostas anteriores, como no fio
+            self.cliente.metricas.registrar(pendente.medicao.concluir())
+
+    def concluir(self):
+        """Espera todas as respostas em voo"""
+        while self.pendentes:
+            self.receber_proxima()
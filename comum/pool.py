@@ -0,0 +1,191 @@
+"""
+Pool de sessões já conectadas e autenticadas
+
+Cada usuário lógico pega emprestado um cliente pronto em vez de pagar
+conexão TCP + AUTH. Uma thread renova o token das sessões ociosas antes
+de ele expirar (o servidor dá validade de 1 hora).
+
+    pool = PoolSessoes(lambda: ClienteJSON(host), aluno_id, tamanho=8)
+    with pool:
+        with pool.sessao() as cliente:
+            cliente.echo("oi")
+"""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+VALIDADE_TOKEN = 3600  # segundos
+MARGEM_RENOVACAO = 300  # renova quando faltar menos que isso
+
+
+class PoolSessoes:
+    """Empresta clientes autenticados de um mesmo protocolo"""
+
+    def __init__(self, fabrica, aluno_id, tamanho: int = 4,
+                 validade: float = VALIDADE_TOKEN, margem: float = MARGEM_RENOVACAO,
+                 intervalo: float = 30):
+        self.fabrica = fabrica  # cria um cliente ainda desconectado
+        self.aluno_id = aluno_id
+        self.tamanho = tamanho
+        self.validade = validade
+        self.margem = margem
+        self.intervalo = intervalo
+        self.livres = deque()
+        self.autenticado_em = {}
+        self.criadas = 0
+        self.fechado = False
+        self.condicao = threading.Condition()
+        self.parar = threading.Event()
+        self.renovador = None
+
+    def __enter__(self):
+        self.abrir()
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+        return False
+
+    def abrir(self, aquecer: bool = True):
+        """Inicia a renovação em segundo plano e, se pedido, já cria todas as sessões"""
+        if aquecer:
+            while self.criadas < self.tamanho:
+                self.criadas += 1
+                try:
+                    self.livres.append(self._nova_sessao())
+                except Exception:
+                    self.criadas -= 1
+                    raise
+        self.renovador = threading.Thread(target=self._renovar_periodicamente, daemon=True)
+        self.renovador.start()
+
+    def fechar(self):
+        """Faz logout e fecha as sessões ociosas"""
+        with self.condicao:
+            self.fechado = True
+            self.parar.set()
+            livres, self.livres = list(self.livres), deque()
+            self.condicao.notify_all()
+        for cliente in livres:
+            self._encerrar(cliente, logout=True)
+
+    def emprestar(self, timeout: float = None):
+        """Retira uma sessão autenticada (cria uma nova se o pool ainda não encheu)"""
+        limite = None if timeout is None else time.monotonic() + timeout
+        with self.condicao:
+            while True:
+                if self.fechado:
+                    raise RuntimeError("Pool fechado")
+                if self.livres:
+                    cliente = self.livres.pop()
+                    break
+                if self.criadas < self.tamanho:
+                    self.criadas += 1
+                    cliente = None
+                    break
+                restante = None if limite is None else limite - time.monotonic()
+                if restante is not None and restante <= 0:
+                    raise TimeoutError("Nenhuma sessão livre no pool")
+                self.condicao.wait(restante)
+
+        if cliente is None:
+            try:
+                return self._nova_sessao()
+            except Exception:
+                self._liberar_vaga()
+                raise
+        if self._idade(cliente) >= self.validade - self.margem:
+            return self._renovar(cliente)
+        return cliente
+
+    def devolver(self, cliente, descartar: bool = False):
+        """Devolve a sessão; descartar=True quando a conexão ficou inutilizável"""
+        if descartar:
+            self._encerrar(cliente)
+            self._liberar_vaga()
+            return
+        with self.condicao:
+            if not self.fechado:
+                self.livres.append(cliente)
+                self.condicao.notify()
+                return
+        self._encerrar(cliente, logout=True)
+
+    @contextmanager
+    def sessao(self, timeout: float = None):
+        """Empresta uma sessão pelo tempo do bloco with"""
+        cliente = self.emprestar(timeout)
+        try:
+            yield cliente
+        except (OSError, ValueError):
+            # Conexão caiu ou fluxo dessincronizado: não volta para o pool
+            self.devolver(cliente, descartar=True)
+            raise
+        except BaseException:
+            self.devolver(cliente)
+            raise
+        else:
+            self.devolver(cliente)
+
+    def _nova_sessao(self):
+        cliente = self.fabrica()
+        cliente.conectar()
+        try:
+            if not cliente.autenticar(self.aluno_id):
+                raise ConnectionError("Falha na autenticação do pool")
+        except Exception:
+            cliente.desconectar()
+            raise
+        self.autenticado_em[cliente] = time.monotonic()
+        return cliente
+
+    def _renovar(self, cliente):
+        """Encerra o token antigo e reautentica na mesma conexão; se não der, troca por uma sessão nova"""
+        try:
+            # Sem o logout a sessão antiga fica aberta no servidor até vencer;
+            # se ela já venceu o servidor recusa, o que não impede a renovação
+            cliente.logout()
+            if cliente.autenticar(self.aluno_id):
+                self.autenticado_em[cliente] = time.monotonic()
+                return cliente
+        except OSError:
+            pass
+        self._encerrar(cliente)
+        try:
+            return self._nova_sessao()
+        except Exception:
+            self._liberar_vaga()
+            raise
+
+    def _renovar_periodicamente(self):
+        while not self.parar.wait(self.intervalo):
+            with self.condicao:
+                vencendo = [c for c in self.livres
+                            if self._idade(c) >= self.validade - self.margem]
+                for cliente in vencendo:
+                    self.livres.remove(cliente)
+            for cliente in vencendo:
+                try:
+                    self.devolver(self._renovar(cliente))
+                except Exception as e:
+                    print(f"Pool: falha ao renovar sessão: {e}")
+
+    def _idade(self, cliente):
+        return time.monotonic() - self.autenticado_em.get(cliente, 0)
+
+    def _encerrar(self, cliente, logout: bool = False):
+        self.autenticado_em.pop(cliente, None)
+        try:
+            if logout:
+                cliente.logout()
+        except OSError:
+            pass
+        finally:
+            cliente.desconectar()
+
+    def _liberar_vaga(self):
+        with self.condicao:
+            self.criadas -= 1
+            self.condicao.notify()
@@ -0,0 +1,95 @@
+"""
+Destinos de rastreio das mensagens enviadas e recebidas pelos clientes
+
+Os clientes só formatam e escrevem mensagens quando o destino está ativo,
+então o destino padrão (RastreioNulo) não custa nada no caminho quente.
+"""
+
+import json
+import time
+from collections import deque
+
+ENVIADO = "📤 ENVIANDO"
+RECEBIDO = "📥 RECEBIDO"
+
+
+def formatar(mensagem):
+    """Converte a mensagem (str, dict ou Protocol Buffers) em texto legível"""
+    if isinstance(mensagem, (dict, list)):
+        return json.dumps(mensagem, indent=2, ensure_ascii=False)
+    if isinstance(mensagem, (bytes, bytearray, memoryview)):
+        return bytes(mensagem).decode('utf-8', errors='replace').strip()
+    return str(mensagem).strip()
+
+
+class RastreioNulo:
+    """Descarta tudo (padrão)"""
+
+    ativo = False
+
+    def registrar(self, direcao, mensagem, tamanho=None):
+        pass
+
+    def fechar(self):
+        pass
+
+
+class RastreioTerminal:
+    """Imprime cada mensagem no terminal, como nos menus interativos"""
+
+    ativo = True
+
+    def registrar(self, direcao, mensagem, tamanho=None):
+        print(f"\n{'─'*60}")
+        print(f"{direcao}:")
+        if tamanho is not None:
+            print(f"Tamanho: {tamanho} bytes")
+        print(formatar(mensagem))
+        print('─'*60)
+
+    def fechar(self):
+        pass
+
+
+class RastreioMemoria:
+    """Guarda as últimas mensagens num buffer circular, sem formatá-las"""
+
+    ativo = True
+
+    def __init__(self, capacidade: int = 1000):
+        self.eventos = deque(maxlen=capacidade)
+
+    def registrar(self, direcao, mensagem, tamanho=None):
+        self.eventos.append((time.time(), direcao, mensagem, tamanho))
+
+    def linhas(self):
+        """Formata os eventos guardados (só quando alguém for ler)"""
+        return [_linha(*evento) for evento in self.eventos]
+
+    def limpar(self):
+        self.eventos.clear()
+
+    def fechar(self):
+        pass
+
+
+class RastreioArquivo:
+    """Escreve cada mensagem num arquivo de log"""
+
+    ativo = True
+
+    def __init__(self, caminho: str):
+        self.arquivo = open(caminho, 'a', encoding='utf-8')
+
+    def registrar(self, direcao, mensagem, tamanho=None):
+        self.arquivo.write(_linha(time.time(), direcao, mensagem, tamanho) + '\n')
+
+    def fechar(self):
+        self.arquivo.close()
+
+
+def _linha(instante, direcao, mensagem, tamanho):
+    """Uma linha de log por mensagem"""
+    texto = formatar(mensagem).replace('\n', ' ')
+    sufixo = f" ({tamanho} bytes)" if tamanho is not None else ""
+    return f"{instante:.6f} {direcao}{sufixo}: {texto}"
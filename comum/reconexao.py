@@ -0,0 +1,235 @@
+"""
+Reconexão automática e reautenticação transparente
+
+Workers de longa duração perdem a sessão quando o token vence (1 hora) ou o
+servidor reinicia. ClienteReconectavel envolve um cliente (síncrono ou
+asyncio) e, em cada operação:
+
+- sem sessão, ou com erro de token na resposta ("Token inválido"), autentica
+  de novo e repete a operação: o servidor recusou antes de executar, então
+  repetir é sempre seguro;
+- com a conexão perdida (ConnectionError, timeout), reconecta com espera
+  exponencial e jitter, autentica e repete a operação se ela for idempotente.
+  Com várias réplicas, a que caiu vai para a quarentena e a reconexão
+  prefere as outras (failover).
+
+    cliente = ClienteReconectavel(ClienteJSON(host), aluno_id)
+    cliente.conectar()
+    cliente.echo("oi")    # autentica na primeira chamada
+    print(cliente.metricas_reconexao())
+"""
+
+import asyncio
+import contextlib
+import inspect
+import random
+import time
+
+# Operações do servidor sem efeito além do registro no histórico
+IDEMPOTENTES = frozenset({'echo', 'soma', 'timestamp', 'status', 'historico'})
+
+
+def erro_de_sessao(texto):
+    """Erro do servidor que indica token vencido ou desconhecido"""
+    return bool(texto) and 'token' in str(texto).lower()
+
+
+class SessaoRecusada(Exception):
+    """O servidor recusou a reautenticação"""
+
+
+class ClienteReconectavel:
+    """Envolve um cliente com reconexão, reautenticação e repetição de operações
+
+    Dentro de um pipeline as operações passam direto: as respostas pendentes
+    não têm como ser repetidas. No asyncio, as corrotinas que perdem a mesma
+    conexão esperam uma única reconexão.
+    """
+
+    def __init__(self, cliente, aluno_id=None, tentativas: int = 5,
+                 espera_inicial: float = 0.1, espera_maxima: float = 5.0,
+                 idempotentes=IDEMPOTENTES):
+        self.cliente = cliente
+        self.aluno_id = aluno_id
+        self.tentativas = tentativas
+        self.espera_inicial = espera_inicial
+        self.espera_maxima = espera_maxima
+        self.idempotentes = frozenset(idempotentes)
+        self.assincrono = inspect.iscoroutinefunction(cliente.operacao)
+        self.contadores = {'reconexoes': 0, 'reautenticacoes': 0, 'repeticoes': 0, 'falhas': 0}
+        # asyncio: várias corrotinas falham juntas; só a primeira restabelece a sessão
+        self.geracao = 0
+        self.trava = None
+
+    def __getattr__(self, nome):
+        return getattr(self.cliente, nome)
+
+    def autenticar(self, aluno_id):
+        """Autentica e guarda o aluno_id para as reautenticações"""
+        self.aluno_id = aluno_id
+        return self.cliente.autenticar(aluno_id)
+
+    # Operações
+
+    def operacao(self, nome, parametros=None, **params):
+        return self._executar((nome,), lambda: self.cliente.operacao(nome, parametros, **params))
+
+    def echo(self, mensagem):
+        return self._executar(('echo',), lambda: self.cliente.echo(mensagem))
+
+    def soma(self, numeros):
+        return self._executar(('soma',), lambda: self.cliente.soma(numeros))
+
+    def timestamp(self):
+        return self._executar(('timestamp',), self.cliente.timestamp)
+
+    def status(self, detalhado=False):
+        return self._executar(('status',), lambda: self.cliente.status(detalhado))
+
+    def historico(self, limite=10):
+        return self._executar(('historico',), lambda: self.cliente.historico(limite))
+
+    def batch(self, operacoes):
+        operacoes = list(operacoes)
+        nomes = tuple(op if isinstance(op, str) else op[0] for op in operacoes)
+        return self._executar(nomes, lambda: self.cliente.batch(operacoes))
+
+    def metricas_reconexao(self):
+        """Reconexões, reautenticações, operações repetidas e falhas entregues"""
+        return dict(self.contadores)
+
+    # Execução com retomada
+
+    def _executar(self, nomes, chamada):
+        if self.assincrono:
+            return self._executar_async(nomes, chamada)
+        if self.cliente.pipeline_ativo:
+            return chamada()
+        tentativa = 0
+        reconectar = False
+        while True:
+            enviada = False
+            try:
+                if reconectar:
+                    self._reconectar()
+                    reconectar = False
+                if not self.cliente.token and self.aluno_id is not None:
+                    self._reautenticar()
+                token = self.cliente.token
+                self.cliente.codec.ultimo_erro = None
+                enviada = True
+                resultado = chamada()
+            except OSError:
+                tentativa += 1
+                if not self._pode_repetir(nomes, enviada, tentativa):
+                    self.contadores['falhas'] += 1
+                    raise
+                time.sleep(self._espera(tentativa))
+                reconectar = True
+                continue
+            if self._sessao_recusada(resultado) and tentativa < self.tentativas:
+                tentativa += 1
+                self._descartar_token(token)
+                self.contadores['repeticoes'] += 1
+                continue
+            return resultado
+
+    async def _executar_async(self, nomes, chamada):
+        if self.trava is None:
+            self.trava = asyncio.Lock()
+        tentativa = 0
+        reconectar = False
+        geracao = self.geracao
+        while True:
+            enviada = False
+            try:
+                if reconectar:
+                    await self._reconectar_async(geracao)
+                    reconectar = False
+                geracao = self.geracao  # conexão usada nesta tentativa
+                if not self.cliente.token and self.aluno_id is not None:
+                    await self._reautenticar_async()
+                token = self.cliente.token
+                self.cliente.codec.ultimo_erro = None
+                enviada = True
+                resultado = await chamada()
+            except (OSError, asyncio.TimeoutError):
+                tentativa += 1
+                if not self._pode_repetir(nomes, enviada, tentativa):
+                    self.contadores['falhas'] += 1
+                    raise
+                await asyncio.sleep(self._espera(tentativa))
+                reconectar = True
+                continue
+            if self._sessao_recusada(resultado) and tentativa < self.tentativas:
+                tentativa += 1
+                self._descartar_token(token)
+                self.contadores['repeticoes'] += 1
+                continue
+            return resultado
+
+    def _descartar_token(self, token):
+        """Esquece o token recusado, se ninguém já o trocou por um novo"""
+        if self.cliente.token == token:
+            self.cliente.token = None
+
+    def _pode_repetir(self, nomes, enviada, tentativa):
+        """Repete se ainda há tentativas e a operação não saiu ou é idempotente"""
+        if tentativa > self.tentativas:
+            return False
+        if enviada and not all(nome in self.idempotentes for nome in nomes):
+            return False
+        if enviada:
+            self.contadores['repeticoes'] += 1
+        return True
+
+    def _sessao_recusada(self, resultado):
+        """Resultado vazio (ou batch com falhas) por causa do token"""
+        if isinstance(resultado, list):
+            falhou = any(item is None for item in resultado)
+        else:
+            falhou = resultado is None
+        return falhou and erro_de_sessao(self.cliente.codec.ultimo_erro)
+
+    def _espera(self, tentativa):
+        """Espera exponencial com jitter (metade fixa, metade sorteada)"""
+        espera = min(self.espera_maxima, self.espera_inicial * 2 ** (tentativa - 1))
+        return random.uniform(espera / 2, espera)
+
+    def _abandonar_endpoint(self):
+        """A réplica da conexão perdida fica fora da preferência por um tempo"""
+        if self.cliente.endpoint:
+            self.cliente.balanceador.falhou(self.cliente.endpoint)
+
+    def _reconectar(self):
+        self._abandonar_endpoint()
+        with contextlib.suppress(OSError):
+            self.cliente.desconectar()
+        self.cliente.token = None
+        self.cliente.conectar()
+        self.contadores['reconexoes'] += 1
+
+    async def _reconectar_async(self, geracao):
+        async with self.trava:
+            if self.geracao != geracao:
+                return  # outra corrotina já reconectou
+            self._abandonar_endpoint()
+            with contextlib.suppress(OSError):
+                await self.cliente.desconectar()
+            self.cliente.token = None
+            await self.cliente.conectar()
+            self.geracao += 1
+            self.contadores['reconexoes'] += 1
+
+    def _reautenticar(self):
+        if not self.cliente.autenticar(self.aluno_id):
+            raise SessaoRecusada(f"Autenticação de {self.aluno_id} recusada")
+        self.contadores['reautenticacoes'] += 1
+
+    async def _reautenticar_async(self):
+        async with self.trava:
+            if self.cliente.token:
+                return  # outra corrotina já autenticou
+            if not await self.cliente.autenticar(self.aluno_id):
+                raise SessaoRecusada(f"Autenticação de {self.aluno_id} recusada")
+            self.contadores['reautenticacoes'] += 1
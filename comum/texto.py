@@ -0,0 +1,150 @@
+"""
+Protocolo de strings: campos, escape opcional e literais aninhados
+
+Formato: TIPO|chave=valor|...|FIM. O servidor remoto não escapa nada: um |
+dentro de um valor quebra o campo, e uma barra invertida é só uma barra.
+Por isso o padrão aqui é o mesmo, sem escape. Com escapes=True (combinado
+no AUTH, veja CodecStrings), a barra invertida escapa o caractere seguinte
+em chaves e valores: \\| \\= \\\\ e \\n/\\r para quebras de linha.
+
+analisar continua com split/partition: num interpretador CPython o split em C
+ganhou de um tokenizador por regex (findall) e de dict(map(...)) nas
+respostas típicas (benchmark/micro_strings.py). O ganho está nos campos
+aninhados (estatisticas, sessoes_detalhes, operacoes...), que chegam como
+repr de dict/list do Python: `literal` converte esse texto em objeto sem
+ast.literal_eval, trocando os tokens do Python pelos do JSON numa passada de
+regex e entregando ao json.loads, que é em C.
+"""
+
+import json
+import re
+
+TERMINADOR = '|FIM'
+
+_ESPECIAIS_VALOR = re.compile(r'[\\|\n\r]')
+_ESPECIAIS_CHAVE = re.compile(r'[\\|=\n\r]')
+# Marcadores (uso privado do Unicode) para as sequências escapadas durante o split
+_BARRA, _BARRA_VERTICAL, _IGUAL = '\ue000', '\ue001', '\ue002'
+_MARCADORES = re.compile('[\ue000-\ue002]')
+
+
+def escapar(valor, chave=False):
+    """Escapa um valor (ou chave) para caber num campo"""
+    texto = str(valor)
+    if (_ESPECIAIS_CHAVE if chave else _ESPECIAIS_VALOR).search(texto) is None:
+        return texto
+    texto = texto.replace('\\', '\\\\').replace('|', '\\|').replace('\n', '\\n').replace('\r', '\\r')
+    return texto.replace('=', '\\=') if chave else texto
+
+
+def campos(valores, escapes=False):
+    """'|chave=valor|...' (com os campos escapados se combinado)"""
+    if not escapes:
+        return ''.join([f"|{chave}={valor}" for chave, valor in valores.items()])
+    return ''.join([f"|{escapar(chave, True)}={escapar(valor)}" for chave, valor in valores.items()])
+
+
+def montar(tipo, valores, escapes=False):
+    """TIPO|chave=valor|...|FIM"""
+    return f"{tipo}{campos(valores, escapes)}{TERMINADOR}"
+
+
+def analisar(texto, escapes=False):
+    """Linha do protocolo -> {'tipo': TIPO, chave: valor, ...}"""
+    if escapes and '\\' in texto:
+        return _analisar_escapado(texto)
+    if texto.endswith(TERMINADOR):
+        texto = texto[:-len(TERMINADOR)]
+    tipo, _, resto = texto.partition('|')
+    resultado = {'tipo': tipo}
+    if resto:
+        for parte in resto.split('|'):
+            chave, igual, valor = parte.partition('=')
+            if igual:
+                resultado[chave] = valor
+    return resultado
+
+
+def _analisar_escapado(texto):
+    """Linha com escapes: troca as sequências por marcadores, divide e restaura"""
+    texto = (texto.replace('\\\\', _BARRA).replace('\\|', _BARRA_VERTICAL).replace('\\=', _IGUAL)
+             .replace('\\n', '\n').replace('\\r', '\r').replace('\\', ''))
+    if texto.endswith(TERMINADOR):
+        texto = texto[:-len(TERMINADOR)]
+    tipo, _, resto = texto.partition('|')
+    resultado = {'tipo': _restaurar(tipo)}
+    if resto:
+        for parte in resto.split('|'):
+            chave, igual, valor = parte.partition('=')
+            if igual:
+                resultado[_restaurar(chave)] = _restaurar(valor)
+    return resultado
+
+
+def _restaurar(texto):
+    if _MARCADORES.search(texto) is None:
+        return texto
+    return texto.replace(_BARRA, '\\').replace(_BARRA_VERTICAL, '|').replace(_IGUAL, '=')
+
+
+# Literais aninhados
+
+_LITERAL = re.compile(r"""
+    '((?:[^'\\]|\\.)*)'            # string com aspas simples
+  | "((?:[^"\\]|\\.)*)"            # string com aspas duplas
+  | \b(True|False|None)\b
+  | (?<![\w.])(-?inf|nan)\b
+  | ([()])
+""", re.S | re.X)
+_CONSTANTES = {'True': 'true', 'False': 'false', 'None': 'null',
+               'inf': 'Infinity', 'nan': 'NaN', '(': '[', ')': ']'}
+
+
+_ESCAPE_PY = re.compile(r"\\(x[0-9a-fA-F]{2}|u[0-9a-fA-F]{4}|U[0-9a-fA-F]{8}|.)", re.S)
+_ESCAPES_PY = {'n': '\n', 'r': '\r', 't': '\t', '0': '\0', 'a': '\a', 'b': '\b',
+               'f': '\f', 'v': '\v', '\\': '\\', "'": "'", '"': '"'}
+
+
+def _escape_py(casamento):
+    codigo = casamento.group(1)
+    if len(codigo) > 1:
+        return chr(int(codigo[1:], 16))
+    return _ESCAPES_PY.get(codigo, '\\' + codigo)
+
+
+def _para_json(casamento):
+    simples, duplas, constante, especial, parentese = casamento.groups()
+    texto = simples if simples is not None else duplas
+    if texto is not None:
+        if '\\' not in texto and '"' not in texto:
+            return f'"{texto}"'
+        return json.dumps(_ESCAPE_PY.sub(_escape_py, texto), ensure_ascii=False)
+    if especial:
+        return especial.replace(especial.lstrip('-'), _CONSTANTES[especial.lstrip('-')])
+    return _CONSTANTES[constante or parentese]
+
+
+def literal(texto):
+    """repr de dict/list/número do Python -> objeto; ValueError se não for literal
+
+    Só entram literais de dados (strings, números, True/False/None, dict,
+    list, tupla como lista); chaves de dict precisam ser strings.
+    """
+    if not isinstance(texto, str):
+        return texto
+    try:
+        if '"' in texto or '\\' in texto:
+            return json.loads(_LITERAL.sub(_para_json, texto))
+        # Sem aspas duplas nem escapes, cada ' abre ou fecha uma string: os
+        # trechos pares estão fora das strings e só têm pontuação, números e
+        # constantes, que dá para trocar com str.replace
+        partes = texto.split("'")
+        for i in range(0, len(partes), 2):
+            codigo = partes[i]
+            if codigo.strip(' ,:{}[]0123456789.-+e'):
+                for python, js in _CONSTANTES.items():
+                    codigo = codigo.replace(python, js)
+                partes[i] = codigo
+        return json.loads('"'.join(partes))
+    except ValueError as e:
+        raise ValueError(f"Literal inválido: {texto[:60]!r}") from e
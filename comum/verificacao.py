@@ -0,0 +1,204 @@
+"""
+Conferência local de ECHO/SOMA e memo LRU de chamadas repetidas
+
+O hash MD5 do echo e as estatísticas da soma podem ser calculados pelo
+próprio cliente. ClienteVerificado envolve qualquer cliente (síncrono ou
+asyncio), confere o que o servidor devolveu e conta as divergências; com
+memo > 0, chamadas idênticas são respondidas localmente, sem ida à rede.
+
+    cliente = ClienteVerificado(ClienteJSON(host), memo=256)
+    cliente.conectar(); cliente.autenticar(aluno_id)
+    cliente.echo("oi"); cliente.echo("oi")      # a segunda vem do memo
+    print(cliente.metricas_verificacao())
+"""
+
+import hashlib
+import inspect
+import math
+import sys
+from array import array
+from collections import Counter, OrderedDict, deque
+
+from comum.vetores import como_lista, como_vetor
+
+_AUSENTE = object()
+
+
+def chave_numeros(numeros):
+    """Chave compacta para o memo da SOMA (resumo dos bytes dos doubles)"""
+    valores = array('d', como_lista(numeros))
+    return len(valores), hashlib.blake2b(valores.tobytes(), digest_size=16).digest()
+
+
+def esperado_echo(mensagem):
+    """Campos do ECHO que o cliente consegue calcular sozinho"""
+    return {
+        'mensagem_eco': mensagem,
+        'hash_md5': hashlib.md5(mensagem.encode('utf-8')).hexdigest(),
+        'tamanho_mensagem': len(mensagem),
+    }
+
+
+def esperado_soma(numeros):
+    """Estatísticas da SOMA calculadas localmente"""
+    valores = [float(n) for n in como_lista(numeros)]
+    if not valores:
+        return {}
+    soma = sum(valores)  # como o servidor: soma simples, na ordem, não math.fsum
+    return {
+        'quantidade': len(valores),
+        'soma': soma,
+        'media': soma / len(valores),
+        'maximo': max(valores),
+        'minimo': min(valores),
+    }
+
+
+def tolerancias_soma(numeros):
+    """Erro absoluto aceito em soma/media: o de arredondamento da soma simples
+
+    A soma em lotes (ou em outra ordem) arredonda diferente; com cancelamento
+    o erro é relativo à grandeza das parcelas, não ao resultado.
+    """
+    valores = como_lista(numeros)
+    if not valores:
+        return {}
+    limite = len(valores) * sys.float_info.epsilon * math.fsum(abs(float(n)) for n in valores)
+    return {'soma': limite, 'media': limite / len(valores)}
+
+
+def _iguais(esperado, recebido, tolerancia=0.0):
+    """Compara tolerando números que chegam como texto (strings/protobuf com map)"""
+    if isinstance(esperado, str):
+        return str(recebido) == esperado
+    try:
+        return math.isclose(float(esperado), float(recebido), rel_tol=1e-9,
+                            abs_tol=max(1e-9, tolerancia))
+    except (TypeError, ValueError):
+        return False
+
+
+class Verificacao:
+    """Contadores de conferência por operação e campo divergente"""
+
+    def __init__(self, capacidade: int = 100):
+        self.verificadas = Counter()
+        self.divergencias = Counter()
+        self.ultimas = deque(maxlen=capacidade)
+
+    def conferir(self, operacao, esperado, resultado, tolerancias=None):
+        """Compara os campos presentes no resultado; devolve os divergentes"""
+        self.verificadas[operacao] += 1
+        tolerancias = tolerancias or {}
+        divergentes = []
+        for campo, valor in esperado.items():
+            recebido = resultado.get(campo, _AUSENTE)
+            if recebido is _AUSENTE or _iguais(valor, recebido, tolerancias.get(campo, 0.0)):
+                continue
+            divergentes.append(campo)
+            self.divergencias[f"{operacao}.{campo}"] += 1
+            self.ultimas.append({'operacao': operacao, 'campo': campo,
+                                 'esperado': valor, 'recebido': recebido})
+        return divergentes
+
+    def resumo(self):
+        return {
+            'verificadas': dict(self.verificadas),
+            'divergencias': dict(self.divergencias),
+        }
+
+
+class MemoLRU:
+    """Cache LRU de resultados, por chave da requisição"""
+
+    def __init__(self, capacidade: int = 1024):
+        self.capacidade = capacidade
+        self.itens = OrderedDict()
+        self.acertos = 0
+        self.faltas = 0
+
+    def obter(self, chave):
+        valor = self.itens.get(chave, _AUSENTE)
+        if valor is _AUSENTE:
+            self.faltas += 1
+        else:
+            self.acertos += 1
+            self.itens.move_to_end(chave)
+        return valor
+
+    def guardar(self, chave, valor):
+        self.itens[chave] = valor
+        self.itens.move_to_end(chave)
+        if len(self.itens) > self.capacidade:
+            self.itens.popitem(last=False)
+
+    def limpar(self):
+        self.itens.clear()
+
+    def resumo(self):
+        return {'itens': len(self.itens), 'acertos': self.acertos, 'faltas': self.faltas}
+
+
+class ClienteVerificado:
+    """Envolve um cliente: confere echo/soma e, com memo > 0, memoiza as duas
+
+    As demais operações e atributos passam direto para o cliente. Dentro de
+    um pipeline (RespostaPendente) o resultado não é conferido nem guardado.
+    """
+
+    def __init__(self, cliente, verificar: bool = True, memo: int = 0):
+        self.cliente = cliente
+        self.verificacao = Verificacao() if verificar else None
+        self.memo = MemoLRU(memo) if memo else None
+
+    def __getattr__(self, nome):
+        return getattr(self.cliente, nome)
+
+    def echo(self, mensagem):
+        """Operação ECHO conferida contra o MD5 local"""
+        return self._executar('echo', ('echo', mensagem),
+                              lambda: self.cliente.echo(mensagem),
+                              lambda: (esperado_echo(mensagem), None))
+
+    def soma(self, numeros):
+        """Operação SOMA conferida contra as estatísticas locais"""
+        # Normaliza uma vez (texto "1, 2, 3", array, NumPy) para a chave, a conferência e o cliente
+        numeros = como_vetor(numeros)
+        chave = ('soma',) + chave_numeros(numeros) if self.memo is not None else None
+        return self._executar('soma', chave,
+                              lambda: self.cliente.soma(numeros),
+                              lambda: (esperado_soma(numeros), tolerancias_soma(numeros)))
+
+    def metricas_verificacao(self):
+        """Divergências e acertos do memo"""
+        return {
+            'verificacao': self.verificacao.resumo() if self.verificacao else None,
+            'memo': self.memo.resumo() if self.memo else None,
+        }
+
+    def _executar(self, operacao, chave, chamar, esperado):
+        assincrono = inspect.iscoroutinefunction(self.cliente.operacao)
+        if self.memo is not None:
+            guardado = self.memo.obter(chave)
+            if guardado is not _AUSENTE:
+                return self._pronto(guardado) if assincrono else guardado
+        resultado = chamar()
+        if assincrono:
+            return self._concluir_async(operacao, chave, resultado, esperado)
+        return self._concluir(operacao, chave, resultado, esperado)
+
+    def _concluir(self, operacao, chave, resultado, esperado):
+        if not isinstance(resultado, dict):
+            return resultado  # None (erro) ou RespostaPendente
+        if self.verificacao is not None:
+            campos, tolerancias = esperado()
+            self.verificacao.conferir(operacao, campos, resultado, tolerancias)
+        if self.memo is not None:
+            self.memo.guardar(chave, resultado)
+        return resultado
+
+    async def _concluir_async(self, operacao, chave, resultado, esperado):
+        return self._concluir(operacao, chave, await resultado, esperado)
+
+    async def _pronto(self, valor):
+        return valor
@@ -0,0 +1,103 @@
+"""
+Vetores de números para a SOMA: entrada em bloco, texto numa passada e lotes
+
+A SOMA aceita listas, tuplas, array.array e arrays NumPy. Entradas maiores
+que o lote vão em várias requisições (em pipeline, ou concorrentes nos
+clientes asyncio) e os resultados parciais são mesclados no cliente.
+"""
+
+import asyncio
+import inspect
+import math
+from array import array
+
+try:
+    import numpy
+except ImportError:  # NumPy é opcional
+    numpy = None
+
+TAMANHO_LOTE = 50_000     # números por requisição
+PROFUNDIDADE_LOTES = 4    # lotes em voo ao mesmo tempo
+
+
+def como_vetor(numeros):
+    """Normaliza a entrada para algo fatiável com len(): lista, array('d') ou ndarray 1-D"""
+    if numpy is not None and isinstance(numeros, numpy.ndarray):
+        return numpy.ascontiguousarray(numeros, dtype=numpy.float64).ravel()
+    if isinstance(numeros, array):
+        return numeros if numeros.typecode == 'd' else array('d', numeros)
+    if isinstance(numeros, (list, tuple)):
+        return numeros
+    if isinstance(numeros, str):
+        # Texto digitado: "1, 2.5, 3" ou "[1, 2.5, 3]"
+        return [float(n) for n in numeros.strip().strip('[]').split(',') if n.strip()]
+    return list(numeros)
+
+
+def como_lista(numeros):
+    """Lista de números nativos (tolist() converte ndarray/array em C, de uma vez)"""
+    if isinstance(numeros, list):
+        return numeros
+    if hasattr(numeros, 'tolist'):
+        return numeros.tolist()
+    return list(numeros)
+
+
+def texto_numeros(numeros, separador=','):
+    """Números em texto numa passada só (repr de float é exato e igual ao str)"""
+    return separador.join(map(repr, como_lista(numeros)))
+
+
+def lotes(numeros, tamanho=TAMANHO_LOTE):
+    """Fatias consecutivas de no máximo tamanho números"""
+    return [numeros[i:i + tamanho] for i in range(0, len(numeros), tamanho)]
+
+
+def mesclar_somas(parciais):
+    """Junta os resultados parciais dos lotes no formato de um resultado só; None se algum lote falhou
+
+    Mantém as chaves e os tipos que o protocolo devolveu (texto no protocolo
+    de strings e no map do protobuf, números no JSON e no protobuf tipado).
+    """
+    if not parciais or any(p is None for p in parciais):
+        return None
+    soma = math.fsum(float(p['soma']) for p in parciais)
+    quantidade = sum(int(float(p['quantidade'])) for p in parciais)
+    mesclado = {
+        'numeros_originais': _juntar_originais([p.get('numeros_originais') for p in parciais]),
+        'quantidade': quantidade,
+        'soma': soma,
+        'media': soma / quantidade if quantidade else 0.0,
+        'maximo': max(float(p['maximo']) for p in parciais),
+        'minimo': min(float(p['minimo']) for p in parciais),
+    }
+    resultado = dict(parciais[-1])  # tipo, timestamp_calculo... como vieram no último lote
+    for chave, valor in mesclado.items():
+        if chave in resultado:
+            resultado[chave] = str(valor) if isinstance(resultado[chave], str) else valor
+    return resultado
+
+
+def _juntar_originais(partes):
+    """Listas de números de cada lote numa só (em texto: '[1.0, 2.0]' + '[3.0]')"""
+    if any(p is None for p in partes):
+        return None
+    if all(isinstance(p, str) for p in partes):
+        return f"[{', '.join(p.strip()[1:-1] for p in partes if p.strip()[1:-1])}]"
+    return [n for parte in partes for n in parte]
+
+
+def somar_em_lotes(cliente, numeros, tamanho=TAMANHO_LOTE):
+    """SOMA de uma entrada grande: um cliente.soma() por lote e mescla no final"""
+    partes = lotes(numeros, tamanho)
+    if inspect.iscoroutinefunction(cliente.operacao):
+        return _somar_em_lotes_async(cliente, partes)
+    if cliente.pipeline_ativo:
+        raise ValueError("SOMA em lotes precisa das respostas para mesclar; chame fora do pipeline")
+    with cliente.pipeline(PROFUNDIDADE_LOTES):
+        pendentes = [cliente.soma(parte) for parte in partes]
+    return mesclar_somas([p.resultado() for p in pendentes])
+
+
+async def _somar_em_lotes_async(cliente, partes):
+    return mesclar_somas(await asyncio.gather(*(cliente.soma(parte) for parte in partes)))
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Execução em lote, sem menu: operações em JSONL, resultados em JSONL
+
+Lê uma operação por linha de um arquivo (ou da entrada padrão), executa em
+qualquer um dos três protocolos com várias sessões e várias operações em voo
+por sessão, e grava um resultado por linha à medida que chegam. Entrada e
+saída correm em fluxo, com filas limitadas: a memória não cresce com o
+tamanho do arquivo.
+
+Entrada (os parâmetros seguem os nomes dos métodos dos clientes; "id" é
+opcional e volta na saída; linhas vazias e começadas por # são ignoradas):
+
+    {"id": "a1", "operacao": "echo", "parametros": {"mensagem": "oi"}}
+    {"operacao": "soma", "parametros": {"numeros": [1, 2, 3]}}
+    {"operacao": "status", "parametros": {"detalhado": true}}
+    {"operacao": "timestamp"}
+
+Saída:
+
+    {"linha": 1, "id": "a1", "operacao": "echo", "sucesso": true, "resultado": {...}, "latencia_ms": 0.41}
+    {"linha": 2, "operacao": "soma", "sucesso": false, "erro": "Token inválido", "latencia_ms": 0.38}
+
+    python executar_lote.py operacoes.jsonl --protocolo protobuf --sessoes 8 --saida resultados.jsonl
+    gerar_operacoes | python executar_lote.py --host 10.0.0.1:8081,10.0.0.2:8081 > resultados.jsonl
+
+Sem --host, sobe o servidor local. As mensagens dos clientes vão para a
+saída de erro; o resumo também. --captura grava o tráfego das sessões para
+benchmark/reproducao.py.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import inspect
+import json
+import os
+import stat
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from comum import RAIZ, registrar_clientes
+from comum.captura import Gravador
+from comum.codec_json import obter_codec
+from comum.reconexao import ClienteReconectavel
+
+registrar_clientes()
+sys.path.insert(0, os.path.join(RAIZ, 'servidor-local'))
+from cliente_json_async import ClienteJSONAsync
+from cliente_protobuf_async import ClienteProtobufAsync
+from cliente_strings_async import ClienteStringsAsync
+from servidor_local import PORTAS, ServidorLocal
+
+CLIENTES = {
+    'strings': ClienteStringsAsync,
+    'json': ClienteJSONAsync,
+    'protobuf': ClienteProtobufAsync,
+}
+
+# Operações com método próprio nos clientes (parâmetros canônicos)
+METODOS = ('echo', 'soma', 'timestamp', 'status', 'historico')
+
+FIM = None  # marca de fim nas filas
+
+
+async def linhas_de(arquivo):
+    """(número, texto) de cada linha, sem travar o loop esperando um pipe"""
+    modo = os.fstat(arquivo.fileno()).st_mode
+    if sys.platform == 'win32' or stat.S_ISREG(modo):
+        # Arquivo comum: a leitura nunca espera por quem escreve
+        for numero, linha in enumerate(arquivo, 1):
+            yield numero, linha
+            if numero % 1024 == 0:
+                await asyncio.sleep(0)
+        return
+    loop = asyncio.get_running_loop()
+    leitor = asyncio.StreamReader(limit=1 << 24)
+    await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(leitor), arquivo)
+    numero = 0
+    while linha := await leitor.readline():
+        numero += 1
+        yield numero, linha
+
+
+def analisar_linha(texto):
+    """(operação, parâmetros, id) de uma linha; ValueError se malformada"""
+    try:
+        pedido = json.loads(texto)
+    except json.JSONDecodeError as erro:
+        raise ValueError(f"JSON inválido: {erro}") from None
+    if not isinstance(pedido, dict) or not isinstance(pedido.get('operacao'), str):
+        raise ValueError("Linha sem o campo 'operacao'")
+    parametros = pedido.get('parametros') or {}
+    if not isinstance(parametros, dict):
+        raise ValueError("'parametros' precisa ser um objeto")
+    return pedido['operacao'], parametros, pedido.get('id')
+
+
+async def executar(cliente, operacao, parametros):
+    if operacao in METODOS:
+        metodo = getattr(cliente, operacao)
+        try:
+            inspect.signature(metodo).bind(**parametros)
+        except TypeError:  # parâmetros que o método não aceita (ou faltando)
+            raise ValueError(f"Parâmetros inválidos para {operacao}: "
+                             f"{', '.join(parametros) or 'nenhum'}") from None
+        return await metodo(**parametros)
+    # Operação que os clientes não conhecem: parâmetros vão como estão
+    return await cliente.operacao(operacao, parametros)
+
+
+class Execucao:
+    """Filas, sessões e contadores de uma execução"""
+
+    def __init__(self, args, saida, gravador=None):
+        self.args = args
+        self.saida = saida
+        self.gravador = gravador
+        self.json = obter_codec()
+        self.entrada = asyncio.Queue(maxsize=args.sessoes * args.profundidade * 4)
+        self.resultados = asyncio.Queue(maxsize=args.sessoes * args.profundidade * 4)
+        self.contadores = {'operacoes': 0, 'sucesso': 0, 'erros': 0}
+
+    async def rodar(self, arquivo):
+        classe = CLIENTES[self.args.protocolo]
+        sessoes = []
+        for _ in range(self.args.sessoes):
+            cliente = classe(self.args.host, self.args.porta)
+            if self.gravador:
+                self.gravador.anexar(cliente)
+            sessoes.append(ClienteReconectavel(cliente, self.args.aluno_id))
+        await asyncio.gather(*(sessao.conectar() for sessao in sessoes))
+        try:
+            trabalhadores = [asyncio.ensure_future(self.trabalhar(sessoes[i % len(sessoes)]))
+                             for i in range(len(sessoes) * self.args.profundidade)]
+            escritor = asyncio.ensure_future(self.escrever())
+            await self.ler(arquivo, len(trabalhadores))
+            await asyncio.gather(*trabalhadores)
+            await self.resultados.put(FIM)
+            await escritor
+        finally:
+            for sessao in sessoes:
+                with contextlib.suppress(OSError, asyncio.TimeoutError):
+                    if sessao.token:
+                        await sessao.logout()
+                await sessao.desconectar()
+
+    async def ler(self, arquivo, trabalhadores):
+        sequencia = 0
+        async for numero, linha in linhas_de(arquivo):
+            linha = linha.strip()
+            if not linha or linha.startswith(b'#' if isinstance(linha, bytes) else '#'):
+                continue
+            await self.entrada.put((sequencia, numero, linha))
+            sequencia += 1
+        for _ in range(trabalhadores):
+            await self.entrada.put(FIM)
+
+    async def trabalhar(self, cliente):
+        while (item := await self.entrada.get()) is not FIM:
+            sequencia, numero, linha = item
+            registro = {'linha': numero}
+            try:
+                operacao, parametros, ident = analisar_linha(linha)
+            except ValueError as erro:
+                registro.update(sucesso=False, erro=str(erro))
+                await self.resultados.put((sequencia, registro))
+                continue
+            if ident is not None:
+                registro['id'] = ident
+            registro['operacao'] = operacao
+            inicio = time.perf_counter()
+            try:
+                resultado = await executar(cliente, operacao, parametros)
+            except (OSError, asyncio.TimeoutError) as erro:
+                registro.update(sucesso=False, erro=f"Conexão: {erro or type(erro).__name__}")
+            except ValueError as erro:  # parâmetros ou valores que o cliente recusa
+                registro.update(sucesso=False, erro=str(erro))
+            except Exception as erro:  # o erro de uma linha não derruba a execução
+                registro.update(sucesso=False, erro=f"{type(erro).__name__}: {erro}")
+            else:
+                if resultado is None:
+                    registro.update(sucesso=False, erro=cliente.codec.ultimo_erro or "Erro desconhecido")
+                else:
+                    registro.update(sucesso=True, resultado=resultado)
+            registro['latencia_ms'] = round((time.perf_counter() - inicio) * 1000, 3)
+            await self.resultados.put((sequencia, registro))
+
+    async def escrever(self):
+        """Grava na ordem de chegada, ou na da entrada com --ordenado"""
+        fora_de_ordem = {}
+        proxima = 0
+        while (item := await self.resultados.get()) is not FIM:
+            sequencia, registro = item
+            if not self.args.ordenado:
+                self.gravar(registro)
+            else:
+                fora_de_ordem[sequencia] = registro
+                while proxima in fora_de_ordem:
+                    self.gravar(fora_de_ordem.pop(proxima))
+                    proxima += 1
+            if self.resultados.empty():
+                self.saida.flush()
+        self.saida.flush()
+
+    def gravar(self, registro):
+        self.contadores['operacoes'] += 1
+        self.contadores['sucesso' if registro['sucesso'] else 'erros'] += 1
+        try:
+            dados = self.json.codificar(registro)
+        except TypeError:  # resultado com tipo que o JSON não conhece
+            dados = json.dumps(registro, ensure_ascii=False, default=str).encode('utf-8')
+        self.saida.write(dados + b'\n')
+
+
+def main():
+    """Função principal"""
+    parser = argparse.ArgumentParser(description="Executa operações de um arquivo JSONL, sem menu")
+    parser.add_argument('entrada', nargs='?', default='-', help="arquivo JSONL (padrão: entrada padrão)")
+    parser.add_argument('--saida', default='-', help="arquivo JSONL de resultados (padrão: saída padrão)")
+    parser.add_argument('--protocolo', default='json', choices=sorted(CLIENTES))
+    parser.add_argument('--host', help="servidor ou réplicas 'h1:porta,h2:porta' (padrão: sobe o servidor local)")
+    parser.add_argument('--porta', type=int, help="porta do servidor (padrão: a do protocolo)")
+    parser.add_argument('--aluno-id', default='554576')
+    parser.add_argument('--sessoes', type=int, default=4, help="conexões autenticadas")
+    parser.add_argument('--profundidade', type=int, default=8, help="operações em voo por sessão")
+    parser.add_argument('--ordenado', action='store_true', help="resultados na ordem da entrada")
+    parser.add_argument('--captura', help="grava o tráfego (.gz para comprimir)")
+    args = parser.parse_args()
+    if args.sessoes < 1 or args.profundidade < 1:
+        parser.error("--sessoes e --profundidade precisam ser pelo menos 1")
+
+    servidor = None
+    if not args.host:
+        servidor = ServidorLocal(portas={args.protocolo: 0}).iniciar_em_thread()
+        args.host = servidor.host
+    args.porta = args.porta or (servidor.portas if servidor else PORTAS)[args.protocolo]
+
+    entrada = sys.stdin if args.entrada == '-' else open(args.entrada, 'rb')
+    saida = sys.stdout.buffer if args.saida == '-' else open(args.saida, 'wb')
+    gravador = Gravador(args.captura, args.protocolo) if args.captura else None
+    inicio = time.monotonic()
+    execucao = Execucao(args, saida, gravador)
+    try:
+        # Os clientes imprimem erros e conexões; a saída padrão fica só com o JSONL
+        with contextlib.redirect_stdout(sys.stderr):
+            asyncio.run(execucao.rodar(entrada))
+    except KeyboardInterrupt:
+        print("\nInterrompido", file=sys.stderr)
+    finally:
+        if entrada is not sys.stdin:
+            entrada.close()
+        if saida is not sys.stdout.buffer:
+            saida.close()
+        if gravador:
+            gravador.fechar()
+        if servidor:
+            servidor.parar_thread()
+
+    duracao = time.monotonic() - inicio
+    contadores = execucao.contadores
+    print(f"{contadores['operacoes']} operações ({contadores['erros']} com erro) em {duracao:.2f} s: "
+          f"{contadores['operacoes'] / duracao if duracao else 0:.0f} ops/s", file=sys.stderr)
+    return 1 if contadores['erros'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,567 @@
+#!/usr/bin/env python3
+"""
+Servidor local de referência para os três protocolos
+
+Implementa o mesmo contrato do servidor remoto (AUTH, echo, soma, timestamp,
+status, historico, LOGOUT) para medir os clientes em loopback, sem depender
+do host da disciplina. Um atraso artificial opcional simula a latência de
+rede sem serializar as requisições em pipeline. Como extensão, JSON e
+protobuf aceitam um lote de operações num quadro só (tipo "lote" /
+ComandoLote), respondido com uma resposta por operação.
+
+    python servidor_local.py                    # portas 8080/8081/8082
+    python servidor_local.py --atraso 20        # +20 ms por resposta
+"""
+
+import argparse
+import asyncio
+import contextlib
+import hashlib
+import json
+import os
+import secrets
+import sys
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from comum import registrar_clientes
+from comum.enquadramento import CABECALHO, TAMANHO_BLOCO, DecodificadorFrames, DecodificadorLinhas
+from comum.texto import analisar, montar
+
+registrar_clientes()
+import mensagens_pb2 as pb
+
+VERSAO = "local-1.0"
+VALIDADE_TOKEN = 3600
+PORTAS = {'strings': 8080, 'json': 8081, 'protobuf': 8082}
+
+
+class ErroProtocolo(Exception):
+    """Erro que vira resposta de erro para o cliente"""
+
+
+class Estado:
+    """Sessões, contadores e histórico compartilhados pelos três protocolos"""
+
+    def __init__(self, validade: float = VALIDADE_TOKEN):
+        self.validade = validade
+        self.inicio = time.time()
+        self.sessoes = {}
+        self.historicos = defaultdict(list)
+        self.operacoes_processadas = 0
+
+    def autenticar(self, aluno_id, ip=None):
+        aluno_id = str(aluno_id or '').strip()
+        if not aluno_id:
+            raise ErroProtocolo("aluno_id obrigatório")
+        token = secrets.token_hex(16)
+        nome = f"ALUNO {aluno_id}"
+        self.sessoes[token] = {
+            'aluno_id': aluno_id,
+            'nome': nome,
+            'ip_cliente': ip or 'N/A',
+            'criado_em': time.time(),
+        }
+        return {
+            'token': token,
+            'nome': nome,
+            'matricula': aluno_id,
+            'timestamp': datetime.now().isoformat(),
+            'timeout_segundos': int(self.validade),
+        }
+
+    def sessao(self, token):
+        sessao = self.sessoes.get(token)
+        if sessao is None:
+            raise ErroProtocolo("Token inválido")
+        if time.time() - sessao['criado_em'] > self.validade:
+            del self.sessoes[token]
+            raise ErroProtocolo("Token inválido")
+        return sessao
+
+    def logout(self, token):
+        sessao = self.sessao(token)
+        del self.sessoes[token]
+        return {'mensagem': f"Logout de {sessao['nome']} realizado"}
+
+    def executar(self, token, operacao, parametros):
+        """Executa a operação e registra no histórico do aluno"""
+        sessao = self.sessao(token)
+        funcao = OPERACOES.get(operacao)
+        self.operacoes_processadas += 1
+        registro = {
+            'operacao': operacao,
+            'parametros': {k: str(v) for k, v in parametros.items()},
+            'timestamp': datetime.now().isoformat(),
+        }
+        try:
+            if funcao is None:
+                raise ErroProtocolo(f"Operação desconhecida: {operacao}")
+            resultado = funcao(self, sessao, parametros)
+        except (ErroProtocolo, ValueError) as e:
+            registro['sucesso'] = False
+            self.historicos[sessao['aluno_id']].append(registro)
+            raise ErroProtocolo(str(e))
+        registro['sucesso'] = True
+        self.historicos[sessao['aluno_id']].append(registro)
+        return resultado
+
+
+# Operações (parâmetros chegam como texto em strings/protobuf e tipados em JSON)
+
+def _verdadeiro(valor):
+    if isinstance(valor, str):
+        return valor.strip().lower() in ('true', '1', 's', 'sim')
+    return bool(valor)
+
+
+def _numeros(valor):
+    if isinstance(valor, str):
+        texto = valor.strip().strip('[]')
+        return [float(n) for n in texto.split(',') if n.strip()]
+    return [float(n) for n in valor]
+
+
+def op_echo(estado, sessao, parametros):
+    mensagem = str(parametros.get('mensagem', ''))
+    return {
+        'mensagem_original': mensagem,
+        'mensagem_eco': mensagem,
+        'hash_md5': hashlib.md5(mensagem.encode('utf-8')).hexdigest(),
+        'tamanho_mensagem': len(mensagem),
+        'timestamp_servidor': datetime.now().isoformat(),
+    }
+
+
+def op_soma(estado, sessao, parametros):
+    numeros = _numeros(parametros.get('numeros', parametros.get('nums', '')))
+    if not numeros:
+        raise ErroProtocolo("Nenhum número informado")
+    soma = sum(numeros)
+    return {
+        'numeros_originais': numeros,
+        'quantidade': len(numeros),
+        'soma': soma,
+        'media': soma / len(numeros),
+        'maximo': max(numeros),
+        'minimo': min(numeros),
+        'timestamp_calculo': datetime.now().isoformat(),
+    }
+
+
+def op_timestamp(estado, sessao, parametros):
+    agora = datetime.now()
+    return {
+        'timestamp_unix': agora.timestamp(),
+        'timestamp_iso': agora.isoformat(),
+        'timestamp_formatado': agora.strftime('%d/%m/%Y %H:%M:%S'),
+        'timezone': time.strftime('%Z'),
+        'ano': agora.year,
+        'mes': agora.month,
+        'dia': agora.day,
+        'hora': agora.hour,
+        'minuto': agora.minute,
+        'segundo': agora.second,
+        'microsegundo': agora.microsecond,
+    }
+
+
+def op_status(estado, sessao, parametros):
+    resultado = {
+        'status': 'ATIVO',
+        'operacoes_processadas': estado.operacoes_processadas,
+        'tempo_ativo': round(time.time() - estado.inicio, 3),
+    }
+    if _verdadeiro(parametros.get('detalhado', False)):
+        resultado['sessoes_ativas'] = len(estado.sessoes)
+        resultado['versao'] = VERSAO
+        resultado['sessoes_detalhes'] = {
+            s['aluno_id']: {'nome': s['nome'], 'ip_cliente': s['ip_cliente']}
+            for s in estado.sessoes.values()
+        }
+        resultado['estatisticas_banco'] = {
+            'alunos': len(estado.historicos),
+            'registros': sum(len(h) for h in estado.historicos.values()),
+        }
+    return resultado
+
+
+def op_historico(estado, sessao, parametros):
+    try:
+        limite = int(parametros.get('limite', 10))
+    except (TypeError, ValueError):  # null, lista, texto que não é número
+        raise ErroProtocolo(f"limite inválido: {parametros.get('limite')!r}")
+    historico = estado.historicos[sessao['aluno_id']]
+    sucesso = sum(1 for r in historico if r['sucesso'])
+    total = len(historico)
+    return {
+        'aluno_id': sessao['aluno_id'],
+        'limite_solicitado': limite,
+        'total_encontrado': min(limite, total),
+        'total': total,
+        'timestamp_consulta': datetime.now().isoformat(),
+        'operacoes': historico[-limite:] if limite > 0 else [],
+        'estatisticas': {
+            'total_operacoes': total,
+            'operacoes_sucesso': sucesso,
+            'operacoes_erro': total - sucesso,
+            'taxa_sucesso': round(100 * sucesso / total, 2) if total else 0.0,
+        },
+        'timestamp': datetime.now().isoformat(),
+    }
+
+
+OPERACOES = {
+    'echo': op_echo,
+    'soma': op_soma,
+    'timestamp': op_timestamp,
+    'status': op_status,
+    'historico': op_historico,
+}
+
+
+# Protocolos: cada um transforma um quadro recebido nos bytes da resposta
+
+class ProtocoloStrings:
+    """AUTH|aluno_id=...|FIM / OP|token=...|operacao=...|FIM / LOGOUT|token=...|FIM
+
+    Campos escapados (comum/texto.py) só para quem pediu escapes=1 no AUTH;
+    os demais recebem o protocolo sem escape, como o do servidor remoto.
+    """
+
+    Decodificador = DecodificadorLinhas
+
+    def __init__(self):
+        self.com_escapes = set()  # tokens que combinaram escapes no AUTH
+
+    def responder(self, estado, quadro, ip):
+        linha = quadro.decode('utf-8').strip()
+        campos = analisar(linha)
+        escapes = campos.get('token') in self.com_escapes
+        if escapes and '\\' in linha:
+            campos = analisar(linha, escapes=True)
+        tipo = campos.pop('tipo')
+        try:
+            if tipo == 'AUTH':
+                dados = estado.autenticar(campos.get('aluno_id'), ip)
+                if campos.get('escapes') == '1':
+                    self.com_escapes.add(dados['token'])
+                    dados['escapes'] = '1'
+            elif tipo == 'OP':
+                token = campos.pop('token', None)
+                operacao = campos.pop('operacao', '')
+                dados = estado.executar(token, operacao, campos)
+            elif tipo == 'LOGOUT':
+                dados = estado.logout(campos.get('token'))
+                self.com_escapes.discard(campos.get('token'))
+            else:
+                raise ErroProtocolo(f"Comando desconhecido: {tipo}")
+        except ErroProtocolo as e:
+            return (montar('ERROR', {'msg': e}, escapes) + '\n').encode('utf-8')
+        return (montar('OK', dados, escapes) + '\n').encode('utf-8')
+
+
+class ProtocoloJSON:
+    """{"tipo": "autenticar" | "operacao" | "logout", ...}"""
+
+    Decodificador = DecodificadorLinhas
+
+    def responder(self, estado, quadro, ip):
+        agora = datetime.now().isoformat()
+        try:
+            try:
+                requisicao = json.loads(quadro)
+            except ValueError:
+                raise ErroProtocolo("JSON inválido")
+            if not isinstance(requisicao, dict):
+                raise ErroProtocolo("Requisição precisa ser um objeto JSON")
+            tipo = requisicao.get('tipo')
+            if tipo == 'autenticar':
+                dados = estado.autenticar(requisicao.get('aluno_id'), ip)
+                resposta = {
+                    'sucesso': True,
+                    'token': dados.pop('token'),
+                    'dados_aluno': dados,
+                    'timestamp': agora,
+                }
+            elif tipo == 'operacao':
+                resposta = self.operacao(estado, requisicao, requisicao.get('token'), agora)
+            elif tipo == 'lote':
+                # Extensão local: uma resposta por operação, erros inclusive
+                token = requisicao.get('token')
+                operacoes = requisicao.get('operacoes') or []
+                if not isinstance(operacoes, list) or not all(isinstance(op, dict) for op in operacoes):
+                    raise ErroProtocolo("'operacoes' precisa ser uma lista de objetos")
+                resposta = {
+                    'sucesso': True,
+                    'respostas': [self.operacao(estado, op, op.get('token', token), agora)
+                                  for op in operacoes],
+                    'timestamp': agora,
+                }
+            elif tipo == 'logout':
+                resposta = {'sucesso': True, **estado.logout(requisicao.get('token')), 'timestamp': agora}
+            else:
+                raise ErroProtocolo(f"Tipo desconhecido: {tipo}")
+        except ErroProtocolo as e:
+            resposta = {'sucesso': False, 'erro': str(e), 'timestamp': agora}
+        return (json.dumps(resposta, ensure_ascii=False) + '\n').encode('utf-8')
+
+    def operacao(self, estado, requisicao, token, agora):
+        try:
+            parametros = requisicao.get('parametros') or {}
+            if not isinstance(parametros, dict):
+                raise ErroProtocolo("'parametros' precisa ser um objeto")
+            resultado = estado.executar(token, requisicao.get('operacao'), parametros)
+        except ErroProtocolo as e:
+            return {'sucesso': False, 'erro': str(e), 'timestamp': agora}
+        return {'sucesso': True, 'resultado': resultado, 'timestamp': agora}
+
+
+# Campo de RespostaOk.resultado usado por cada operação no modo tipado
+RESULTADOS_TIPADOS = {
+    'echo': 'echo',
+    'soma': 'soma',
+    'timestamp': 'resultado_timestamp',
+    'status': 'status',
+    'historico': 'historico',
+}
+
+
+def preencher(mensagem, dados):
+    """Copia um dict de resultado para a mensagem tipada, campo a campo"""
+    for campo in mensagem.DESCRIPTOR.fields:
+        valor = dados.get(campo.name)
+        if valor is None:
+            continue
+        alvo = getattr(mensagem, campo.name)
+        if campo.message_type is not None and campo.message_type.GetOptions().map_entry:
+            texto = campo.message_type.fields_by_name['value'].type == campo.TYPE_STRING
+            for chave, item in valor.items():
+                alvo[str(chave)] = str(item) if texto else item
+        elif campo.label == campo.LABEL_REPEATED:
+            if campo.message_type is None:
+                alvo.extend(valor)
+            else:
+                for item in valor:
+                    preencher(alvo.add(), item)
+        else:
+            setattr(mensagem, campo.name, valor)
+
+
+class ProtocoloProtobuf:
+    """Requisicao/Resposta de mensagens.proto com cabeçalho de 4 bytes"""
+
+    Decodificador = DecodificadorFrames
+
+    def responder(self, estado, quadro, ip):
+        requisicao = pb.Requisicao()
+        resposta = pb.Resposta()
+        agora = datetime.now().isoformat()
+        comando = ''
+        try:
+            try:
+                requisicao.ParseFromString(quadro)
+            except Exception:
+                raise ErroProtocolo("Mensagem inválida")
+            comando = requisicao.WhichOneof('tipo') or ''
+            if comando == 'auth':
+                dados = estado.autenticar(requisicao.auth.aluno_id, ip)
+            elif comando == 'operacao':
+                self.operacao(estado, requisicao.operacao, requisicao.operacao.token, resposta, agora)
+                dados = None
+            elif comando == 'lote':
+                # Extensão local: uma Resposta por operação, erros inclusive
+                lote = requisicao.lote
+                for operacao in lote.operacoes:
+                    self.operacao(estado, operacao, operacao.token or lote.token,
+                                  resposta.lote.respostas.add(), agora)
+                dados = None
+            elif comando == 'logout':
+                dados = estado.logout(requisicao.logout.token)
+            elif comando == 'info':
+                dados = {
+                    'nome': 'Servidor local de referência',
+                    'versao': VERSAO,
+                    'operacoes_disponiveis': ','.join(OPERACOES),
+                }
+            else:
+                raise ErroProtocolo("Requisição vazia")
+            if dados is not None:
+                resposta.ok.comando = comando
+                for chave, valor in dados.items():
+                    resposta.ok.dados[chave] = str(valor)
+                resposta.ok.timestamp = agora
+        except ErroProtocolo as e:
+            resposta.erro.comando = comando
+            resposta.erro.mensagem = str(e)
+            resposta.erro.timestamp = agora
+        dados = resposta.SerializeToString()
+        return CABECALHO.pack(len(dados)) + dados
+
+    def operacao(self, estado, operacao, token, resposta, agora):
+        """Executa um ComandoOperacao e preenche a Resposta (ok ou erro)"""
+        comando = operacao.operacao
+        parametros = dict(operacao.parametros)
+        if operacao.numeros:
+            parametros['numeros'] = list(operacao.numeros)
+        try:
+            dados = estado.executar(token, comando, parametros)
+        except ErroProtocolo as e:
+            resposta.erro.comando = comando
+            resposta.erro.mensagem = str(e)
+            resposta.erro.timestamp = agora
+            return
+        resposta.ok.comando = comando
+        resposta.ok.timestamp = agora
+        campo = RESULTADOS_TIPADOS.get(comando)
+        if operacao.tipado and campo:
+            # Resultado tipado no lugar do map de strings
+            preencher(getattr(resposta.ok, campo), dados)
+        else:
+            for chave, valor in dados.items():
+                resposta.ok.dados[chave] = str(valor)
+
+
+PROTOCOLOS = {
+    'strings': ProtocoloStrings,
+    'json': ProtocoloJSON,
+    'protobuf': ProtocoloProtobuf,
+}
+
+
+class ServidorLocal:
+    """Os três servidores num único loop asyncio"""
+
+    def __init__(self, host: str = '127.0.0.1', portas: dict = None,
+                 atraso: float = 0.0, validade: float = VALIDADE_TOKEN):
+        self.host = host
+        self.portas = dict(PORTAS if portas is None else portas)
+        self.atraso = atraso  # segundos acrescentados a cada resposta
+        self.estado = Estado(validade)
+        self.servidores = {}
+        self.loop = None
+        self.thread = None
+
+    async def iniciar(self):
+        """Abre as portas; porta 0 escolhe uma livre (veja self.portas depois)"""
+        for nome, porta in self.portas.items():
+            protocolo = PROTOCOLOS[nome]()
+            servidor = await asyncio.start_server(
+                lambda r, w, p=protocolo: self.atender(r, w, p), self.host, porta)
+            self.servidores[nome] = servidor
+            self.portas[nome] = servidor.sockets[0].getsockname()[1]
+
+    async def encerrar(self):
+        """Fecha as portas e derruba as conexões ainda abertas"""
+        for servidor in self.servidores.values():
+            servidor.close()
+        atuais = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        for tarefa in atuais:
+            tarefa.cancel()
+        await asyncio.gather(*atuais, return_exceptions=True)
+        self.servidores.clear()
+
+    async def atender(self, leitor, escritor, protocolo):
+        """Atende uma conexão; respostas saem na ordem das requisições"""
+        ip = (escritor.get_extra_info('peername') or ('N/A',))[0]
+        decodificador = protocolo.Decodificador()
+        saida = None
+        if self.atraso:
+            saida = asyncio.Queue()
+            atrasador = asyncio.create_task(self._enviar_com_atraso(saida, escritor))
+        try:
+            while True:
+                dados = await leitor.read(TAMANHO_BLOCO)
+                if not dados:
+                    break
+                decodificador.buffer.alimentar(dados)
+                quadro = decodificador.extrair()
+                while quadro is not None:
+                    resposta = protocolo.responder(self.estado, quadro, ip)
+                    if saida is None:
+                        escritor.write(resposta)
+                    else:
+                        saida.put_nowait((time.monotonic() + self.atraso, resposta))
+                    quadro = decodificador.extrair()
+                await escritor.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass  # cliente caiu ou servidor encerrando
+        finally:
+            if saida is not None:
+                saida.put_nowait(None)
+                with contextlib.suppress(asyncio.CancelledError):
+                    await atrasador
+            escritor.close()
+
+    async def _enviar_com_atraso(self, saida, escritor):
+        while True:
+            item = await saida.get()
+            if item is None:
+                return
+            prazo, resposta = item
+            espera = prazo - time.monotonic()
+            if espera > 0:
+                await asyncio.sleep(espera)
+            if escritor.is_closing():
+                continue
+            escritor.write(resposta)
+
+    def iniciar_em_thread(self):
+        """Roda o servidor numa thread própria (benchmarks e testes de carga)"""
+        pronto = threading.Event()
+
+        def rodar():
+            self.loop = asyncio.new_event_loop()
+            self.loop.run_until_complete(self.iniciar())
+            pronto.set()
+            self.loop.run_forever()
+            self.loop.run_until_complete(self.encerrar())
+            self.loop.close()
+
+        self.thread = threading.Thread(target=rodar, daemon=True)
+        self.thread.start()
+        pronto.wait()
+        return self
+
+    def parar_thread(self):
+        if self.loop is not None:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join()
+            self.loop = None
+
+
+def main():
+    """Função principal"""
+    parser = argparse.ArgumentParser(description="Servidor local de referência (strings, JSON, protobuf)")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--porta-strings', type=int, default=PORTAS['strings'])
+    parser.add_argument('--porta-json', type=int, default=PORTAS['json'])
+    parser.add_argument('--porta-protobuf', type=int, default=PORTAS['protobuf'])
+    parser.add_argument('--atraso', type=float, default=0.0, help="latência artificial por resposta, em ms")
+    parser.add_argument('--validade', type=float, default=VALIDADE_TOKEN, help="validade do token, em segundos")
+    args = parser.parse_args()
+
+    servidor = ServidorLocal(
+        args.host,
+        {'strings': args.porta_strings, 'json': args.porta_json, 'protobuf': args.porta_protobuf},
+        atraso=args.atraso / 1000,
+        validade=args.validade,
+    )
+
+    async def rodar():
+        await servidor.iniciar()
+        for nome, porta in servidor.portas.items():
+            print(f"Servidor {nome} em {args.host}:{porta}")
+        await asyncio.Event().wait()
+
+    try:
+        asyncio.run(rodar())
+    except KeyboardInterrupt:
+        print("\nEncerrado")
+
+
+if __name__ == "__main__":
+    main()